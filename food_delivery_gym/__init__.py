@@ -10,8 +10,18 @@ def get_scenario_path(filename: str) -> str:
     return str(files("food_delivery_gym.main.scenarios").joinpath(filename))
 
 
-def _make_env(scenario_json_file_path: str, reward_objective: int) -> FoodDeliveryGymEnv:
-    return FoodDeliveryGymEnv(scenario_json_file_path=scenario_json_file_path, reward_objective=reward_objective)
+def _make_env(
+    scenario_json_file_path: str,
+    reward_objective: int,
+    flat_observation: bool = False,
+    eta_estimator: str = "sampled",
+) -> FoodDeliveryGymEnv:
+    return FoodDeliveryGymEnv(
+        scenario_json_file_path=scenario_json_file_path,
+        reward_objective=reward_objective,
+        flat_observation=flat_observation,
+        eta_estimator=eta_estimator,
+    )
 
 
 SCENARIOS = get_all_scenarios()
@@ -6,13 +6,17 @@ from simpy.core import SimTime
 from simpy.events import ProcessGenerator, Timeout
 
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
-from food_delivery_gym.main.utils.random_manager import RandomManager
+from food_delivery_gym.main.utils.random_stream import RandomStream
 
 class Actor(ABC):
 
+    RANDOM_STREAM = RandomStream.SETUP # Fluxo aleatório da simulação usado pelo ator
+
     def __init__(self, environment: FoodDeliverySimpyEnv) -> None:
         self._environment = environment
-        self.rng = RandomManager().get_random_instance()
+        self.rng = environment.random_streams.get(self.RANDOM_STREAM)
+        # Sorteios escalares frequentes (tempos e esperas) saem de blocos pré-sorteados do mesmo fluxo
+        self.sampler = environment.random_streams.sampler(self.RANDOM_STREAM)
 
     def publish_event(self, event) -> None:
         self._environment.add_event(event)
@@ -1,13 +1,28 @@
+from typing import Iterable
+
 from food_delivery_gym.main.base.types import Number
 
 
 class Dimensions:
+    __slots__ = ("length", "height", "width", "weight")
+
     def __init__(self, length: Number, height: Number, width: Number, weight: Number):
         self.length = length
         self.height = height
         self.width = width
         self.weight = weight
 
+    @classmethod
+    def sum(cls, dimensions_list: Iterable['Dimensions']) -> 'Dimensions':
+        # Soma em acumuladores locais: cria um único objeto, em vez de um por adição como em __add__
+        length = height = width = weight = 0
+        for dimensions in dimensions_list:
+            length += dimensions.length
+            height += dimensions.height
+            width += dimensions.width
+            weight += dimensions.weight
+        return cls(length, height, width, weight)
+
     def __lt__(self, other: 'Dimensions'):
         return (
                 self.length < other.length and
@@ -40,6 +55,14 @@ class Dimensions:
             self.weight + other.weight
         )
 
+    def __sub__(self, other: 'Dimensions'):
+        return Dimensions(
+            self.length - other.length,
+            self.height - other.height,
+            self.width - other.width,
+            self.weight - other.weight
+        )
+
     @property
     def volume(self) -> Number:
         return self.length * self.height * self.width
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from food_delivery_gym.main.utils.random_manager import RandomManager
 
 def random_point_in_radius(centroid, inf_limit, sup_limit, rng_generator: RandomManager):
@@ -36,3 +37,25 @@ def random_point_outside_circle(centroid, radius, limit, rng_generator: RandomMa
         x, y = random_point_in_radius(centroid, radius + 1, limit, rng_generator)
         if 0 <= x <= limit and 0 <= y <= limit:
             return x, y
+
+
+def points_in_gauss_circle(centroids, radii, limit, rng_generator: np.random.Generator):
+    #   Versão vetorizada de point_in_gauss_circle: um ponto por linha de centroids (array N x 2), cada um com o seu
+    # raio. Os sorteios são feitos em lote e só os pontos que caíram fora do mapa são sorteados de novo
+    centroids = np.asarray(centroids, dtype=float)
+    radii = np.asarray(radii, dtype=float)
+    points = np.empty((len(centroids), 2), dtype=np.int64)
+    pending = np.arange(len(centroids))
+
+    while len(pending) > 0:
+        theta = rng_generator.uniform(0, 2 * math.pi, size=len(pending))
+        r = np.abs(rng_generator.normal(loc=0, scale=radii[pending]))  # gauss
+        # np.rint arredonda para o par mais próximo, como o round embutido
+        x = np.rint(centroids[pending, 0] + r * np.cos(theta))
+        y = np.rint(centroids[pending, 1] + r * np.sin(theta))
+        inside = (0 <= x) & (x <= limit) & (0 <= y) & (y <= limit)
+        points[pending[inside], 0] = x[inside]
+        points[pending[inside], 1] = y[inside]
+        pending = pending[~inside]
+
+    return points
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
 
 from food_delivery_gym.main.base.types import Number
 from food_delivery_gym.main.driver.driver import Driver
@@ -11,3 +14,7 @@ class CostFunction(ABC):
     @abstractmethod
     def cost(self, map: Map, driver: Driver, route_segment: RouteSegment) -> Number:
         pass
+
+    def cost_many(self, map: Map, drivers: List[Driver], route_segment: RouteSegment) -> np.ndarray:
+        # Custo do segmento para cada motorista da lista; funções de custo podem sobrescrever com uma versão vetorizada
+        return np.array([self.cost(map, driver, route_segment) for driver in drivers], dtype=np.float64)
@@ -1,3 +1,7 @@
+from typing import List
+
+import numpy as np
+
 from food_delivery_gym.main.cost.cost_function import CostFunction
 from food_delivery_gym.main.driver.driver import Driver
 from food_delivery_gym.main.map.map import Map
@@ -38,7 +42,7 @@ class MarginalRouteCostFunction(CostFunction):
     def marginal_delay(self, map: Map, driver: Driver, route_segment: RouteSegment) -> float:
         # Custo da nova rota a partir da última posição válida do motorista
         new_segment_delay = map.estimated_time(
-            driver.get_last_valid_coordinate(),
+            driver.get_summary().last_valid_coordinate,
             route_segment.coordinate,
             driver.movement_rate
         )
@@ -48,7 +52,7 @@ class MarginalRouteCostFunction(CostFunction):
     def marginal_distance(self, map: Map, driver: Driver, route_segment: RouteSegment) -> float:
         # Distância incremental a partir da última posição válida do motorista
         new_segment_distance = map.distance(
-            driver.get_last_valid_coordinate(),
+            driver.get_summary().last_valid_coordinate,
             route_segment.coordinate
         )
 
@@ -60,4 +64,17 @@ class MarginalRouteCostFunction(CostFunction):
         elif self.objective == 2:
             return self.marginal_distance(map, driver, route_segment) + self.penalty(route_segment)
         else:
-            raise ValueError("Objetivo inválido. Use 1 para delay marginal ou 2 para distância marginal.")
\ No newline at end of file
+            raise ValueError("Objetivo inválido. Use 1 para delay marginal ou 2 para distância marginal.")
+
+    def cost_many(self, map: Map, drivers: List[Driver], route_segment: RouteSegment) -> np.ndarray:
+        if self.objective not in (1, 2):
+            raise ValueError("Objetivo inválido. Use 1 para delay marginal ou 2 para distância marginal.")
+
+        coordinates = np.array([driver.get_summary().last_valid_coordinate for driver in drivers])
+
+        if self.objective == 1:
+            marginal = map.estimated_time_many(coordinates, route_segment.coordinate, [driver.movement_rate for driver in drivers])
+        else:
+            marginal = map.distance_many(coordinates, route_segment.coordinate)
+
+        return marginal.astype(np.float64) + self.penalty(route_segment)
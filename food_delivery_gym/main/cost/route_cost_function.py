@@ -1,4 +1,8 @@
 
+from typing import List
+
+import numpy as np
+
 from food_delivery_gym.main.base.types import Number
 from food_delivery_gym.main.cost.cost_function import CostFunction
 from food_delivery_gym.main.driver.driver import Driver
@@ -41,7 +45,7 @@ class RouteCostFunction(CostFunction):
         current_delay = 0
 
         if driver.current_route_segment is not None:
-            current_delay = driver.estimate_total_busy_time()
+            current_delay = driver.get_summary().busy_time
 
         new_segment_delay = map.estimated_time(
             driver.coordinate,
@@ -55,7 +59,7 @@ class RouteCostFunction(CostFunction):
         current_distance = 0
 
         if driver.current_route_segment is not None:
-            current_distance = driver.calculate_total_distance_to_travel()
+            current_distance = driver.get_summary().distance_to_travel
 
         new_segment_distance = map.distance(
             driver.coordinate,
@@ -71,3 +75,19 @@ class RouteCostFunction(CostFunction):
             return self.distance(map, driver, route_segment) + self.penalty(route_segment)
         else:
             raise ValueError("Objetivo inválido. Use 1 para delay ou 2 para distância.")
+
+    def cost_many(self, map: Map, drivers: List[Driver], route_segment: RouteSegment) -> np.ndarray:
+        if self.objective not in (1, 2):
+            raise ValueError("Objetivo inválido. Use 1 para delay ou 2 para distância.")
+
+        coordinates = np.array([driver.coordinate for driver in drivers])
+        summaries = [driver.get_summary() if driver.current_route_segment is not None else None for driver in drivers]
+
+        if self.objective == 1:
+            current = np.array([summary.busy_time if summary is not None else 0 for summary in summaries], dtype=np.float64)
+            new_segment = map.estimated_time_many(coordinates, route_segment.coordinate, [driver.movement_rate for driver in drivers])
+        else:
+            current = np.array([summary.distance_to_travel if summary is not None else 0 for summary in summaries], dtype=np.float64)
+            new_segment = map.distance_many(coordinates, route_segment.coordinate)
+
+        return current + new_segment + self.penalty(route_segment)
@@ -10,9 +10,17 @@ from food_delivery_gym.main.order.order import Order
 from food_delivery_gym.main.order.order_status import OrderStatus
 from food_delivery_gym.main.customer.custumer_status import CustumerStatus
 from food_delivery_gym.main.establishment.establishment import Establishment
+from food_delivery_gym.main.utils.random_stream import RandomStream
+from food_delivery_gym.main.utils.random_utils import expected_integers
 
 
 class Customer(MapActor):
+
+    RANDOM_STREAM = RandomStream.CUSTOMER_DELAYS
+
+    # Intervalo [mínimo, máximo) do tempo que o cliente leva para receber o pedido
+    TIME_TO_RECEIVE_ORDER_RANGE = (2, 10)
+
     def __init__(self, id: Number, environment: FoodDeliverySimpyEnv, coordinate: Coordinate, available: bool, single_order: bool = False) -> None:
         self.customer_id = id
         self.single_order = single_order
@@ -45,7 +53,10 @@ class Customer(MapActor):
         order.update_status(OrderStatus.RECEIVED)
 
     def time_to_receive_order(self):
-        return self.rng.integers(2, 10)
+        return self.sampler.integers(*self.TIME_TO_RECEIVE_ORDER_RANGE)
+
+    def expected_time_to_receive_order(self) -> float:
+        return expected_integers(*self.TIME_TO_RECEIVE_ORDER_RANGE)
 
     def get_coordinate(self) -> Coordinate:
         return self.coordinate
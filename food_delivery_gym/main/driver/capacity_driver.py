@@ -40,7 +40,7 @@ class CapacityDriver(Driver):
         )
     
     def receive_route_requests(self, route: Route) -> None:
-        self.route_requests.append(route)
+        self.enqueue_route_request(route)
 
         order = route.get_current_order()
 
@@ -64,6 +64,7 @@ class CapacityDriver(Driver):
     
     def accept_route(self, route: Route) -> None:
         self.orders_list.append(route.get_current_order())
+        self.sync_fleet_state()
 
         # Incrementa rotas corretamente atribuídas quando o motorista aceita
         self.environment.state.increment_assigned_routes()
@@ -1,13 +1,16 @@
+import math
 from collections import deque
 from typing import Optional, List
 
-from simpy.events import ProcessGenerator
+from simpy.events import Event, ProcessGenerator
 
 from food_delivery_gym.main.actors.map_actor import MapActor
 from food_delivery_gym.main.base.dimensions import Dimensions
 from food_delivery_gym.main.base.types import Coordinate, Number
 from food_delivery_gym.main.driver.capacity import Capacity
+from food_delivery_gym.main.driver.driver_fleet_state import DriverFleetState
 from food_delivery_gym.main.driver.driver_status import DriverStatus
+from food_delivery_gym.main.driver.driver_summary import DriverSummary
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.events.driver_accepted_delivery import DriverAcceptedDelivery
 from food_delivery_gym.main.events.driver_accepted_route import DriverAcceptedRoute
@@ -25,9 +28,18 @@ from food_delivery_gym.main.order.order import Order
 from food_delivery_gym.main.order.order_status import OrderStatus
 from food_delivery_gym.main.route.route import Route
 from food_delivery_gym.main.route.route_segment import RouteSegment
+from food_delivery_gym.main.utils.random_stream import RandomStream
+from food_delivery_gym.main.utils.random_utils import expected_integers
 
 
 class Driver(MapActor):
+
+    RANDOM_STREAM = RandomStream.DRIVER_DELAYS
+
+    # Intervalos [mínimo, máximo) das esperas sorteadas pelo motorista entre as etapas da entrega
+    TIME_BETWEEN_ACCEPT_AND_START_PICKING_UP_RANGE = (0, 3)
+    TIME_BETWEEN_PICKED_UP_AND_START_DELIVERY_RANGE = (0, 3)
+
     def __init__(
             self,
             id: Number,
@@ -42,6 +54,15 @@ class Driver(MapActor):
         
         self.driver_id = id
 
+        # Trecho de deslocamento em andamento: trajeto e distâncias acumuladas por minuto, calculados em move_to
+        self._leg_path: Optional[List[Coordinate]] = None
+        self._leg_distances: Optional[List[Number]] = None
+        self._leg_start_time: Number = 0
+
+        # Buffers da frota (struct-of-arrays) onde o motorista grava seus campos; definidos ao ser registrado no estado
+        self.fleet_state: Optional[DriverFleetState] = None
+        self.fleet_index: Optional[int] = None
+
         super().__init__(environment, coordinate, available)
 
         self.color = color
@@ -53,6 +74,8 @@ class Driver(MapActor):
         self.current_route: Optional[Route] = None
         self.current_route_segment: Optional[RouteSegment] = None
         self.route_requests: deque[Route] = deque()
+        # Evento que acorda o processo ocioso de process_route_requests quando chega uma nova requisição
+        self.route_request_signal: Optional[Event] = None
 
         # Variável para retornar a recompensa do objetivo 5: 
         # Minimizar o tempo de entrega a partir da expectativa de tempo gasto com a entrega ao final do episódio 
@@ -75,6 +98,17 @@ class Driver(MapActor):
         self.orders_delivered: Number = 0
         self.idle_time: Number = 0
         self.time_waiting_for_order: Number = 0
+        #   Estado observado pelas estatísticas e o valor de environment.statistics_ticks em que ele começou. Os
+        # intervalos são somados em update_statistics_state quando o estado muda
+        self.is_idle_for_statistics: bool = not self.is_active()
+        self.idle_since_tick: int = self.environment.statistics_ticks
+        self.is_waiting_for_statistics: bool = self.status == DriverStatus.PICKING_UP_WAITING
+        self.waiting_since_tick: int = self.environment.statistics_ticks
+
+        #   Resumo em cache para a decisão corrente (ver get_summary). A versão do motorista cobre as alterações feitas
+        # fora do laço da simulação, como uma nova requisição de rota recebida do agente
+        self.summary_version: int = 0
+        self._summary: Optional[DriverSummary] = None
 
         self.process(self.process_route_requests())
 
@@ -86,20 +120,44 @@ class Driver(MapActor):
         return {
             "orders_delivered":       self.orders_delivered,
             "time_spent_on_delivery": self.get_time_spent_on_delivery(),
-            "idle_time":              self.idle_time,
-            "time_waiting_for_order": self.time_waiting_for_order,
+            "idle_time":              self.get_idle_time(),
+            "time_waiting_for_order": self.get_time_waiting_for_order(),
             "total_distance":         self.total_distance,
         }
  
-    def update_statistics_variables(self) -> None:
-        """Chamado a cada passo de tempo pelo FoodDeliverySimpyEnv."""
-        if not self.is_active():
-            self.idle_time += 1
-        if self.status == DriverStatus.PICKING_UP_WAITING:
-            self.time_waiting_for_order += 1
+    def update_statistics_state(self) -> None:
+        """
+        Chamado sempre que o motorista pode ter mudado entre ocioso e ativo ou entrado/saído da espera pelo pedido.
+        Soma ao contador o número de passos de tempo do estado que terminou.
+        """
+        ticks = self.environment.statistics_ticks
+
+        is_idle = not self.is_active()
+        if is_idle != self.is_idle_for_statistics:
+            if self.is_idle_for_statistics:
+                self.idle_time += ticks - self.idle_since_tick
+            self.is_idle_for_statistics = is_idle
+            self.idle_since_tick = ticks
+
+        is_waiting = self.status == DriverStatus.PICKING_UP_WAITING
+        if is_waiting != self.is_waiting_for_statistics:
+            if self.is_waiting_for_statistics:
+                self.time_waiting_for_order += ticks - self.waiting_since_tick
+            self.is_waiting_for_statistics = is_waiting
+            self.waiting_since_tick = ticks
+
+    def get_idle_time(self) -> Number:
+        if self.is_idle_for_statistics:
+            return self.idle_time + self.environment.statistics_ticks - self.idle_since_tick
+        return self.idle_time
+
+    def get_time_waiting_for_order(self) -> Number:
+        if self.is_waiting_for_statistics:
+            return self.time_waiting_for_order + self.environment.statistics_ticks - self.waiting_since_tick
+        return self.time_waiting_for_order
 
     def receive_route_requests(self, route: Route) -> None:
-        self.route_requests.append(route)
+        self.enqueue_route_request(route)
 
         order = route.get_current_order()
 
@@ -114,14 +172,37 @@ class Driver(MapActor):
 
         self.environment.state.increment_assigned_routes()
 
+    def enqueue_route_request(self, route: Route) -> None:
+        self.route_requests.append(route)
+        self.invalidate_summary()
+        self.sync_fleet_state()
+        self.update_statistics_state()
+        if self.is_waiting_route_requests():
+            self.environment.wake_idle_driver(self)
+
+    def is_waiting_route_requests(self) -> bool:
+        return self.route_request_signal is not None and not self.route_request_signal.triggered
+
     def process_route_requests(self) -> ProcessGenerator:
         while True:
             if self.route_requests:
                 route = self.route_requests.popleft()
+                self.sync_fleet_state()
                 self.process_route_request(route)
+                self.update_statistics_state()
                 yield self.timeout(self.time_to_accept_or_reject_route())
             else:
-                yield self.timeout(1)
+                # Motorista ocioso não agenda eventos: dorme até receive_route_requests disparar o sinal
+                idle_since = self.now
+                self.route_request_signal = self.environment.event()
+                yield self.route_request_signal
+                self.route_request_signal = None
+
+                #   Mantém a grade de verificação de 1 em 1 minuto do antigo laço de polling, para que a
+                # requisição seja processada no mesmo instante em que seria antes
+                next_check = idle_since + max(1, math.ceil(self.now - idle_since))
+                if next_check > self.now:
+                    yield self.timeout(next_check - self.now)
 
     def process_route_request(self, route: Route) -> None:
         accept = self.accept_route_condition(route)
@@ -129,6 +210,7 @@ class Driver(MapActor):
 
     def accept_route(self, route: Route) -> None:
         self.orders_list.append(route.get_current_order())
+        self.sync_fleet_state()
 
         route.get_current_order().driver_accepted()
 
@@ -183,6 +265,7 @@ class Driver(MapActor):
         else:
             self.current_route = None
             self.current_route_segment = None
+            self.update_statistics_state()
 
     def reject_route(self, route: Route) -> None:
         route.get_current_order().driver_rejected()
@@ -212,6 +295,7 @@ class Driver(MapActor):
 
     def picking_up(self, order: Order) -> ProcessGenerator:
         self.status = DriverStatus.PICKING_UP
+        self.update_statistics_state()
 
         order.driver_picking_up()
 
@@ -234,9 +318,11 @@ class Driver(MapActor):
             time=self.now
         ))
 
-        while not order.isReady:
+        if not order.isReady:
+            # Dorme até o estabelecimento finalizar o pedido, em vez de verificar a cada minuto
             self.status = DriverStatus.PICKING_UP_WAITING
-            yield self.timeout(1)
+            self.update_statistics_state()
+            yield order.get_ready_event(self.environment)
 
         self.picked_up(order)
 
@@ -257,6 +343,7 @@ class Driver(MapActor):
 
     def delivering(self, order: Order) -> ProcessGenerator:
         self.status = DriverStatus.DELIVERING
+        self.update_statistics_state()
         order.driver_delivering()
         self.publish_event(DriverDeliveringOrder(
             order=order,
@@ -295,7 +382,7 @@ class Driver(MapActor):
         self.status = DriverStatus.AVAILABLE
         order.delivered(self.now)
         self.orders_delivered += 1
-        self.environment.state.add_order_delivered(order)
+        self.environment.add_order_delivered(order)
         
         # Remove o pedido da lista de pedidos do motorista e soma a penalidade do tempo gasto para entrega
         for i, o in enumerate(self.orders_list):
@@ -304,6 +391,7 @@ class Driver(MapActor):
                 self.sum_penalty_for_time_spent += self._calculate_order_penalty(order, start_time)
                 del self.orders_list[i]
                 break
+        self.sync_fleet_state()
 
         # TODO: Logs
         # print(f"Driver {self.driver_id} entregou o pedido ao cliente no tempo {self.now}")
@@ -325,15 +413,110 @@ class Driver(MapActor):
             return self.now - start_time
 
     def move_to(self, destination: Coordinate) -> ProcessGenerator:
-        while self.coordinate != destination:
-            old_coordinate = self.coordinate
-            self.coordinate = self.environment.map.move(
-                origin=self.coordinate,
+        #   O trajeto do trecho é calculado uma única vez com a regra de passo do mapa e o motorista agenda apenas o
+        # evento de chegada. As posições intermediárias são obtidas sob demanda a partir do tempo decorrido
+        path, distances = self.plan_leg(destination)
+        if not path:
+            return
+
+        self._leg_path = path
+        self._leg_distances = distances
+        self._leg_start_time = self.now
+        if self.fleet_state is not None:
+            self.fleet_state.set_moving(self.fleet_index, self, True)
+
+        #   O último minuto é agendado à parte, a partir do instante anterior à chegada, como o deslocamento minuto a
+        # minuto fazia. Assim a chegada entra na fila do SimPy no mesmo ponto em relação aos eventos desse instante
+        if len(path) > 1:
+            yield self.timeout(len(path) - 1)
+        yield self.timeout(1)
+
+        self._leg_path = None
+        self._leg_distances = None
+        self._total_distance += distances[-1]
+        self.coordinate = destination
+        if self.fleet_state is not None:
+            self.fleet_state.set_moving(self.fleet_index, self, False)
+
+    def plan_leg(self, destination: Coordinate) -> tuple[List[Coordinate], List[Number]]:
+        """
+        Calcula o trajeto minuto a minuto até o destino e a distância acumulada após cada minuto.
+
+        Reproduz exatamente os passos de Map.move, de modo que a posição no minuto k do trecho é a mesma
+        que seria obtida movendo o motorista a cada minuto.
+        """
+        path: List[Coordinate] = []
+        distances: List[Number] = []
+        position = self._coordinate
+        distance = 0
+        while position != destination:
+            next_position = self.environment.map.move(
+                origin=position,
                 destination=destination,
                 rate=self.movement_rate
             )
-            self.total_distance += self.environment.map.distance(old_coordinate, self.coordinate)
-            yield self.timeout(1)
+            distance += self.environment.map.distance(position, next_position)
+            path.append(next_position)
+            distances.append(distance)
+            position = next_position
+        return path, distances
+
+    def _leg_steps_done(self) -> int:
+        #   Assim como no deslocamento minuto a minuto, o primeiro passo é dado no instante em que o trecho começa. Nos
+        # minutos seguintes, quem consulta a posição no instante t0 + k enxerga o motorista antes do passo daquele minuto
+        elapsed = self.now - self._leg_start_time
+        return min(len(self._leg_path), max(1, math.ceil(elapsed)))
+
+    @property
+    def coordinate(self) -> Coordinate:
+        if self._leg_path is None:
+            return self._coordinate
+        return self._leg_path[self._leg_steps_done() - 1]
+
+    @coordinate.setter
+    def coordinate(self, coordinate: Coordinate) -> None:
+        self._coordinate = coordinate
+        if self.fleet_state is not None:
+            self.fleet_state.update_coordinate(self.fleet_index, coordinate)
+            if not self.orders_list:
+                self.fleet_state.update_last_valid_coordinate(self.fleet_index, coordinate)
+
+    @property
+    def status(self) -> DriverStatus:
+        return self._status
+
+    @status.setter
+    def status(self, status: DriverStatus) -> None:
+        self._status = status
+        self.sync_fleet_state()
+
+    def attach_fleet_state(self, fleet_state: DriverFleetState, index: int) -> None:
+        self.fleet_state = fleet_state
+        self.fleet_index = index
+        fleet_state.update_coordinate(index, self.coordinate)
+        self.sync_fleet_state()
+        if self._leg_path is not None:
+            fleet_state.set_moving(index, self, True)
+
+    def sync_fleet_state(self) -> None:
+        # Chamado sempre que o status, a lista de pedidos ou as requisições de rota mudam
+        if self.fleet_state is not None:
+            self.fleet_state.update_status_and_queue(
+                self.fleet_index,
+                self.get_status_for_observation().value,
+                self.get_number_of_orders_in_list(),
+            )
+            self.fleet_state.update_last_valid_coordinate(self.fleet_index, self.get_last_valid_coordinate())
+
+    @property
+    def total_distance(self) -> Number:
+        if self._leg_path is None:
+            return self._total_distance
+        return self._total_distance + self._leg_distances[self._leg_steps_done() - 1]
+
+    @total_distance.setter
+    def total_distance(self, total_distance: Number) -> None:
+        self._total_distance = total_distance
 
     def is_active(self) -> bool:
         return self.current_route is not None or self.current_route_segment is not None or len(self.route_requests) > 0
@@ -345,7 +528,7 @@ class Driver(MapActor):
         return self.available
 
     def estimate_time_to_driver_receive_order(self) -> int:
-        return self.rng.integers(1, 5)
+        return self.sampler.integers(1, 5)
 
     def time_to_accept_or_reject_route(self) -> int:
         # Retirando incerteza
@@ -353,13 +536,19 @@ class Driver(MapActor):
         return 1
 
     def time_between_accept_and_start_picking_up(self) -> int:
-        return self.rng.integers(0, 3)
+        return self.sampler.integers(*self.TIME_BETWEEN_ACCEPT_AND_START_PICKING_UP_RANGE)
+
+    def expected_time_between_accept_and_start_picking_up(self) -> float:
+        return expected_integers(*self.TIME_BETWEEN_ACCEPT_AND_START_PICKING_UP_RANGE)
 
     def time_to_picking_up_order(self, order: Order):
         return self.environment.map.estimated_time(self.coordinate, order.establishment.coordinate, self.movement_rate)
 
     def time_between_picked_up_and_start_delivery(self) -> int:
-        return self.rng.integers(0, 3)
+        return self.sampler.integers(*self.TIME_BETWEEN_PICKED_UP_AND_START_DELIVERY_RANGE)
+
+    def expected_time_between_picked_up_and_start_delivery(self) -> float:
+        return expected_integers(*self.TIME_BETWEEN_PICKED_UP_AND_START_DELIVERY_RANGE)
 
     def time_to_deliver_order(self, order: Order) -> int:
         establishment_coordinates = order.establishment.coordinate
@@ -437,13 +626,27 @@ class Driver(MapActor):
             return 0
 
         estimated_time = self.time_between_accept_and_start_picking_up()
-        estimated_time += self.environment.map.estimated_time(self.get_last_valid_coordinate(), nextOrder.establishment.coordinate, self.movement_rate)
+        estimated_time += self.environment.map.estimated_time(self.get_summary().last_valid_coordinate, nextOrder.establishment.coordinate, self.movement_rate)
         estimated_time += self.time_between_picked_up_and_start_delivery()
         estimated_time += self.environment.map.estimated_time(nextOrder.establishment.coordinate, nextOrder.customer.coordinate, self.movement_rate)
         estimated_time += self.estimate_time_to_costumer_receive_order(nextOrder)
         
         return estimated_time
 
+    def expected_time_to_complete_next_order(self, nextOrder: Order) -> Number:
+        # Versão determinística de estimate_time_to_complete_next_order: as esperas sorteadas são trocadas pelos seus
+        # valores esperados, sem consumir o gerador de números aleatórios
+        if nextOrder == None:
+            return 0
+
+        return (
+            self.expected_time_between_accept_and_start_picking_up()
+            + self.environment.map.estimated_time(self.get_summary().last_valid_coordinate, nextOrder.establishment.coordinate, self.movement_rate)
+            + self.expected_time_between_picked_up_and_start_delivery()
+            + self.environment.map.estimated_time(nextOrder.establishment.coordinate, nextOrder.customer.coordinate, self.movement_rate)
+            + nextOrder.customer.expected_time_to_receive_order()
+        )
+
     def get_and_update_distance_traveled(self):
         distance_traveled = self.total_distance - self.last_total_distance
         self.last_total_distance = self.total_distance
@@ -451,15 +654,23 @@ class Driver(MapActor):
 
     def get_penality_for_time_spent_for_delivery(self) -> Number:
         total_penalty = self.sum_penalty_for_time_spent
+        now = self.now
+        last_time_check = self.last_time_check
+        weighted = self.reward_objective in [9, 10]
 
-        total_orders_list = self.orders_list + [route.get_current_order() for route in self.route_requests]
+        #   Pedidos da lista e, em seguida, o pedido atual de cada requisição de rota, somados sempre nessa ordem (os
+        # tempos são float, então a ordem das somas importa), sem montar uma lista nova a cada passo.
+        #   Considera o tempo de início como o maior entre o momento de alocação do driver e o último tempo de verificação
+        for order in self.orders_list:
+            time_count_start = max(order.time_that_driver_was_allocated, last_time_check)
+            total_penalty += self._calculate_order_penalty(order, time_count_start) if weighted else now - time_count_start
 
-        for order in total_orders_list:
-            # Considera o tempo de início como o maior entre o momento de alocação do driver e o último tempo de verificação
-            time_count_start = max(order.time_that_driver_was_allocated, self.last_time_check)
-            total_penalty += self._calculate_order_penalty(order, time_count_start)
+        for route in self.route_requests:
+            order = route.get_current_order()
+            time_count_start = max(order.time_that_driver_was_allocated, last_time_check)
+            total_penalty += self._calculate_order_penalty(order, time_count_start) if weighted else now - time_count_start
 
-        self.last_time_check = self.now
+        self.last_time_check = now
         self.sum_penalty_for_time_spent = 0
         self.total_penalty_for_time_spent += total_penalty
         return total_penalty
@@ -485,6 +696,19 @@ class Driver(MapActor):
         penalty = (self.now - self.last_time_check) * len(self.orders_list)
         return penalty
     
+    def invalidate_summary(self) -> None:
+        self.summary_version += 1
+
+    def get_summary(self) -> DriverSummary:
+        """
+        Resumo do motorista (tempo ocupado, distância a percorrer, última coordenada válida e tamanho da fila) para a
+        decisão corrente. Qualquer evento processado pela simulação ou alteração da versão do motorista invalida o cache.
+        """
+        key = (self.now, self.environment.simulation_version, self.summary_version)
+        if self._summary is None or self._summary.key != key:
+            self._summary = DriverSummary(self, key)
+        return self._summary
+
     def get_last_valid_coordinate(self) -> Coordinate:
         if len(self.orders_list) > 0:
             return self.orders_list[-1].customer.coordinate
@@ -492,13 +716,13 @@ class Driver(MapActor):
             return self.coordinate
     
     def update_expected_delivery_time_reward(self) -> None:
-        self.sum_expected_delivery_time_reward += self.estimate_total_busy_time()
+        self.sum_expected_delivery_time_reward += self.get_summary().busy_time
     
     def get_expected_delivery_time_reward(self) -> Number:
         return self.sum_expected_delivery_time_reward
     
     def update_distance_to_be_traveled_reward(self) -> None:
-        self.sum_distance_to_be_traveled_reward += self.calculate_total_distance_to_travel()
+        self.sum_distance_to_be_traveled_reward += self.get_summary().distance_to_travel
     
     def get_distance_to_be_traveled_reward(self) -> Number:
         return self.sum_distance_to_be_traveled_reward
@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+from food_delivery_gym.main.base.types import Coordinate, Number
+
+if TYPE_CHECKING:
+    # Importação apenas para anotação de tipos (não executa em runtime)
+    from food_delivery_gym.main.driver.driver import Driver
+
+
+class DriverFleetState:
+    """
+    Campos mais lidos da frota de motoristas guardados em arrays float32 pré-alocados (struct-of-arrays).
+
+    Cada motorista registrado recebe um índice e atualiza seus campos no lugar quando eles mudam: status da
+    observação, tamanho da fila, coordenada e última coordenada válida (onde o motorista estará ao terminar os pedidos
+    que já carrega, ponto de partida para um novo pedido). A velocidade é gravada no registro. Como a posição de um motorista
+    em deslocamento depende do tempo, esses motoristas são acompanhados à parte e atualizados em
+    refresh_moving_coordinates(); o tempo estimado de ocupação depende do instante da decisão e é atualizado em
+    refresh_busy_times().
+    """
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY, dtype=np.float32):
+        self.dtype = dtype
+        self.size = 0
+        self._drivers: List["Driver"] = []
+        self._moving: Dict[int, "Driver"] = {}
+
+        self._coords = np.zeros((capacity * 2,), dtype=dtype)
+        self._last_valid_coords = np.zeros((capacity * 2,), dtype=dtype)
+        self._status = np.zeros((capacity,), dtype=dtype)
+        self._queue_size = np.zeros((capacity,), dtype=dtype)
+        self._velocity = np.zeros((capacity,), dtype=dtype)
+        self._busy_time = np.zeros((capacity,), dtype=dtype)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._status)
+
+    def _grow(self) -> None:
+        new_capacity = self.capacity * 2
+        for attr in ("_status", "_queue_size", "_velocity", "_busy_time"):
+            grown = np.zeros((new_capacity,), dtype=self.dtype)
+            grown[:self.size] = getattr(self, attr)[:self.size]
+            setattr(self, attr, grown)
+        for attr in ("_coords", "_last_valid_coords"):
+            grown = np.zeros((new_capacity * 2,), dtype=self.dtype)
+            grown[:self.size * 2] = getattr(self, attr)[:self.size * 2]
+            setattr(self, attr, grown)
+
+    def register(self, driver: "Driver") -> int:
+        if self.size == self.capacity:
+            self._grow()
+
+        index = self.size
+        self.size += 1
+        self._drivers.append(driver)
+
+        driver.attach_fleet_state(self, index)
+        self._velocity[index] = driver.get_velocity()
+        return index
+
+    # ── Atualizações feitas pelos motoristas ─────────────────────────────
+
+    def update_coordinate(self, index: int, coordinate: Coordinate) -> None:
+        self._coords[index * 2] = coordinate[0]
+        self._coords[index * 2 + 1] = coordinate[1]
+
+    def update_last_valid_coordinate(self, index: int, coordinate: Coordinate) -> None:
+        self._last_valid_coords[index * 2] = coordinate[0]
+        self._last_valid_coords[index * 2 + 1] = coordinate[1]
+
+    def update_status_and_queue(self, index: int, status_code: int, queue_size: int) -> None:
+        self._status[index] = status_code
+        self._queue_size[index] = queue_size
+
+    def set_moving(self, index: int, driver: "Driver", moving: bool) -> None:
+        if moving:
+            self._moving[index] = driver
+        else:
+            self._moving.pop(index, None)
+
+    # ── Atualizações feitas no momento da decisão ────────────────────────
+
+    def refresh_moving_coordinates(self) -> None:
+        for index, driver in self._moving.items():
+            self.update_coordinate(index, driver.coordinate)
+            self.update_last_valid_coordinate(index, driver.get_last_valid_coordinate())
+
+    def refresh_busy_times(self) -> None:
+        busy_time = self._busy_time
+        for index, driver in enumerate(self._drivers):
+            # Motoristas ociosos não têm rota nem requisições: o tempo estimado de ocupação é zero
+            busy_time[index] = driver.get_summary().busy_time if driver.is_active() else 0
+
+    # ── Leitura (views dos buffers, válidas até o próximo registro) ──────
+
+    @property
+    def coords(self) -> np.ndarray:
+        return self._coords[:self.size * 2]
+
+    @property
+    def last_valid_coords(self) -> np.ndarray:
+        return self._last_valid_coords[:self.size * 2]
+
+    @property
+    def status(self) -> np.ndarray:
+        return self._status[:self.size]
+
+    @property
+    def queue_size(self) -> np.ndarray:
+        return self._queue_size[:self.size]
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return self._velocity[:self.size]
+
+    @property
+    def busy_time(self) -> np.ndarray:
+        return self._busy_time[:self.size]
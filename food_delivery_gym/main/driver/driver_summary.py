@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING, Hashable, Optional
+
+from food_delivery_gym.main.base.types import Coordinate, Number
+
+if TYPE_CHECKING:
+    # Importação apenas para anotação de tipos (não executa em runtime)
+    from food_delivery_gym.main.driver.driver import Driver
+
+
+class DriverSummary:
+    """
+    Resumo do estado de um motorista em uma decisão do agente, compartilhado pela observação, pela recompensa e
+    pelas funções de custo. Cada valor é calculado na primeira leitura e reaproveitado pelos demais consumidores.
+
+    O resumo vale enquanto a chave (tempo da simulação, versão da simulação, versão do motorista) não mudar;
+    Driver.get_summary() cria um novo resumo quando ela muda.
+    """
+
+    __slots__ = ("_driver", "key", "_busy_time", "_distance_to_travel", "_last_valid_coordinate", "_queue_size")
+
+    def __init__(self, driver: "Driver", key: Hashable):
+        self._driver = driver
+        self.key = key
+        self._busy_time: Optional[Number] = None
+        self._distance_to_travel: Optional[Number] = None
+        self._last_valid_coordinate: Optional[Coordinate] = None
+        self._queue_size: Optional[int] = None
+
+    @property
+    def busy_time(self) -> Number:
+        if self._busy_time is None:
+            self._busy_time = self._driver.estimate_total_busy_time()
+        return self._busy_time
+
+    @property
+    def distance_to_travel(self) -> Number:
+        if self._distance_to_travel is None:
+            self._distance_to_travel = self._driver.calculate_total_distance_to_travel()
+        return self._distance_to_travel
+
+    @property
+    def last_valid_coordinate(self) -> Coordinate:
+        if self._last_valid_coordinate is None:
+            self._last_valid_coordinate = self._driver.get_last_valid_coordinate()
+        return self._last_valid_coordinate
+
+    @property
+    def queue_size(self) -> int:
+        if self._queue_size is None:
+            self._queue_size = self._driver.get_number_of_orders_in_list()
+        return self._queue_size
@@ -1,5 +1,7 @@
 from typing import List
 
+from food_delivery_gym.main.driver.driver_fleet_state import DriverFleetState
+from food_delivery_gym.main.events.event_log import EventLog
 from food_delivery_gym.main.order.order import Order
 
 
@@ -8,18 +10,29 @@ class DeliveryEnvState:
         self._customers = []
         self._establishments = []
         self._drivers = []
+        # Campos dos motoristas em arrays float32, na mesma ordem de self._drivers (lidos pela observação)
+        self.driver_fleet = DriverFleetState()
         self._orders: List[Order] = []
 
         # Orders ready for picking up
         self.orders_awaiting_delivery: List[Order] = []
         self.orders_delivered = 0
+        # Pedidos que já ficaram prontos no estabelecimento (todo pedido entregue passou por aqui)
+        self.orders_ready = 0
 
         self._last_checked_orders_delivered = 0
+        #   Pedidos entregues desde a última consulta. Só quem os consome (e esvazia a lista) liga o registro; sem isso
+        # a lista cresceria a cada entrega durante todo o episódio
+        self.track_recently_delivered_orders = False
         self.recently_delivered_orders: List[Order] = []
 
         self.successfully_assigned_routes = 0
 
-        self.events = []
+        self.event_log = EventLog()
+
+    @property
+    def events(self) -> EventLog:
+        return self.event_log
 
     @property
     def customers(self) -> List:
@@ -45,6 +58,8 @@ class DeliveryEnvState:
 
     def add_drivers(self, drivers: List) -> None:
         self._drivers += drivers
+        for driver in drivers:
+            self.driver_fleet.register(driver)
 
     def add_orders(self, orders: List) -> None:
         self._orders += orders
@@ -55,8 +70,16 @@ class DeliveryEnvState:
     def increment_assigned_routes(self) -> None:
         self.successfully_assigned_routes += 1
 
+    def increment_orders_ready(self) -> None:
+        self.orders_ready += 1
+
+    def get_orders_in_delivery_pipeline(self) -> int:
+        # Pedidos prontos e ainda não entregues
+        return self.orders_ready - self.orders_delivered
+
     def add_order_delivered(self, order: Order) -> None:
-        self.recently_delivered_orders.append(order)
+        if self.track_recently_delivered_orders:
+            self.recently_delivered_orders.append(order)
         self.orders_delivered += 1
     
     def get_orders_delivered(self) -> int:
@@ -73,10 +96,10 @@ class DeliveryEnvState:
         return orders
 
     def add_event(self, event) -> None:
-        self.events.append(event)
+        self.event_log.append(event)
 
     def log_events(self) -> None:
-        for event in self.events:
+        for event in self.event_log:
             print(event)
 
     def print_state(self, options=None):
@@ -112,11 +135,11 @@ class DeliveryEnvState:
         if options.get("orders", False):
             print("\nPedidos:")
             for idx, order in enumerate(self.orders, start=1):
-                print(f"Pedido {idx}: {order.__dict__}")
+                print(f"Pedido {idx}: {order.as_dict()}")
 
         if options.get("events", False):
             print("\nEventos:")
-            for idx, event in enumerate(self.events, start=1):
+            for idx, event in enumerate(self.event_log, start=1):
                 print(f"Evento {idx}: {event}")
 
         if options.get("orders_delivered", False):
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class EtaEstimator(Enum):
+    """
+    Como o ambiente gymnasium estima, para cada motorista, o tempo de entrega do pedido atual na observação.
+
+    SAMPLED sorteia as esperas do motorista e do cliente a cada observação (comportamento original), consumindo o
+    gerador de números aleatórios da simulação. EXPECTED usa o valor esperado dessas esperas e não sorteia nada, o que
+    torna a observação determinística e permite calcular o vetor de todos os motoristas de uma vez.
+    """
+    SAMPLED = "sampled"
+    EXPECTED = "expected"
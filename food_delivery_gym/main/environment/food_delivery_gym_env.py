@@ -1,15 +1,14 @@
-import json
-from pathlib import Path
 import traceback
 from typing import Optional
 
-from food_delivery_gym.main.utils.rate_function_utils import build_rate_function, validate_rate_function
+from food_delivery_gym.main.utils.rate_function_utils import build_rate_function
 import numpy as np
 from gymnasium import Env
 from gymnasium.spaces import Dict, Box, Discrete
 
 from food_delivery_gym.main.driver.driver_status import DriverStatus
 from food_delivery_gym.main.environment.env_mode import EnvMode
+from food_delivery_gym.main.environment.eta_estimator import EtaEstimator
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.generator.initial_dynamic_route_driver_generator import InitialDynamicRouteDriverGenerator
 from food_delivery_gym.main.generator.initial_establishment_order_rate_generator import InitialEstablishmentOrderRateGenerator
@@ -20,64 +19,82 @@ from food_delivery_gym.main.order.order import Order
 from food_delivery_gym.main.route.delivery_route_segment import DeliveryRouteSegment
 from food_delivery_gym.main.route.pickup_route_segment import PickupRouteSegment
 from food_delivery_gym.main.route.route import Route
-from food_delivery_gym.main.utils.random_manager import RandomManager
+from food_delivery_gym.main.scenarios.scenario import Scenario
+from food_delivery_gym.main.utils.random_stream import RandomStream
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 from food_delivery_gym.main.view.grid_view_pygame import GridViewPygame
 
 class FoodDeliveryGymEnv(Env):
 
     REWARD_OBJECTIVES = list(range(1, 14))
-    SCENARIO: dict | None = None
+    RECENTLY_DELIVERED_ORDERS_OBJECTIVES = (12, 13) # Objetivos que consomem a lista de pedidos entregues a cada passo
+    SCENARIO: Scenario | None = None # Cenário padrão das instâncias criadas sem scenario nem scenario_json_file_path
 
     @classmethod
     def set_scenario(cls, scenario_json_file_path: str) -> None:
         """
-        Lê o arquivo JSON e armazena o cenário no cache de classe.
- 
-        Deve ser chamado no processo principal antes de criar qualquer instância do ambiente ou workers 
-        de VecEnv. Em avaliações em lote com múltiplos cenários, chame novamente antes de cada grupo de
-        instâncias para atualizar o cache com o novo cenário.
+        Lê o arquivo JSON e define o cenário padrão da classe.
+
+        Mantido por compatibilidade: prefira passar o Scenario (ou o caminho do JSON) a cada instância, o que
+        permite ambientes de cenários diferentes no mesmo processo sem alterar estado global.
         """
-        path = Path(scenario_json_file_path)
-        if not path.is_file():
-            raise FileNotFoundError(f"Arquivo de cenário não encontrado: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            cls.SCENARIO = json.load(f)
-    
+        cls.SCENARIO = Scenario.load(scenario_json_file_path)
+
     def set_reward_objective(self, reward_objective: int):
         if reward_objective not in self.REWARD_OBJECTIVES:
             raise ValueError(f"reward_objective deve ser um valor entre {self.REWARD_OBJECTIVES}.")
         self.reward_objective = reward_objective
+        if self.simpy_env is not None:
+            self.simpy_env.state.track_recently_delivered_orders = reward_objective in self.RECENTLY_DELIVERED_ORDERS_OBJECTIVES
 
     def set_mode(self, mode: EnvMode):
         self.env_mode = mode
         if self.simpy_env is not None:
             self.simpy_env.set_env_mode(mode)
 
-    def __init__(self, scenario_json_file_path: str | None = "", reward_objective: int = 1, mode: EnvMode = EnvMode.TRAINING):
-        if FoodDeliveryGymEnv.SCENARIO is None:
-            if not scenario_json_file_path:
+    def __init__(
+        self,
+        scenario_json_file_path: str | None = "",
+        reward_objective: int = 1,
+        mode: EnvMode = EnvMode.TRAINING,
+        flat_observation: bool = False,
+        eta_estimator: EtaEstimator | str = EtaEstimator.SAMPLED,
+        scenario: Scenario | None = None,
+    ):
+        # Prioridade: Scenario recebido, arquivo JSON (lido uma única vez por processo) e, por fim, o cenário da classe
+        if scenario is None:
+            if scenario_json_file_path:
+                scenario = Scenario.load(scenario_json_file_path)
+            elif FoodDeliveryGymEnv.SCENARIO is not None:
+                scenario = FoodDeliveryGymEnv.SCENARIO
+            else:
                 raise ValueError(
-                    "Nenhum cenário carregado. Forneça 'scenario_json_file_path' "
+                    "Nenhum cenário carregado. Forneça 'scenario' ou 'scenario_json_file_path' "
                     "ou chame 'FoodDeliveryGymEnv.set_scenario(path)' antes de instanciar."
                 )
-            FoodDeliveryGymEnv.set_scenario(scenario_json_file_path)
- 
-        self._load_and_validate_scenario(FoodDeliveryGymEnv.SCENARIO)
+
+        self._apply_scenario(scenario)
  
         self.env_mode = mode
 
         self.simpy_env = None # Ambiente de simulação será criado no reset
+        #   Semente raiz dos episódios: cada reset cria os fluxos aleatórios do episódio a partir de um filho dela, então
+        # resets sem semente continuam a sequência de forma reprodutível e o ambiente não depende de estado global
+        self._seed_sequence = np.random.SeedSequence()
+        self.random_streams: RandomStreams | None = None # Fluxos aleatórios do episódio atual
         self._last_decision_time = None # Último passo de tempo em que o agente tomou uma decisão
         self.last_simpy_env = None # Ambiente de simulação da execução anterior -> para fins de computação de estatísticas
         self.orders_generated = None # Número de pedidos que o gerador de pedidos vai gerar
         self._cached_busy_times: np.ndarray | None = None # Cache de estimate_total_busy_time() do último get_observation()
+        self.eta_estimator = EtaEstimator(eta_estimator) # Estimador de order_estimated_delivery_time na observação
 
         # Definindo o objetivo da recompensa
         self.set_reward_objective(reward_objective)
 
         # Espaço de Observação
         self.dtype_observation = np.float32
-        self.observation_space = Dict({
+        self.flat_observation = flat_observation # Se True, a observação é um único vetor float32 (Box) em vez de um Dict
+        dict_observation_space = Dict({
             # --- Motoristas ---
             'drivers_coord': Box(low=0, high=self.grid_map_size - 1, shape=(self.num_drivers*2,), dtype=self.dtype_observation),
             'drivers_estimated_remaining_time': Box(low=0, high=self.max_time_step, shape=(self.num_drivers,), dtype=self.dtype_observation),
@@ -95,185 +112,161 @@ class FoodDeliveryGymEnv(Env):
             'current_time_step': Box(low=0, high=self.max_time_step, shape=(1,), dtype=self.dtype_observation)
         })
 
+        #   Layout fixo do vetor de observação: cada campo ocupa um intervalo contíguo, na ordem das chaves do espaço Dict
+        # (a mesma usada por gymnasium.spaces.flatten). A observação é sempre montada nesse vetor e, no modo Dict, os
+        # campos retornados são views dele. O layout é publicado em metadata["observation_layout"] como (início, fim)
+        # para que heurísticas consigam localizar os campos no modo plano
+        self.observation_layout: dict[str, slice] = {}
+        offset = 0
+        for key, space in dict_observation_space.spaces.items():
+            self.observation_layout[key] = slice(offset, offset + space.shape[0])
+            offset += space.shape[0]
+        self.observation_size = offset
+        self.metadata = {
+            **self.metadata,
+            "observation_layout": {key: (field.start, field.stop) for key, field in self.observation_layout.items()},
+        }
+
+        if self.flat_observation:
+            self.observation_space = Box(
+                low=np.concatenate([space.low for space in dict_observation_space.spaces.values()]),
+                high=np.concatenate([space.high for space in dict_observation_space.spaces.values()]),
+                dtype=self.dtype_observation
+            )
+        else:
+            self.observation_space = dict_observation_space
+
         # Espaço de Ação
         self.action_space = Discrete(self.num_drivers)  # Escolher qual driver pegará o pedido
 
-    def _load_and_validate_scenario(self, scenario: dict):
-        # Estrutura esperada
-        required_sections = ["order_generator", "simpy_env", "grid_map", "drivers", "establishments"]
-        for section in required_sections:
-            if section not in scenario:
-                raise ValueError(f"Seção obrigatória ausente: '{section}'")
-
-        og = scenario["order_generator"]
-        env = scenario["simpy_env"]
-        grid = scenario["grid_map"]
-        drv = scenario["drivers"]
-        est = scenario["establishments"]
-
-        # 1. Order Generator
-        required_og = ["type", "estimated_num_orders", "time_window"]
-        for k in required_og:
-            if k not in og:
-                raise ValueError(f"Campo obrigatório ausente em 'order_generator': '{k}'")
-        if og["type"] not in ["poisson", "non_homogeneous_poisson"]:
-            raise ValueError("order_generator.type deve ser 'poisson' ou 'non_homogeneous_poisson'")
-        if not isinstance(og["estimated_num_orders"], int) or og["estimated_num_orders"] <= 0:
-            raise ValueError("order_generator.estimated_num_orders deve ser um inteiro positivo")
-        if not isinstance(og["time_window"], (int, float)) or og["time_window"] <= 0:
-            raise ValueError("order_generator.time_window deve ser positivo")
-        if og["type"] == "non_homogeneous_poisson":
-            if "rate_function" not in og:
-                raise ValueError("rate_function é obrigatório para 'non_homogeneous_poisson'")
-            validate_rate_function(og["rate_function"])
-        
-        self.estimated_num_orders = og["estimated_num_orders"]
-        self.order_generator_config = scenario.get("order_generator", {})
-
-        # 2. simpy_env
-        if "max_time_step" not in env:
-            raise ValueError("Campo obrigatório ausente em 'simpy_env': 'max_time_step'")
-        if not isinstance(env["max_time_step"], (int, float)) or env["max_time_step"] <= 0:
-            raise ValueError("simpy_env.max_time_step deve ser um número positivo")
-        
-        self.max_time_step = env["max_time_step"]
-
-        # 3. grid_map
-        if "size" not in grid:
-            raise ValueError("Campo obrigatório ausente em 'grid_map': 'size'")
-        if not isinstance(grid["size"], int) or grid["size"] <= 0:
-            raise ValueError("grid_map.size deve ser um inteiro positivo")
-        
-        self.grid_map_size = grid["size"]
-
-        # 4. drivers
-        required_drv = ["num", "vel", "tolerance_percentage", "max_capacity"]
-        for k in required_drv:
-            if k not in drv:
-                raise ValueError(f"Campo obrigatório ausente em 'drivers': '{k}'")
-        if not isinstance(drv["num"], int) or drv["num"] <= 0:
-            raise ValueError("drivers.num deve ser um inteiro positivo")
-        if not (isinstance(drv["vel"], list) and len(drv["vel"]) == 2 and all(isinstance(v, (int, float)) for v in drv["vel"])):
-            raise ValueError("drivers.vel deve ser uma lista com dois números [min, max]")
-        if not isinstance(drv["tolerance_percentage"], (int, float)) or drv["tolerance_percentage"] < 0:
-            raise ValueError("drivers.tolerance_percentage deve ser um número não negativo")
-        if not isinstance(drv["max_capacity"], int) or drv["max_capacity"] <= 0:
-            raise ValueError("drivers.max_capacity deve ser um inteiro positivo")
-        
-        self.num_drivers = drv["num"]
-        self.vel_drivers = drv["vel"]
-        self.tolerance_percentage = drv["tolerance_percentage"]
-        self.max_capacity = drv["max_capacity"]
-
-        # 5. establishments
-        required_est = ["num", "prepare_time", "operating_radius", "production_capacity", "percentage_allocation_driver"]
-        for k in required_est:
-            if k not in est:
-                raise ValueError(f"Campo obrigatório ausente em 'establishments': '{k}'")
-        if not isinstance(est["num"], int) or est["num"] <= 0:
-            raise ValueError("establishments.num deve ser um inteiro positivo")
-        for key in ["prepare_time", "operating_radius", "production_capacity"]:
-            value = est[key]
-            if not (isinstance(value, list) and len(value) == 2 and all(isinstance(v, (int, float)) for v in value)):
-                raise ValueError(f"'{key}' deve ser uma lista com dois valores numéricos [min, max]")
-            if value[0] > value[1]:
-                raise ValueError(f"'{key}' deve estar em ordem crescente (min <= max)")
-        pad = est["percentage_allocation_driver"]
-        if not (isinstance(pad, (int, float)) and 0 <= pad <= 1):
-            raise ValueError("establishments.percentage_allocation_driver deve ser um número entre 0 e 1")
-        
-        self.num_establishments = est["num"]
-        self.prepare_time = est["prepare_time"]
-        self.operating_radius = est["operating_radius"]
-        self.production_capacity = est["production_capacity"]
-        self.percentage_allocation_driver = est["percentage_allocation_driver"]
-    
-    def _create_order_generator(self) -> PoissonOrderGenerator | NonHomogeneousPoissonOrderGenerator:
-        generator_type = self.order_generator_config["type"]
-        estimated_num_orders = self.order_generator_config["estimated_num_orders"]
-        time_window = self.order_generator_config["time_window"]
+    def _apply_scenario(self, scenario: Scenario):
+        self.scenario = scenario
+
+        self.estimated_num_orders = scenario.estimated_num_orders
+        self.max_time_step = scenario.max_time_step
+        self.grid_map_size = scenario.grid_map_size
+
+        self.num_drivers = scenario.num_drivers
+        self.vel_drivers = scenario.vel_drivers
+        self.tolerance_percentage = scenario.tolerance_percentage
+        self.max_capacity = scenario.max_capacity
+
+        self.num_establishments = scenario.num_establishments
+        self.prepare_time = scenario.prepare_time
+        self.operating_radius = scenario.operating_radius
+        self.production_capacity = scenario.production_capacity
+        self.percentage_allocation_driver = scenario.percentage_allocation_driver
+
+        #   Partes da simulação que não mudam entre episódios nem dependem do gerador aleatório: são criadas uma única
+        # vez e reaproveitadas a cada reset, que só recria o estado mutável do episódio
+        self._catalog = InitialEstablishmentOrderRateGenerator.create_catalog()
+        self._rate_function = None
+        self._max_rate = scenario.max_rate
+        if scenario.order_generator_type == "non_homogeneous_poisson":
+            self._rate_function = build_rate_function(scenario.rate_function, vectorized=True)
+            if self._max_rate is None:
+                self._max_rate = NonHomogeneousPoissonOrderGenerator.estimate_max_rate(self._rate_function, scenario.time_window)
+
+    def _create_order_generator(self, random_streams: RandomStreams) -> PoissonOrderGenerator | NonHomogeneousPoissonOrderGenerator:
+        generator_type = self.scenario.order_generator_type
+        estimated_num_orders = self.scenario.estimated_num_orders
+        time_window = self.scenario.time_window
         
         if generator_type == "poisson":
             return PoissonOrderGenerator(
                 estimated_num_orders=estimated_num_orders,
                 time_window=time_window,
-                lambda_rate=self.order_generator_config.get("lambda_rate", None)
+                lambda_rate=self.scenario.lambda_rate,
+                random_streams=random_streams
             )
         
         elif generator_type == "non_homogeneous_poisson":
-            rate_function_code = self.order_generator_config["rate_function"]
-            rate_function = build_rate_function(rate_function_code)
-            
             return NonHomogeneousPoissonOrderGenerator(
                 estimated_num_orders=estimated_num_orders,
                 time_window=time_window,
-                rate_function=rate_function,
-                max_rate=self.order_generator_config.get("max_rate", None)
+                rate_function=self._rate_function,
+                max_rate=self._max_rate,
+                random_streams=random_streams
             )
 
-    def get_observation(self):
-        n = self.num_drivers
+    def get_observation(self, observation_out: np.ndarray | None = None):
         drivers = self.simpy_env.state.drivers
+        fleet = self.simpy_env.state.driver_fleet
 
         # --- Motoristas ---
-        drivers_coord = np.empty((n * 2,), dtype=self.dtype_observation)
-        drivers_estimated_remaining_time = np.empty((n,), dtype=self.dtype_observation)
-        driver_status = np.empty((n,), dtype=self.dtype_observation)
-        drivers_queue_size = np.empty((n,), dtype=self.dtype_observation)
-        drivers_velocity = np.empty((n,), dtype=self.dtype_observation)
-        order_estimated_delivery_time = np.empty((n,), dtype=self.dtype_observation)
-        for i, driver in enumerate(drivers):
-            # 1. Coordenada atual
-            coord = driver.get_coordinate()
-            drivers_coord[i * 2]     = coord[0]
-            drivers_coord[i * 2 + 1] = coord[1]
-            # 2. Tempo estimado restante para completar todas as entregas
-            drivers_estimated_remaining_time[i] = driver.estimate_total_busy_time()
-            # 3. Status atual (disponível, coletando, entregando, etc.)
-            driver_status[i] = driver.get_status_for_observation().value
-            # 4. Número de pedidos na lista
-            drivers_queue_size[i] = driver.get_number_of_orders_in_list()
-            # 5. Velocidade
-            drivers_velocity[i] = driver.get_velocity()
-            # 6. Tempo estimado para entregar o pedido atual caso seja atribuído a este motorista
-            order_estimated_delivery_time[i] = driver.estimate_time_to_complete_next_order(self.current_order)
+        #   Coordenadas, status, fila e velocidade já estão nos buffers da frota, atualizados pelos próprios motoristas.
+        # Falta apenas o que depende do instante da decisão: posição de quem está em deslocamento e tempo de ocupação
+        fleet.refresh_moving_coordinates()
+        fleet.refresh_busy_times()
+
+        #   Todos os campos são escritos diretamente no vetor de observação (um novo a cada passo, já que o agente pode
+        # guardar observações anteriores), sem cópias intermediárias nem concatenação no modo plano. Ambientes
+        # vetorizados passam em observation_out a linha do seu buffer (N, observation_size), que é sobrescrita
+        if observation_out is None:
+            observation = np.zeros((self.observation_size,), dtype=self.dtype_observation)
+        else:
+            observation = observation_out
+            observation.fill(0)
+        fields = {key: observation[field] for key, field in self.observation_layout.items()}
+
+        # 1. Coordenada atual
+        fields['drivers_coord'][:] = fleet.coords
+        # 2. Tempo estimado restante para completar todas as entregas
+        fields['drivers_estimated_remaining_time'][:] = fleet.busy_time
+        # 3. Status atual (disponível, coletando, entregando, etc.)
+        fields['driver_status'][:] = fleet.status
+        # 4. Número de pedidos na lista
+        fields['drivers_queue_size'][:] = fleet.queue_size
+        # 5. Velocidade
+        fields['drivers_velocity'][:] = fleet.velocity
+        # 6. Tempo estimado para entregar o pedido atual caso seja atribuído a este motorista
+        if self.eta_estimator is EtaEstimator.EXPECTED:
+            if self.current_order:
+                fields['order_estimated_delivery_time'][:] = self._expected_order_delivery_times(fleet)
+        else:
+            order_estimated_delivery_time = fields['order_estimated_delivery_time']
+            for i, driver in enumerate(drivers):
+                order_estimated_delivery_time[i] = driver.estimate_time_to_complete_next_order(self.current_order)
 
         # --- Pedido Atual ---
-        order_restaurant_coord  = np.zeros((2,), dtype=self.dtype_observation)
-        order_customer_coord    = np.zeros((2,), dtype=self.dtype_observation)
-        order_estimated_ready_time = np.zeros((1,), dtype=self.dtype_observation)
         if self.current_order:
             # 1. Coordenada do restaurante do pedido atual
-            est_coord = self.current_order.get_establishment().get_coordinate()
-            order_restaurant_coord[0] = est_coord[0]
-            order_restaurant_coord[1] = est_coord[1]
+            fields['order_restaurant_coord'][:] = self.current_order.get_establishment().get_coordinate()
             # 2. Coordenada do cliente do pedido atual
-            cust_coord = self.current_order.get_customer().get_coordinate()
-            order_customer_coord[0] = cust_coord[0]
-            order_customer_coord[1] = cust_coord[1]
+            fields['order_customer_coord'][:] = self.current_order.get_customer().get_coordinate()
             # 3. Tempo estimado para o pedido ficar pronto no restaurante
-            order_estimated_ready_time[0] = self.current_order.get_estimated_ready_time()
+            fields['order_estimated_ready_time'][0] = self.current_order.get_estimated_ready_time()
 
         # --- Ambiente ---
         # 1. Tempo atual da simulação
-        current_time_step = np.array([self.simpy_env.now], dtype=self.dtype_observation)
+        fields['current_time_step'][0] = self.simpy_env.now
 
         # Persiste o array de busy times para reutilização em _calculate_reward() (objetivos que somam estimate_total_busy_time)
-        self._cached_busy_times = drivers_estimated_remaining_time
-
-        return {
-            'drivers_coord': drivers_coord,
-            'drivers_estimated_remaining_time': drivers_estimated_remaining_time,
-            'driver_status': driver_status,
-            'drivers_queue_size': drivers_queue_size,
-            'drivers_velocity': drivers_velocity,
-            'order_restaurant_coord': order_restaurant_coord,
-            'order_customer_coord': order_customer_coord,
-            'order_estimated_ready_time': order_estimated_ready_time,
-            'order_estimated_delivery_time': order_estimated_delivery_time,
-            'current_time_step': current_time_step
-        }
+        self._cached_busy_times = fields['drivers_estimated_remaining_time']
+
+        if self.flat_observation:
+            return observation
+        return fields
        
+    def _expected_order_delivery_times(self, fleet) -> np.ndarray:
+        # Equivalente vetorizado de Driver.expected_time_to_complete_next_order, partindo da última coordenada válida de cada motorista
+        map = self.simpy_env.map
+        establishment_coordinate = self.current_order.establishment.coordinate
+        customer_coordinate = self.current_order.customer.coordinate
+        velocity = fleet.velocity
+
+        pickup_time = map.estimated_time_many(fleet.last_valid_coords.reshape(-1, 2), establishment_coordinate, velocity)
+        delivery_time = map.estimated_time_many(establishment_coordinate, customer_coordinate, velocity)
+
+        # As esperas esperadas são as mesmas para todos os motoristas (dependem só das classes de Driver e Customer)
+        driver = self.simpy_env.state.drivers[0]
+        expected_waits = (
+            driver.expected_time_between_accept_and_start_picking_up()
+            + driver.expected_time_between_picked_up_and_start_delivery()
+            + self.current_order.customer.expected_time_to_receive_order()
+        )
+        return expected_waits + pickup_time + delivery_time
+
     def get_info(self):
         return {'simpy_time_step': self.simpy_env.now}
     
@@ -285,7 +278,10 @@ class FoodDeliveryGymEnv(Env):
         
         while (not terminated) and (not truncated) and (core_event is None):
             if self.simpy_env.state.get_orders_delivered() < self.orders_generated:
-                self.simpy_env.step(self.render_mode)
+                #   A simulação avança dentro do SimPy até o próximo evento principal, a última entrega ou o limite de
+                # tempo. Eventos principais registrados no mesmo instante ficam na fila e são atendidos sem avançar
+                if not self.simpy_env.core_events:
+                    self.simpy_env.run_until_core_event(self.orders_generated, self.max_time_step - 1, self.render_mode)
                 
                 # TODO: Logs
                 # # Verifica se um pedido foi entregue
@@ -313,11 +309,12 @@ class FoodDeliveryGymEnv(Env):
 
         return core_event, terminated, truncated
 
-    def reset(self, seed: int | None = None, options: Optional[dict] = None):
+    def reset(self, seed: int | None = None, options: Optional[dict] = None, *, observation_out: np.ndarray | None = None):
         if seed is not None:
             super().reset(seed=seed)
             self.action_space.seed(seed=seed)
-            RandomManager().set_seed(seed=seed)
+            self._seed_sequence = np.random.SeedSequence(seed)
+        self.random_streams = RandomStreams(self._seed_sequence.spawn(1)[0])
 
         # Lê as opções adicionais
         render_mode = None
@@ -333,12 +330,12 @@ class FoodDeliveryGymEnv(Env):
 
         self.render_mode = render_mode
 
-        poisson_order_generator = self._create_order_generator()
+        poisson_order_generator = self._create_order_generator(self.random_streams)
         self.orders_generated = poisson_order_generator.get_number_of_orders_generated()
 
         # Cria o ambiente SimPy
         self.simpy_env = FoodDeliverySimpyEnv(
-            map=GridMap(self.grid_map_size),
+            map=GridMap(self.grid_map_size, rng=self.random_streams.get(RandomStream.SETUP)),
             generators=[
                 InitialEstablishmentOrderRateGenerator(
                     self.num_establishments,
@@ -346,13 +343,16 @@ class FoodDeliveryGymEnv(Env):
                     self.operating_radius,
                     self.production_capacity,
                     self.percentage_allocation_driver,
+                    catalog=self._catalog,
+                    random_streams=self.random_streams,
                 ),
                 InitialDynamicRouteDriverGenerator(
                     self.num_drivers,
                     self.vel_drivers,
                     self.tolerance_percentage,
                     self.max_capacity,
-                    self.reward_objective
+                    self.reward_objective,
+                    random_streams=self.random_streams,
                 ),
                 poisson_order_generator
             ],
@@ -362,17 +362,19 @@ class FoodDeliveryGymEnv(Env):
                 draw_grid=draw_grid,
                 window_size=window_size,
                 fps=fps
-            ) if render_mode == "human" else None
+            ) if render_mode == "human" else None,
+            random_streams=self.random_streams,
         )
 
         self.simpy_env.set_env_mode(self.env_mode)
+        self.simpy_env.state.track_recently_delivered_orders = self.reward_objective in self.RECENTLY_DELIVERED_ORDERS_OBJECTIVES
 
         # Avança até o primeiro evento principal
         self._last_decision_time = 0
         core_event, _, _ = self._advance_simulation_until_event()
         self.current_order: Order = core_event.order if core_event else None
 
-        observation = self.get_observation()
+        observation = self.get_observation(observation_out)
         info = self.get_info()
 
         self._last_decision_time = self.simpy_env.now
@@ -406,7 +408,7 @@ class FoodDeliveryGymEnv(Env):
         # Objetivo 2: Minimizar o custo de operação a partir da expectativa da distância a ser percorrida -> Recompensa negativa a cada passo
         if self.reward_objective == 2:
             # Soma das estimativas do tempo de ocupação de cada motoristas
-            reward = -sum(driver.calculate_total_distance_to_travel() for driver in self.simpy_env.state.drivers)
+            reward = -sum(driver.get_summary().distance_to_travel for driver in self.simpy_env.state.drivers)
 
         # Objetivo 3: Minimizar o tempo de entrega dos motoristas a partir do tempo efetivo gasto -> Recompensa negativa a cada passo
         # Objetivo 9: Minimizar o tempo de entrega dos motoristas a partir do tempo efetivo gasto (Com penalização 5x para pedidos não coletados) -> Recompensa negativa a cada passo
@@ -478,6 +480,8 @@ class FoodDeliveryGymEnv(Env):
 
         # Objetivo 12: Penaliza pelo tempo total de cada pedido entregue neste step.bQuanto mais rápido o pedido for entregue, menor a penalidade (maior a recompensa).
         elif self.reward_objective == 12:
+            #   Os termos são somados com sum() na leitura, e não acumulados a cada entrega: a partir do Python 3.12 o
+            # sum() de floats usa soma compensada, que difere de += sucessivos nos últimos bits
             recently_delivered = self.simpy_env.state.get_and_clear_recently_delivered_orders()
             reward = -sum(
                 order.time_it_was_delivered - order.request_date
@@ -491,12 +495,16 @@ class FoodDeliveryGymEnv(Env):
         elif self.reward_objective == 13:
             penalty = 0
 
-            orders_in_delivery_pipeline = [order for order in self.simpy_env.state.orders if order.is_ready() and not order.is_delivered()]
+            #   O número de pedidos prontos e não entregues vem dos contadores do estado, sem percorrer todos os pedidos.
+            # A penalidade do passo continua sendo somada uma vez por pedido: os tempos são float e k * intervalo nem
+            # sempre é igual, bit a bit, à soma repetida
+            orders_in_delivery_pipeline = self.simpy_env.state.get_orders_in_delivery_pipeline()
 
             orders_recently_delivered = self.simpy_env.state.get_and_clear_recently_delivered_orders()
 
-            for _ in orders_in_delivery_pipeline:
-                penalty += self.simpy_env.now - self._last_decision_time
+            step_penalty = self.simpy_env.now - self._last_decision_time
+            for _ in range(orders_in_delivery_pipeline):
+                penalty += step_penalty
             
             for order in orders_recently_delivered:
                 # Pedido foi enregue nesse intervalo, então penalidade baseada no tempo total do pedido
@@ -513,7 +521,7 @@ class FoodDeliveryGymEnv(Env):
 
         return reward
         
-    def step(self, action):
+    def step(self, action, *, observation_out: np.ndarray | None = None):
         try:
             if action < 0 or action >= self.num_drivers:
                 raise ValueError(f"A ação {action} é inválida! Deve ser um número entre 0 e {self.num_drivers}")
@@ -531,7 +539,7 @@ class FoodDeliveryGymEnv(Env):
 
             self.current_order = core_event.order if core_event else None
 
-            observation = self.get_observation()
+            observation = self.get_observation(observation_out)
 
             # assert self.observation_space.contains(observation), "A observação gerada não está contida no espaço de observação."
             
@@ -613,18 +621,18 @@ class FoodDeliveryGymEnv(Env):
         descricao.append(f"- Tempo máximo de simulação (max_time_step): {self.max_time_step} minutos")
 
         # Parâmetros de geração de pedidos
-        if self.order_generator_config["type"] == "poisson":
+        if self.scenario.order_generator_type == "poisson":
             descricao.append("- Geração de pedidos: Processo de Poisson Homogêneo")
-            descricao.append(f"  • {self.order_generator_config['estimated_num_orders']} pedidos estimados em {self.order_generator_config['time_window']} minutos")
-            if self.order_generator_config.get('lambda_rate', None) is not None:
-                descricao.append(f"  • Taxa λ: {self.order_generator_config['lambda_rate']} pedidos por minuto")
+            descricao.append(f"  • {self.scenario.estimated_num_orders} pedidos estimados em {self.scenario.time_window} minutos")
+            if self.scenario.lambda_rate is not None:
+                descricao.append(f"  • Taxa λ: {self.scenario.lambda_rate} pedidos por minuto")
 
-        elif self.order_generator_config["type"] == "non_homogeneous_poisson":
+        elif self.scenario.order_generator_type == "non_homogeneous_poisson":
             descricao.append("- Geração de pedidos: Poisson Não Homogêneo")
-            descricao.append(f"  • {self.order_generator_config['estimated_num_orders']} pedidos por {self.order_generator_config['time_window']} minutos")
-            descricao.append(f"  • Função de taxa: {self.order_generator_config['rate_function']}")
-            if self.order_generator_config.get("max_rate", None) is not None:
-                descricao.append(f"  • Taxa máxima: {self.order_generator_config['max_rate']} pedidos por minuto")
+            descricao.append(f"  • {self.scenario.estimated_num_orders} pedidos por {self.scenario.time_window} minutos")
+            descricao.append(f"  • Função de taxa: {self.scenario.rate_function}")
+            if self.scenario.max_rate is not None:
+                descricao.append(f"  • Taxa máxima: {self.scenario.max_rate} pedidos por minuto")
             
         # Parâmetros dos motoristas
         descricao.append("- Motoristas:")
@@ -1,4 +1,6 @@
+import math
 from collections import deque
+from itertools import count
 from statistics import mode
 from typing import Optional, Union
 
@@ -8,31 +10,75 @@ from simpy.core import SimTime
 
 from food_delivery_gym.main.environment.env_mode import EnvMode
 from food_delivery_gym.main.environment.delivery_env_state import DeliveryEnvState
+from food_delivery_gym.main.events.event_log import EventLog
+from food_delivery_gym.main.events.event_log_policy import EventLogPolicy
 from food_delivery_gym.main.map.map import Map
 from food_delivery_gym.main.order.delivery_rejection import DeliveryRejection
+from food_delivery_gym.main.utils.random_manager import RandomManager
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 from food_delivery_gym.main.view.food_delivery_view import FoodDeliveryView
 
 
 class FoodDeliverySimpyEnv(Environment):
 
-    def __init__(self, map: Map, generators, optimizer, view: FoodDeliveryView = None):
+    #   Política do log de eventos para cada modo. No treinamento ninguém lê os eventos, então eles não
+    # são armazenados; nos demais modos o log completo alimenta as estatísticas e os boards do episódio.
+    EVENT_LOG_POLICY_BY_MODE = {
+        EnvMode.TRAINING: EventLogPolicy.OFF,
+        EnvMode.TESTING: EventLogPolicy.FULL,
+        EnvMode.EVALUATING: EventLogPolicy.FULL,
+    }
+
+    def __init__(self, map: Map, generators, optimizer, view: FoodDeliveryView = None, random_streams: Optional[RandomStreams] = None):
         super().__init__()
+        #   Fluxos aleatórios da simulação, usados pelos atores criados nela. Sem fluxos próprios, todos usam o gerador
+        # global do RandomManager
+        self.random_streams = random_streams if random_streams is not None else RandomStreams.from_generator(
+            RandomManager().get_random_instance()
+        )
         self.map = map
         self.generators = generators
         self.optimizer = optimizer
         self.view = view
         self.env_mode = EnvMode.TRAINING
         self.last_time_step = 0
+        #   Número de passos de tempo contabilizados nas estatísticas (só avança fora do modo TRAINING). Os atores
+        # guardam o valor deste contador quando mudam de estado e somam os intervalos, em vez de serem visitados a cada passo
+        self.statistics_ticks: int = 0
         self._state = DeliveryEnvState()
+
+        #   Contadores de IDs inteiros, monotonicamente crescentes, de rotas, segmentos de rota e eventos.
+        # São por ambiente, então processos paralelos não precisam de IDs globais (uuid) para evitar colisões.
+        self._route_ids = count(1)
+        self._route_segment_ids = count(1)
+        self._event_ids = count(1)
+
+        # Versão do estado da simulação: incrementada a cada evento processado, invalida os resumos dos motoristas
+        self.simulation_version: int = 0
+
         self.init()
 
         self.core_events: deque = deque()
 
+        # Motoristas ociosos que receberam requisições de rota e aguardam ser acordados
+        self._idle_drivers_to_wake: list = []
+        self._wake_idle_drivers_event: Optional[Event] = None
+
+        # Evento que encerra a execução corrente de run_until_core_event e evento do limite de tempo do episódio
+        self._stop_event: Optional[Event] = None
+        self._orders_to_deliver: Optional[int] = None
+        self._time_limit_event: Optional[Event] = None
+
     def set_env_mode(self, mode: EnvMode):
         self.env_mode = mode
+        self.set_event_log_policy(self.EVENT_LOG_POLICY_BY_MODE[mode])
+
+    def set_event_log_policy(self, policy: EventLogPolicy, capacity: Optional[int] = None):
+        self._state.event_log.set_policy(policy, capacity)
 
     def add_core_event(self, event):
         self.core_events.append(event)
+        self.stop_run_until_core_event()
     
     def dequeue_core_event(self):
         return self.core_events.popleft() if self.core_events else None
@@ -41,13 +87,35 @@ class FoodDeliverySimpyEnv(Environment):
         self.core_events.clear()
 
     @property
-    def events(self):
+    def events(self) -> EventLog:
         return self._state.events
 
     @property
     def state(self):
         return self._state
 
+    def wake_idle_driver(self, driver):
+        """
+        Agenda o despertar de um motorista ocioso que recebeu uma requisição de rota.
+
+        Todos os motoristas acordados no mesmo instante são liberados por um único evento, em ordem de
+        driver_id, reproduzindo a ordem em que o antigo laço de polling de 1 minuto os processava.
+        """
+        if driver in self._idle_drivers_to_wake:
+            return
+        self._idle_drivers_to_wake.append(driver)
+        if self._wake_idle_drivers_event is None:
+            self._wake_idle_drivers_event = self.event()
+            self._wake_idle_drivers_event.callbacks.append(self._wake_idle_drivers)
+            self._wake_idle_drivers_event.succeed()
+
+    def _wake_idle_drivers(self, _event):
+        drivers = sorted(self._idle_drivers_to_wake, key=lambda driver: driver.driver_id)
+        self._idle_drivers_to_wake = []
+        self._wake_idle_drivers_event = None
+        for driver in drivers:
+            driver.route_request_signal.succeed()
+
     def add_customers(self, customers):
         self._state.add_customers(customers)
 
@@ -66,6 +134,11 @@ class FoodDeliverySimpyEnv(Environment):
     def get_establishments(self):
         return self._state.establishments
 
+    def add_order_delivered(self, order):
+        self._state.add_order_delivered(order)
+        if self._orders_to_deliver is not None and self._state.get_orders_delivered() >= self._orders_to_deliver:
+            self.stop_run_until_core_event()
+
     def add_ready_order(self, order, event):
         self._state.orders_awaiting_delivery.append(order)
 
@@ -90,7 +163,14 @@ class FoodDeliverySimpyEnv(Environment):
             self._state.rejected_deliveries = []
         return rejected_orders
 
+    def next_route_id(self) -> int:
+        return next(self._route_ids)
+
+    def next_route_segment_id(self) -> int:
+        return next(self._route_segment_ids)
+
     def add_event(self, event):
+        event.event_id = next(self._event_ids)
         self._state.add_event(event)
 
     def init(self):
@@ -118,7 +198,37 @@ class FoodDeliverySimpyEnv(Environment):
         if self.view is not None and self.view.quited:
             self.view.quit()
 
+    def run_until_core_event(self, orders_to_deliver: int, time_limit: SimTime, render_mode=None) -> None:
+        """
+        Executa a simulação até o próximo ponto em que o ambiente gymnasium precisa verificar o estado: um evento
+        principal registrado, a entrega do último pedido ou a chegada em time_limit.
+
+        Cada um deles dispara o evento de parada, que é processado depois dos eventos já agendados para o mesmo
+        instante. Sem renderização, a execução fica inteira dentro do laço do SimPy.
+        """
+        self._orders_to_deliver = orders_to_deliver
+        if self._time_limit_event is None and self.now < time_limit:
+            self._time_limit_event = self.timeout(time_limit - self.now)
+            self._time_limit_event.callbacks.append(lambda _event: self.stop_run_until_core_event())
+
+        self._stop_event = self.event()
+        try:
+            if render_mode == "human" and self.view is not None:
+                while not self._stop_event.processed:
+                    self.step(render_mode)
+            else:
+                self.run(until=self._stop_event)
+        finally:
+            self._stop_event = None
+
+    def stop_run_until_core_event(self):
+        if self._stop_event is not None and not self._stop_event.triggered:
+            self._stop_event.succeed()
+
     def step(self, render_mode=None):
+        self.simulation_version += 1
+        if self.env_mode != EnvMode.TRAINING:
+            self.count_skipped_statistics_ticks(self.peek())
         super().step()
         if render_mode == "human" and self.view is not None:
             self.view.render(self)
@@ -126,7 +236,7 @@ class FoodDeliverySimpyEnv(Environment):
                 self.view.quit()
         
         if self.env_mode != EnvMode.TRAINING and self.last_time_step < self.now:
-            self.update_statistics_variables()
+            self.statistics_ticks += 1
             self.last_time_step = self.now
 
     def render(self):
@@ -141,12 +251,15 @@ class FoodDeliverySimpyEnv(Environment):
         print(f'time_step = {self.now}')
         self._state.print_state(options)
 
-    def update_statistics_variables(self):
-        for establishment in self._state.establishments:
-            establishment.update_statistics_variables()
-        
-        for driver in self._state.drivers:
-            driver.update_statistics_variables()
+    def count_skipped_statistics_ticks(self, next_time: SimTime):
+        #   Motoristas ociosos não agendam mais um evento por minuto, então podem existir minutos inteiros sem nenhum
+        # evento antes de next_time. Eles são contabilizados com o estado atual, que é o que o polling observava
+        if math.isinf(next_time):
+            return
+        skipped_ticks = math.ceil(next_time) - math.floor(self.last_time_step) - 1
+        if skipped_ticks > 0:
+            self.statistics_ticks += skipped_ticks
+            self.last_time_step = math.ceil(next_time) - 1
     
     def update_spent_drivers(self):
         for driver in self._state.drivers:
@@ -0,0 +1,338 @@
+import multiprocessing as mp
+import os
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import VecEnvIndices, VecEnvObs, VecEnvStepReturn
+
+from food_delivery_gym.main.environment.env_mode import EnvMode
+from food_delivery_gym.main.environment.eta_estimator import EtaEstimator
+from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
+from food_delivery_gym.main.environment.food_delivery_vec_env import next_episode_seed, spawn_episode_seed_rngs
+from food_delivery_gym.main.scenarios.scenario import Scenario
+
+
+class _SharedBuffers:
+    """
+    Arrays NumPy sobre blocos de multiprocessing.shared_memory, compartilhados entre o processo principal e os workers.
+
+    O processo principal cria os blocos (create=True) e os remove no close; os workers se conectam a eles pelo nome.
+    """
+
+    def __init__(self, num_envs: int, observation_size: int, dtype_observation, names: Optional[dict[str, str]] = None):
+        specs = {
+            "observations": ((num_envs, observation_size), dtype_observation),
+            "terminal_observations": ((num_envs, observation_size), dtype_observation),
+            "rewards": ((num_envs,), np.float32),
+            "dones": ((num_envs,), np.bool_),
+            "truncated": ((num_envs,), np.bool_),
+            "simpy_time_step": ((num_envs,), np.float64),
+        }
+        self._owner = names is None
+        self._blocks: dict[str, shared_memory.SharedMemory] = {}
+        self.arrays: dict[str, np.ndarray] = {}
+        for key, (shape, dtype) in specs.items():
+            nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            if self._owner:
+                block = shared_memory.SharedMemory(create=True, size=nbytes)
+            else:
+                block = shared_memory.SharedMemory(name=names[key])
+            self._blocks[key] = block
+            self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            if self._owner:
+                self.arrays[key].fill(0)
+
+    @property
+    def names(self) -> dict[str, str]:
+        return {key: block.name for key, block in self._blocks.items()}
+
+    def close(self) -> None:
+        # Os arrays precisam ser liberados antes do bloco, que não fecha com views exportadas
+        self.arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            if self._owner:
+                block.unlink()
+        self._blocks.clear()
+
+
+def _worker(remote, parent_remote, env_kwargs: dict, start: int, stop: int, num_envs: int, buffer_names: dict[str, str], dtype_observation) -> None:
+    # O Scenario já validado vem em env_kwargs (herdado com fork, serializado com spawn), sem reler o JSON
+    parent_remote.close()
+    envs = [FoodDeliveryGymEnv(**env_kwargs) for _ in range(start, stop)]
+    buffers = _SharedBuffers(num_envs, envs[0].observation_size, dtype_observation, buffer_names)
+    observations = buffers.arrays["observations"][start:stop]
+    terminal_observations = buffers.arrays["terminal_observations"][start:stop]
+    rewards = buffers.arrays["rewards"][start:stop]
+    dones = buffers.arrays["dones"][start:stop]
+    truncated_flags = buffers.arrays["truncated"][start:stop]
+    simpy_time_steps = buffers.arrays["simpy_time_step"][start:stop]
+    episode_seed_rngs = spawn_episode_seed_rngs(None, num_envs)[start:stop]
+
+    try:
+        while True:
+            command, data = remote.recv()
+            try:
+                if command == "step":
+                    for env_idx, env in enumerate(envs):
+                        observation_row = observations[env_idx]
+                        _, rewards[env_idx], terminated, truncated, info = env.step(int(data[env_idx]), observation_out=observation_row)
+                        done = terminated or truncated
+                        dones[env_idx] = done
+                        truncated_flags[env_idx] = truncated and not terminated
+                        if done:
+                            terminal_observations[env_idx] = observation_row
+                            env.reset(seed=next_episode_seed(episode_seed_rngs[env_idx]), observation_out=observation_row)
+                        simpy_time_steps[env_idx] = info["simpy_time_step"]
+                    result = None
+                elif command == "reset":
+                    seeds, options = data
+                    result = []
+                    for env_idx, env in enumerate(envs):
+                        seed = seeds[env_idx]
+                        if seed is None:
+                            seed = next_episode_seed(episode_seed_rngs[env_idx])
+                        _, info = env.reset(seed=seed, options=options[env_idx] or None, observation_out=observations[env_idx])
+                        result.append(info)
+                elif command == "seed":
+                    episode_seed_rngs = spawn_episode_seed_rngs(data, num_envs)[start:stop]
+                    result = [next_episode_seed(episode_seed_rng) for episode_seed_rng in episode_seed_rngs]
+                elif command == "get_attr":
+                    attr_name, indices = data
+                    result = [getattr(envs[i], attr_name) for i in indices]
+                elif command == "set_attr":
+                    attr_name, value, indices = data
+                    result = [setattr(envs[i], attr_name, value) for i in indices]
+                elif command == "env_method":
+                    method_name, method_args, method_kwargs, indices = data
+                    result = [getattr(envs[i], method_name)(*method_args, **method_kwargs) for i in indices]
+                elif command == "close":
+                    remote.send((None, None))
+                    break
+                else:
+                    raise NotImplementedError(f"Comando '{command}' não é suportado pelo worker")
+            except Exception:
+                remote.send((None, traceback.format_exc()))
+            else:
+                remote.send((result, None))
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        for env in envs:
+            env.close()
+        del observations, terminal_observations, rewards, dones, truncated_flags, simpy_time_steps
+        buffers.close()
+        remote.close()
+
+
+class FoodDeliverySubprocVecEnv(VecEnv):
+    """
+    VecEnv do Stable-Baselines3 que distribui N simulações de entrega entre processos workers.
+
+    Cada worker executa um bloco contíguo de sub-ambientes em sequência e escreve observações, recompensas, dones e
+    as informações de passo diretamente em buffers de multiprocessing.shared_memory com o mesmo layout do
+    FoodDeliveryVecEnv (uma linha de observation_size por sub-ambiente). Pelos pipes passam apenas as ações e as
+    mensagens de controle, sem serializar observações a cada passo.
+
+    O Scenario é lido uma única vez no processo principal e repassado aos workers (herdado com o método de início
+    "fork", padrão onde disponível, ou serializado com "spawn"), sem reler o JSON. As sementes dos episódios vêm dos mesmos fluxos filhos de
+    SeedSequence(seed) do FoodDeliveryVecEnv, então os dois produzem os mesmos resultados para a mesma semente.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        scenario_json_file_path: str | None = "",
+        reward_objective: int = 1,
+        mode: EnvMode = EnvMode.TRAINING,
+        flat_observation: bool = False,
+        eta_estimator: EtaEstimator | str = EtaEstimator.SAMPLED,
+        seed: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        start_method: Optional[str] = None,
+        scenario: Scenario | None = None,
+    ):
+        if num_envs <= 0:
+            raise ValueError("num_envs deve ser um inteiro positivo")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = min(num_workers, num_envs)
+        if num_workers <= 0:
+            raise ValueError("num_workers deve ser um inteiro positivo")
+        if start_method is None:
+            start_method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+
+        env_kwargs = dict(
+            scenario_json_file_path=scenario_json_file_path,
+            reward_objective=reward_objective,
+            mode=mode,
+            flat_observation=flat_observation,
+            eta_estimator=eta_estimator,
+            scenario=scenario,
+        )
+        # Carrega o cenário no processo principal antes de iniciar os workers e obtém os espaços e o layout da observação
+        env = FoodDeliveryGymEnv(**env_kwargs)
+        env_kwargs["scenario"] = env.scenario
+        self.flat_observation = flat_observation
+        self.observation_layout = env.observation_layout
+        self.buffers = _SharedBuffers(num_envs, env.observation_size, env.dtype_observation)
+        self.buf_obs = self.buffers.arrays["observations"]
+
+        # Blocos contíguos de sub-ambientes, o mais equilibrados possível entre os workers
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        self.worker_slices = [slice(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        ctx = mp.get_context(start_method)
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(num_workers)])
+        self.processes = []
+        for work_remote, remote, worker_slice in zip(self.work_remotes, self.remotes, self.worker_slices):
+            args = (
+                work_remote, remote, env_kwargs, worker_slice.start, worker_slice.stop,
+                num_envs, self.buffers.names, env.dtype_observation,
+            )
+            # daemon=True: se o processo principal terminar, os workers não ficam órfãos
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        self.waiting = False
+        self.closed = False
+        super().__init__(num_envs, env.observation_space, env.action_space)
+        self.metadata = env.metadata
+        self.seed(seed)
+
+    # ── Comunicação com os workers ───────────────────────────────────────
+
+    def _send_all(self, command: str, data_per_worker: Sequence[Any]) -> None:
+        for remote, data in zip(self.remotes, data_per_worker):
+            remote.send((command, data))
+
+    def _recv_all(self) -> List[Any]:
+        results = []
+        errors = []
+        for remote in self.remotes:
+            result, error = remote.recv()
+            results.append(result)
+            if error is not None:
+                errors.append(error)
+        if errors:
+            raise RuntimeError("Erro em um worker do FoodDeliverySubprocVecEnv:\n" + errors[0])
+        return results
+
+    def _call_workers(self, command: str, data_per_worker: Sequence[Any]) -> List[Any]:
+        self._send_all(command, data_per_worker)
+        return self._recv_all()
+
+    # ── Sementes ─────────────────────────────────────────────────────────
+
+    def seed(self, seed: Optional[int] = None) -> Sequence[Optional[int]]:
+        seeds_per_worker = self._call_workers("seed", [seed] * len(self.remotes))
+        self._seeds = [episode_seed for worker_seeds in seeds_per_worker for episode_seed in worker_seeds]
+        return self._seeds
+
+    # ── Interface VecEnv ─────────────────────────────────────────────────
+
+    def reset(self) -> VecEnvObs:
+        infos_per_worker = self._call_workers(
+            "reset",
+            [(self._seeds[worker_slice], self._options[worker_slice]) for worker_slice in self.worker_slices],
+        )
+        self.reset_infos = [info for worker_infos in infos_per_worker for info in worker_infos]
+
+        # Sementes e opções explícitas valem apenas para um reset
+        self._reset_seeds()
+        self._reset_options()
+        return self._obs_from_buf()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        actions = np.asarray(actions)
+        self._send_all("step", [actions[worker_slice] for worker_slice in self.worker_slices])
+        self.waiting = True
+
+    def step_wait(self) -> VecEnvStepReturn:
+        self._recv_all()
+        self.waiting = False
+
+        arrays = self.buffers.arrays
+        dones = arrays["dones"].copy()
+        truncated = arrays["truncated"]
+        simpy_time_step = arrays["simpy_time_step"]
+
+        # Reconstrói as infos a partir dos buffers, com as mesmas chaves de FoodDeliveryGymEnv.get_info e do SB3
+        infos = []
+        for env_idx in range(self.num_envs):
+            info = {"simpy_time_step": float(simpy_time_step[env_idx]), "TimeLimit.truncated": bool(truncated[env_idx])}
+            if dones[env_idx]:
+                info["terminal_observation"] = self._single_obs(arrays["terminal_observations"][env_idx].copy())
+            infos.append(info)
+
+        return self._obs_from_buf(), arrays["rewards"].copy(), dones, infos
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self.waiting:
+            for remote in self.remotes:
+                remote.recv()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for remote in self.remotes:
+            try:
+                remote.recv()
+            except EOFError:
+                pass
+        for process in self.processes:
+            process.join()
+        self.buf_obs = None
+        self.buffers.close()
+        self.closed = True
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> List[Any]:
+        return self._call_indexed("get_attr", lambda local_indices: (attr_name, local_indices), indices)
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        self._call_indexed("set_attr", lambda local_indices: (attr_name, value, local_indices), indices)
+
+    def env_method(self, method_name: str, *method_args, indices: VecEnvIndices = None, **method_kwargs) -> List[Any]:
+        return self._call_indexed(
+            "env_method", lambda local_indices: (method_name, method_args, method_kwargs, local_indices), indices
+        )
+
+    def env_is_wrapped(self, wrapper_class, indices: VecEnvIndices = None) -> List[bool]:
+        # Os sub-ambientes são FoodDeliveryGymEnv sem wrappers
+        return [False for _ in self._get_indices(indices)]
+
+    # ── Auxiliares ───────────────────────────────────────────────────────
+
+    def _call_indexed(self, command: str, make_data, indices: VecEnvIndices) -> List[Any]:
+        # Envia o comando ao worker de cada índice, com o índice local do sub-ambiente dentro do bloco do worker
+        results = []
+        for env_idx in self._get_indices(indices):
+            worker_idx = self._worker_of(env_idx)
+            remote = self.remotes[worker_idx]
+            remote.send((command, make_data([env_idx - self.worker_slices[worker_idx].start])))
+            result, error = remote.recv()
+            if error is not None:
+                raise RuntimeError("Erro em um worker do FoodDeliverySubprocVecEnv:\n" + error)
+            results.append(result[0])
+        return results
+
+    def _worker_of(self, env_idx: int) -> int:
+        for worker_idx, worker_slice in enumerate(self.worker_slices):
+            if worker_slice.start <= env_idx < worker_slice.stop:
+                return worker_idx
+        raise IndexError(f"Índice de sub-ambiente inválido: {env_idx}")
+
+    def _single_obs(self, observation: np.ndarray) -> VecEnvObs:
+        # Observação no formato do espaço de observação (vetor plano ou dict de campos)
+        if self.flat_observation:
+            return observation
+        return {key: observation[..., field] for key, field in self.observation_layout.items()}
+
+    def _obs_from_buf(self) -> VecEnvObs:
+        # O agente guarda a observação anterior enquanto os workers reescrevem o buffer, então devolve uma cópia
+        return self._single_obs(self.buf_obs.copy())
@@ -0,0 +1,156 @@
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import VecEnvIndices, VecEnvObs, VecEnvStepReturn
+
+from food_delivery_gym.main.environment.env_mode import EnvMode
+from food_delivery_gym.main.environment.eta_estimator import EtaEstimator
+from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
+from food_delivery_gym.main.scenarios.scenario import Scenario
+
+
+def spawn_episode_seed_rngs(seed: Optional[int], num_envs: int) -> List[np.random.Generator]:
+    # Um fluxo filho independente de SeedSequence(seed) por sub-ambiente, do qual são sorteadas as sementes dos episódios
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(num_envs)]
+
+
+def next_episode_seed(episode_seed_rng: np.random.Generator) -> int:
+    return int(episode_seed_rng.integers(np.iinfo(np.int64).max))
+
+
+class FoodDeliveryVecEnv(VecEnv):
+    """
+    VecEnv do Stable-Baselines3 que executa N simulações de entrega no mesmo processo.
+
+    Diferente do DummyVecEnv, não há wrappers entre o agente e os ambientes: cada FoodDeliveryGymEnv escreve a sua
+    observação diretamente na sua linha de um buffer (N, observation_size) pré-alocado, as recompensas vão para um
+    único array e os sub-ambientes que terminam são reiniciados automaticamente (a observação final fica em
+    info["terminal_observation"], como no SB3).
+
+    Cada sub-ambiente tem o seu fluxo de sementes, filho de SeedSequence(seed): cada episódio recebe uma semente
+    própria desse fluxo, então os sub-ambientes não compartilham o gerador de números aleatórios e a execução é
+    reprodutível a partir de uma única semente.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        scenario_json_file_path: str | None = "",
+        reward_objective: int = 1,
+        mode: EnvMode = EnvMode.TRAINING,
+        flat_observation: bool = False,
+        eta_estimator: EtaEstimator | str = EtaEstimator.SAMPLED,
+        seed: Optional[int] = None,
+        scenario: Scenario | None = None,
+    ):
+        if num_envs <= 0:
+            raise ValueError("num_envs deve ser um inteiro positivo")
+
+        self.envs: List[FoodDeliveryGymEnv] = [
+            FoodDeliveryGymEnv(
+                scenario_json_file_path=scenario_json_file_path,
+                reward_objective=reward_objective,
+                mode=mode,
+                flat_observation=flat_observation,
+                eta_estimator=eta_estimator,
+                scenario=scenario,
+            )
+            for _ in range(num_envs)
+        ]
+        env = self.envs[0]
+        super().__init__(num_envs, env.observation_space, env.action_space)
+        self.metadata = env.metadata
+
+        self.flat_observation = flat_observation
+        self.observation_layout = env.observation_layout
+
+        # Buffers pré-alocados, reaproveitados a cada passo
+        self.buf_obs = np.zeros((num_envs, env.observation_size), dtype=env.dtype_observation)
+        self.buf_rews = np.zeros((num_envs,), dtype=np.float32)
+        self.buf_dones = np.zeros((num_envs,), dtype=bool)
+        self.buf_infos: List[dict[str, Any]] = [{} for _ in range(num_envs)]
+        self.actions: Optional[np.ndarray] = None
+
+        self._episode_seed_rngs: List[np.random.Generator] = []
+        self.seed(seed)
+
+    # ── Sementes ─────────────────────────────────────────────────────────
+
+    def seed(self, seed: Optional[int] = None) -> Sequence[Optional[int]]:
+        self._episode_seed_rngs = spawn_episode_seed_rngs(seed, self.num_envs)
+        self._seeds = [self._next_episode_seed(env_idx) for env_idx in range(self.num_envs)]
+        return self._seeds
+
+    def _next_episode_seed(self, env_idx: int) -> int:
+        return next_episode_seed(self._episode_seed_rngs[env_idx])
+
+    # ── Interface VecEnv ─────────────────────────────────────────────────
+
+    def reset(self) -> VecEnvObs:
+        for env_idx, env in enumerate(self.envs):
+            seed = self._seeds[env_idx]
+            if seed is None:
+                seed = self._next_episode_seed(env_idx)
+            options = self._options[env_idx] or None
+            _, self.reset_infos[env_idx] = env.reset(seed=seed, options=options, observation_out=self.buf_obs[env_idx])
+
+        # Sementes e opções explícitas valem apenas para um reset
+        self._reset_seeds()
+        self._reset_options()
+        return self._obs_from_buf()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self.actions = actions
+
+    def step_wait(self) -> VecEnvStepReturn:
+        for env_idx, env in enumerate(self.envs):
+            observation_row = self.buf_obs[env_idx]
+            _, reward, terminated, truncated, info = env.step(int(self.actions[env_idx]), observation_out=observation_row)
+            self.buf_rews[env_idx] = reward
+            done = terminated or truncated
+            self.buf_dones[env_idx] = done
+            info["TimeLimit.truncated"] = truncated and not terminated
+
+            if done:
+                # A linha do buffer será sobrescrita pelo reset: guarda uma cópia da observação final
+                info["terminal_observation"] = self._single_obs(observation_row.copy())
+                _, self.reset_infos[env_idx] = env.reset(
+                    seed=self._next_episode_seed(env_idx), observation_out=observation_row
+                )
+            self.buf_infos[env_idx] = info
+
+        return self._obs_from_buf(), self.buf_rews.copy(), self.buf_dones.copy(), list(self.buf_infos)
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> List[Any]:
+        return [getattr(env, attr_name) for env in self._get_target_envs(indices)]
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        for env in self._get_target_envs(indices):
+            setattr(env, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices: VecEnvIndices = None, **method_kwargs) -> List[Any]:
+        return [getattr(env, method_name)(*method_args, **method_kwargs) for env in self._get_target_envs(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices: VecEnvIndices = None) -> List[bool]:
+        # Os sub-ambientes são FoodDeliveryGymEnv sem wrappers
+        return [False for _ in self._get_target_envs(indices)]
+
+    # ── Auxiliares ───────────────────────────────────────────────────────
+
+    def _get_target_envs(self, indices: VecEnvIndices) -> List[FoodDeliveryGymEnv]:
+        return [self.envs[i] for i in self._get_indices(indices)]
+
+    def _single_obs(self, observation: np.ndarray) -> VecEnvObs:
+        # Observação de um sub-ambiente no formato do espaço de observação (vetor plano ou dict de campos)
+        if self.flat_observation:
+            return observation
+        return {key: observation[..., field] for key, field in self.observation_layout.items()}
+
+    def _obs_from_buf(self) -> VecEnvObs:
+        # O agente guarda a observação anterior enquanto o buffer é reescrito no próximo passo, então devolve uma cópia
+        return self._single_obs(self.buf_obs.copy())
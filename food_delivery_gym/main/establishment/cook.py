@@ -1,13 +1,17 @@
+from collections import deque
+
 from simpy.core import SimTime
 
+from food_delivery_gym.main.base.types import Number
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.order.order import Order
 
 class Cook():
-    def __init__(self, enviroment: FoodDeliverySimpyEnv):
+    def __init__(self, enviroment: FoodDeliverySimpyEnv, id: Number = 0):
+        self.cook_id = id
         self.enviroment = enviroment
         self.is_cooking = False
-        self.orders_accepted: list[Order] = []
+        self.orders_accepted: deque[Order] = deque()
         self.overloaded_until: SimTime = 0
         self.current_order_duration: SimTime = 0
         self.order_list_duration: SimTime = 0
@@ -19,7 +23,7 @@ class Cook():
         return len(self.orders_accepted)
     
     def pop_order(self):
-        return self.orders_accepted.pop(0)
+        return self.orders_accepted.popleft()
     
     def get_overloaded_until(self):
         return self.overloaded_until
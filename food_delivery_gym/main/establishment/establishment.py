@@ -1,7 +1,9 @@
-from typing import List
+import heapq
+from collections import deque
+from typing import List, Optional
 
 from simpy.core import SimTime
-from simpy.events import ProcessGenerator
+from simpy.events import Event, ProcessGenerator
 
 from food_delivery_gym.main.actors.map_actor import MapActor
 from food_delivery_gym.main.base.types import Coordinate, Number
@@ -16,9 +18,13 @@ from food_delivery_gym.main.events.time_for_agent_allocate_driver import TimeFor
 from food_delivery_gym.main.order.order import Order
 from food_delivery_gym.main.order.order_status import OrderStatus
 from food_delivery_gym.main.establishment.catalog import Catalog
+from food_delivery_gym.main.utils.random_stream import RandomStream
 
 
 class Establishment(MapActor):
+
+    RANDOM_STREAM = RandomStream.KITCHEN_TIMES
+
     def __init__(
             self,
             id: Number,
@@ -40,18 +46,28 @@ class Establishment(MapActor):
         self.use_estimate = use_estimate
         self.orders_in_preparation: int = 0
 
-        self.order_requests: List[Order] = []
+        self.order_requests: deque[Order] = deque()
         self.orders_rejected: List[Order] = []
+        #   Sinais que acordam os laços de recebimento e de preparo quando estão dormindo por falta de trabalho
+        self.order_requests_signal: Optional[Event] = None
+        self.accepted_orders_signal: Optional[Event] = None
         
         self.num_cooks = production_capacity
         # Cria uma lista de instâncias de Cook
-        self.cooks: list[Cook] = [Cook(self.environment) for _ in range(self.num_cooks)]
+        self.cooks: list[Cook] = [Cook(self.environment, id=i) for i in range(self.num_cooks)]
+        #   Heap mínimo de (overloaded_until, cook_id) usado para escolher o cozinheiro disponível. As entradas são
+        # invalidadas de forma preguiçosa: uma entrada só vale se ainda corresponder ao overloaded_until do cozinheiro
+        self.cooks_heap: list[tuple[SimTime, int]] = [(cook.get_overloaded_until(), cook.cook_id) for cook in self.cooks]
+        heapq.heapify(self.cooks_heap)
 
         # Variáveis para estatísticas
         self.orders_fulfilled: Number = 0
         self.max_orders_in_queue: Number = 0
         self.idle_time: Number = 0
         self.active_time: Number = 0
+        # Estado (ativo/ocioso) observado pelas estatísticas e o valor de environment.statistics_ticks em que ele começou
+        self.is_active_for_statistics: bool = False
+        self.activity_since_tick: int = self.environment.statistics_ticks
 
         self.process(self.process_order_requests())
         self.process(self.process_accepted_orders())
@@ -63,20 +79,36 @@ class Establishment(MapActor):
         """
         return {
             "orders_fulfilled":    self.orders_fulfilled,
-            "idle_time":           self.idle_time,
-            "active_time":         self.active_time,
+            "idle_time":           self.get_idle_time(),
+            "active_time":         self.get_active_time(),
             "max_orders_in_queue": self.max_orders_in_queue,
         }
 
     def receive_order_requests(self, orders: List[Order]) -> None:
-        self.order_requests += orders
+        self.order_requests.extend(orders)
+        if self.order_requests:
+            self.wake_up(self.order_requests_signal)
+
+    def wake_up(self, signal: Optional[Event]) -> None:
+        if signal is not None and not signal.triggered:
+            signal.succeed()
 
     def process_order_requests(self) -> ProcessGenerator:
         while True:
             while self.order_requests:
-                order = self.order_requests.pop(0)
+                order = self.order_requests.popleft()
                 self.process(self.process_order_request(order))
-            yield self.timeout(self.time_to_process_order_requests())
+            next_check = self.now + self.time_to_process_order_requests()
+
+            #   Com a fila vazia o laço dorme até receive_order_requests acordá-lo, em vez de verificar a fila a cada
+            # 1-4 minutos. As verificações puladas teriam encontrado a fila vazia: os seus intervalos são sorteados ao
+            # acordar, e o pedido espera pela mesma verificação que o laço de polling faria
+            self.order_requests_signal = self.environment.event()
+            yield self.order_requests_signal
+            self.order_requests_signal = None
+            while next_check < self.now:
+                next_check += self.time_to_process_order_requests()
+            yield self.timeout(next_check - self.now)
 
     def process_order_request(self, order) -> ProcessGenerator:
         yield self.timeout(self.time_to_accept_or_reject_order(order))
@@ -96,9 +128,13 @@ class Establishment(MapActor):
         available_cook = self.get_available_cook()
 
         available_cook.update_overload_time(estimated_time)
+        self.push_cook(available_cook)
         order.establishment_accepted(self.now, estimated_time, available_cook.get_overloaded_until())
 
         available_cook.add_order_to_list(order)
+        self.update_statistics_state()
+        if not available_cook.get_is_cooking():
+            self.wake_up(self.accepted_orders_signal)
 
         total_orders_in_queue = 0
         for cook in self.cooks:
@@ -147,24 +183,41 @@ class Establishment(MapActor):
         self.orders_rejected.append(order)
 
     def process_accepted_orders(self) -> ProcessGenerator:
+        cook_index = 0
         while True:
-            for cook in self.cooks:
-                if cook.get_length_orders_accepted() > 0 and not cook.get_is_cooking():
-                    order = cook.pop_order()
-                    cook.update_overload_time(order.estimated_preparation_duration, True)
-
-                    updated_estimated_time = None
-                    if cook.get_length_orders_accepted() == 0:
-                        updated_estimated_time = cook.get_overloaded_until()
-                    else:
-                        updated_estimated_time = self.now + order.estimated_preparation_duration
-                    
-                    cook.set_is_cooking(True)
-                    self.orders_in_preparation += 1
-                    order.preparation_started(self.now, updated_estimated_time)
-                    self.process(self.prepare_order(cook, order))
-
-                yield self.timeout(self.time_check_to_start_preparation())
+            cook = self.cooks[cook_index]
+            if cook.get_length_orders_accepted() > 0 and not cook.get_is_cooking():
+                order = cook.pop_order()
+                cook.update_overload_time(order.estimated_preparation_duration, True)
+                self.push_cook(cook)
+
+                updated_estimated_time = None
+                if cook.get_length_orders_accepted() == 0:
+                    updated_estimated_time = cook.get_overloaded_until()
+                else:
+                    updated_estimated_time = self.now + order.estimated_preparation_duration
+                
+                cook.set_is_cooking(True)
+                self.orders_in_preparation += 1
+                order.preparation_started(self.now, updated_estimated_time)
+                self.process(self.prepare_order(cook, order))
+
+            cook_index = (cook_index + 1) % self.num_cooks
+            next_check = self.now + self.time_check_to_start_preparation()
+
+            #   Sem cozinheiro livre com pedidos na fila o laço dorme até accept_order ou finish_order acordá-lo. Ao
+            # acordar, avança pelas verificações puladas sorteando os seus intervalos, como o laço de polling faria
+            if not self.has_order_waiting_for_cook():
+                self.accepted_orders_signal = self.environment.event()
+                yield self.accepted_orders_signal
+                self.accepted_orders_signal = None
+                while next_check < self.now:
+                    next_check += self.time_check_to_start_preparation()
+                    cook_index = (cook_index + 1) % self.num_cooks
+            yield self.timeout(next_check - self.now)
+
+    def has_order_waiting_for_cook(self) -> bool:
+        return any(cook.get_length_orders_accepted() > 0 and not cook.get_is_cooking() for cook in self.cooks)
 
     def prepare_order(self, cook, order) -> ProcessGenerator:
         self.publish_event(EstablishmentPreparingOrder(
@@ -214,9 +267,11 @@ class Establishment(MapActor):
         )
         self.publish_event(event)
         order.ready(self.now)
+        self.environment.state.increment_orders_ready()
 
         cook.set_is_cooking(False)
         self.orders_in_preparation -= 1
+        self.update_statistics_state()
         cook.set_current_order_duration(0)
         self.orders_fulfilled += 1
 
@@ -227,17 +282,33 @@ class Establishment(MapActor):
         if not self.use_estimate:
             self.environment.add_ready_order(order, event)
 
+        if cook.get_length_orders_accepted() > 0:
+            self.wake_up(self.accepted_orders_signal)
+
     def update_overload_time_cooks(self) -> None:
         for i in range(0, self.num_cooks):
             self.cooks[i].update_overload_time()
 
-    def get_available_cook(self):
-        self.update_overload_time_cooks()
-        available_cook_index = 0
-        for i in range(1, self.num_cooks):
-            if self.cooks[i].get_overloaded_until() < self.cooks[available_cook_index].get_overloaded_until():
-                available_cook_index = i
-        return self.cooks[available_cook_index]
+    def push_cook(self, cook: Cook) -> None:
+        # Registra o novo overloaded_until do cozinheiro no heap, reconstruindo-o caso acumule muitas entradas inválidas
+        heapq.heappush(self.cooks_heap, (cook.get_overloaded_until(), cook.cook_id))
+        if len(self.cooks_heap) > 4 * self.num_cooks:
+            self.cooks_heap = [(c.get_overloaded_until(), c.cook_id) for c in self.cooks]
+            heapq.heapify(self.cooks_heap)
+
+    def get_available_cook(self) -> Cook:
+        #   Retorna o cozinheiro com o menor overloaded_until. Entradas desatualizadas são substituídas pelo valor atual
+        # e ocupações que já passaram são levadas ao momento atual conforme chegam ao topo do heap, de modo que os
+        # empates sejam resolvidos pelo menor índice, como na antiga busca linear
+        while True:
+            overloaded_until, cook_id = self.cooks_heap[0]
+            cook = self.cooks[cook_id]
+            if overloaded_until < self.now:
+                cook.update_overload_time()
+            if overloaded_until != cook.get_overloaded_until():
+                heapq.heapreplace(self.cooks_heap, (cook.get_overloaded_until(), cook_id))
+            else:
+                return cook
 
 
     def is_empty(self) -> bool:
@@ -253,29 +324,46 @@ class Establishment(MapActor):
         return not self.is_empty() or self.orders_in_preparation > 0
 
     def time_to_process_order_requests(self) -> SimTime:
-        return self.rng.integers(1, 5)
+        return self.sampler.integers(1, 5)
 
     def time_to_accept_or_reject_order(self, order: Order) -> SimTime:
-        return self.rng.integers(1, 5)
+        return self.sampler.integers(1, 5)
 
     def time_check_to_start_preparation(self) -> SimTime:
-        return self.rng.integers(1, 5)
+        return self.sampler.integers(1, 5)
 
     def time_estimate_to_prepare_order(self) -> SimTime:
-        return self.rng.integers(8, 20)
+        return self.sampler.integers(8, 20)
 
     def time_to_prepare_order(self, estimated_time: SimTime) -> SimTime:
         # Não faz sentido o tempo de preparo ser menor que 1
-        return max(1, estimated_time + self.rng.integers(-5, 5))
+        return max(1, estimated_time + self.sampler.integers(-5, 5))
 
     def condition_to_accept(self, order) -> bool:
         return self.available
     
-    def update_statistics_variables(self):
-        if self.is_active():
-            self.active_time += 1
+    def update_statistics_state(self) -> None:
+        # Chamado quando o estabelecimento pode ter mudado entre ativo e ocioso: soma os passos de tempo do estado que terminou
+        is_active = self.is_active()
+        if is_active == self.is_active_for_statistics:
+            return
+        elapsed = self.environment.statistics_ticks - self.activity_since_tick
+        if self.is_active_for_statistics:
+            self.active_time += elapsed
         else:
-            self.idle_time += 1
+            self.idle_time += elapsed
+        self.is_active_for_statistics = is_active
+        self.activity_since_tick = self.environment.statistics_ticks
+
+    def get_active_time(self) -> Number:
+        if self.is_active_for_statistics:
+            return self.active_time + self.environment.statistics_ticks - self.activity_since_tick
+        return self.active_time
+
+    def get_idle_time(self) -> Number:
+        if not self.is_active_for_statistics:
+            return self.idle_time + self.environment.statistics_ticks - self.activity_since_tick
+        return self.idle_time
 
     def get_coordinate(self) -> Coordinate:
         return self.coordinate
\ No newline at end of file
@@ -42,6 +42,6 @@ class EstablishmentOrderRate(Establishment):
         self.b = 7 - self.a
 
     def time_estimate_to_prepare_order(self) -> SimTime:
-        sample = self.rng.beta(self.a, self.b)
+        sample = self.sampler.beta(self.a, self.b)
         estimated_time = self.min_prepare_time + (self.max_prepare_time - self.min_prepare_time) * sample
         return round(estimated_time)
@@ -3,6 +3,8 @@ from food_delivery_gym.main.events.order_event import OrderEvent
 
 
 class CustomerPlacedOrder(OrderEvent):
+    __slots__ = ()
+
     def __init__(self, order, customer_id, establishment_id, time):
         super().__init__(order, customer_id, establishment_id, time, EventType.CUSTOMER_PLACED_ORDER)
 
@@ -3,6 +3,8 @@ from food_delivery_gym.main.events.order_event import OrderEvent
 
 
 class DriverAcceptedDelivery(OrderEvent):
+    __slots__ = ("driver_id",)
+
     def __init__(self, order, customer_id, establishment_id, driver_id, time):
         super().__init__(order, customer_id, establishment_id, time, EventType.DRIVER_ACCEPTED_DELIVERY)
         self.driver_id = driver_id
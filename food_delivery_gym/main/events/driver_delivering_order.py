@@ -3,6 +3,8 @@ from food_delivery_gym.main.events.order_event import OrderEvent
 
 
 class DriverDeliveringOrder(OrderEvent):
+    __slots__ = ("driver_id", "distance")
+
     def __init__(self, order, customer_id, establishment_id, driver_id, distance, time):
         super().__init__(order, customer_id, establishment_id, time, EventType.DRIVER_DELIVERING_ORDER)
         self.driver_id = driver_id
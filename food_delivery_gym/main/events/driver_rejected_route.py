@@ -3,6 +3,8 @@ from food_delivery_gym.main.events.route_event import RouteEvent
 
 
 class DriverRejectedRoute(RouteEvent):
+    __slots__ = ()
+
     def __init__(self, driver_id, route_id, time):
         super().__init__(driver_id, route_id, time, EventType.DRIVER_REJECTED_ROUTE)
 
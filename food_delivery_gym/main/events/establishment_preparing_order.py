@@ -3,6 +3,8 @@ from food_delivery_gym.main.events.order_event import OrderEvent
 
 
 class EstablishmentPreparingOrder(OrderEvent):
+    __slots__ = ()
+
     def __init__(self, order, customer_id, establishment_id, time):
         super().__init__(order, customer_id, establishment_id, time, EventType.ESTABLISHMENT_PREPARING_ORDER)
 
@@ -3,6 +3,8 @@ from food_delivery_gym.main.events.order_event import OrderEvent
 
 
 class EstimatedOrderPreparationTime(OrderEvent):
+    __slots__ = ("estimated_time",)
+
     def __init__(self, order, customer_id, establishment_id, estimated_time, time):
         super().__init__(order, customer_id, establishment_id, time, EventType.ESTIMATED_ORDER_PREPARATION_TIME)
         self.estimated_time = estimated_time
@@ -0,0 +1,154 @@
+from array import array
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from food_delivery_gym.main.events.event_log_policy import EventLogPolicy
+from food_delivery_gym.main.events.event_type import EventType
+
+# Valor usado nas colunas de IDs quando o evento não possui aquele ator
+MISSING_ID = -1
+
+
+class EventRecord(NamedTuple):
+    time: float
+    event_type: EventType
+    order_id: Optional[int]
+    driver_id: Optional[int]
+    establishment_id: Optional[int]
+
+    def __str__(self):
+        return (f"{self.event_type.name} in time {self.time} "
+                f"(order={self.order_id}, driver={self.driver_id}, establishment={self.establishment_id})")
+
+
+class EventLog:
+    """
+    Log de eventos do ambiente armazenado em colunas tipadas (array.array), em vez de uma lista de objetos.
+
+    Cada evento ocupa uma posição em cada coluna: tempo (float64), código do EventType (int8),
+    ID do pedido (int64), ID do motorista e ID do estabelecimento (int32). IDs ausentes são
+    gravados como MISSING_ID. A política define se os eventos são descartados (OFF), mantidos
+    em um buffer circular de tamanho fixo (RING) ou mantidos integralmente (FULL).
+    """
+
+    DEFAULT_RING_CAPACITY = 10_000
+
+    _COLUMNS = (
+        ("_times", "d", np.float64),
+        ("_type_codes", "b", np.int8),
+        ("_order_ids", "q", np.int64),
+        ("_driver_ids", "i", np.int32),
+        ("_establishment_ids", "i", np.int32),
+    )
+
+    def __init__(self, policy: EventLogPolicy = EventLogPolicy.FULL, capacity: int = DEFAULT_RING_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("A capacidade do log de eventos deve ser positiva.")
+        self.policy = policy
+        self.capacity = capacity
+        self.clear()
+
+    def set_policy(self, policy: EventLogPolicy, capacity: Optional[int] = None) -> None:
+        """Altera a política de armazenamento, descartando os eventos registrados até aqui."""
+        if capacity is not None:
+            if capacity <= 0:
+                raise ValueError("A capacidade do log de eventos deve ser positiva.")
+            self.capacity = capacity
+        self.policy = policy
+        self.clear()
+
+    def clear(self) -> None:
+        # Total de eventos registrados, incluindo os já sobrescritos no buffer circular
+        self.total_events = 0
+
+        size = self.capacity if self.policy == EventLogPolicy.RING else 0
+        for attr, typecode, _ in self._COLUMNS:
+            column = array(typecode)
+            if size:
+                column.frombytes(bytes(size * column.itemsize))
+            setattr(self, attr, column)
+
+    def append(self, event) -> None:
+        policy = self.policy
+        if policy == EventLogPolicy.OFF:
+            return
+
+        order = getattr(event, "order", None)
+        order_id = order.order_id if order is not None else MISSING_ID
+        driver_id = getattr(event, "driver_id", None)
+        establishment_id = getattr(event, "establishment_id", None)
+        if driver_id is None:
+            driver_id = MISSING_ID
+        if establishment_id is None:
+            establishment_id = MISSING_ID
+
+        if policy == EventLogPolicy.FULL:
+            self._times.append(event.time)
+            self._type_codes.append(event.event_type.value)
+            self._order_ids.append(order_id)
+            self._driver_ids.append(driver_id)
+            self._establishment_ids.append(establishment_id)
+        else:
+            idx = self.total_events % self.capacity
+            self._times[idx] = event.time
+            self._type_codes[idx] = event.event_type.value
+            self._order_ids[idx] = order_id
+            self._driver_ids[idx] = driver_id
+            self._establishment_ids[idx] = establishment_id
+
+        self.total_events += 1
+
+    def __len__(self) -> int:
+        if self.policy == EventLogPolicy.RING:
+            return min(self.total_events, self.capacity)
+        return len(self._times)
+
+    def _column(self, values: array, dtype) -> np.ndarray:
+        #   Sempre devolve uma cópia: manter uma view do buffer impediria o array.array de crescer
+        # (BufferError) enquanto a view existisse. No buffer circular, a cópia já sai em ordem cronológica.
+        n = len(self)
+        if n == 0:
+            return np.empty(0, dtype=dtype)
+        column = np.frombuffer(values, dtype=dtype)
+        if self.policy == EventLogPolicy.RING:
+            if self.total_events > self.capacity:
+                start = self.total_events % self.capacity
+                return np.concatenate((column[start:], column[:start]))
+            return column[:n].copy()
+        return column.copy()
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._column(self._times, np.float64)
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        """Códigos dos eventos, iguais a EventType.value."""
+        return self._column(self._type_codes, np.int8)
+
+    @property
+    def order_ids(self) -> np.ndarray:
+        return self._column(self._order_ids, np.int64)
+
+    @property
+    def driver_ids(self) -> np.ndarray:
+        return self._column(self._driver_ids, np.int32)
+
+    @property
+    def establishment_ids(self) -> np.ndarray:
+        return self._column(self._establishment_ids, np.int32)
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        def optional_id(value):
+            return None if value == MISSING_ID else int(value)
+
+        columns = zip(self.times, self.type_codes, self.order_ids, self.driver_ids, self.establishment_ids)
+        for time, code, order_id, driver_id, establishment_id in columns:
+            yield EventRecord(
+                float(time),
+                EventType(int(code)),
+                optional_id(order_id),
+                optional_id(driver_id),
+                optional_id(establishment_id),
+            )
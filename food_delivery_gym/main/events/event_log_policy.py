@@ -0,0 +1,10 @@
+from enum import Enum, auto
+
+
+class EventLogPolicy(Enum):
+    # Nenhum evento é armazenado (ex.: treinamento, onde ninguém lê o log)
+    OFF = auto()
+    # Apenas os últimos `capacity` eventos são mantidos, em um buffer circular pré-alocado
+    RING = auto()
+    # Todos os eventos do episódio são mantidos (necessário para estatísticas e boards)
+    FULL = auto()
@@ -2,6 +2,8 @@ from food_delivery_gym.main.events.event import Event
 
 
 class OrderEvent(Event):
+    __slots__ = ("order", "customer_id", "establishment_id")
+
     def __init__(self, order, customer_id, establishment_id, time, event_type):
         super().__init__(time, event_type)
         self.order = order
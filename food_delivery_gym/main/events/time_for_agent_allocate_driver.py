@@ -4,6 +4,8 @@ from food_delivery_gym.main.order.order import Order
 
 
 class TimeForAgentAllocateDriver(Event):
+    __slots__ = ("order", "customer_id", "establishment_id")
+
     def __init__(self, order: Order, customer_id: int, establishment_id: int, time):
         super().__init__(time, EventType.TIME_FOR_AGENT_ALLOCATE_DRIVER)
         self.order: Order = order
@@ -2,11 +2,20 @@ from abc import abstractmethod, ABC
 
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.utils.random_manager import RandomManager
+from food_delivery_gym.main.utils.random_stream import RandomStream
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 
 class Generator(ABC):
 
-    def __init__(self):
-        self.rng = RandomManager().get_random_instance()
+    RANDOM_STREAM = RandomStream.SETUP # Fluxo aleatório usado pelo gerador
+
+    def __init__(self, random_streams: RandomStreams | None = None):
+        #   Os geradores são criados antes do ambiente SimPy (alguns sorteiam já no construtor), então recebem os fluxos
+        # da simulação diretamente. Sem fluxos próprios, usam o gerador global do RandomManager
+        if random_streams is None:
+            random_streams = RandomStreams.from_generator(RandomManager().get_random_instance())
+        self.random_streams = random_streams
+        self.rng = random_streams.get(self.RANDOM_STREAM)
 
     @abstractmethod
     def generate(self, env: FoodDeliverySimpyEnv): pass
\ No newline at end of file
@@ -2,11 +2,12 @@ from food_delivery_gym.main.driver.driver import DriverStatus
 from food_delivery_gym.main.driver.dynamic_route_driver import DynamicRouteDriver
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.generator.initial_generator import InitialGenerator
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 
 
 class InitialDynamicRouteDriverGenerator(InitialGenerator):
-    def __init__(self, num_drivers, vel_drivers, tolerance_percentage, max_capacity, reward_objective):
-        super().__init__()
+    def __init__(self, num_drivers, vel_drivers, tolerance_percentage, max_capacity, reward_objective, random_streams: RandomStreams | None = None):
+        super().__init__(random_streams)
         self.num_drivers = num_drivers
         self.vel_drivers = vel_drivers
         self.tolerance_percentage = tolerance_percentage
@@ -4,20 +4,27 @@ from food_delivery_gym.main.generator.initial_generator import InitialGenerator
 from food_delivery_gym.main.order.item import Item
 from food_delivery_gym.main.establishment.catalog import Catalog
 from food_delivery_gym.main.establishment.establishment_order_rate import EstablishmentOrderRate
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 
 
 class InitialEstablishmentOrderRateGenerator(InitialGenerator):
-    def __init__(self, num_establishments, prepare_time, operating_radius, production_capacity, percentage_allocation_driver):
-        super().__init__()
+    def __init__(self, num_establishments, prepare_time, operating_radius, production_capacity, percentage_allocation_driver, catalog: Catalog | None = None, random_streams: RandomStreams | None = None):
+        super().__init__(random_streams)
         self.num_establishments = num_establishments
         self.prepare_time = prepare_time
         self.operating_radius = operating_radius
         self.production_capacity = production_capacity
         self.percentage_allocation_driver = percentage_allocation_driver
+        # O catálogo não é alterado durante a simulação, então pode ser compartilhado entre episódios
+        self.catalog = catalog if catalog is not None else self.create_catalog()
 
-    def run(self, env: FoodDeliverySimpyEnv):
+    @staticmethod
+    def create_catalog() -> Catalog:
         dimension = Dimensions(1, 1, 1, 1)
-        catalog = Catalog([Item(f"type_{i}", dimension, 4) for i in range(5)])
+        return Catalog([Item(f"type_{i}", dimension, 4) for i in range(5)])
+
+    def run(self, env: FoodDeliverySimpyEnv):
+        catalog = self.catalog
         establishment = [
             EstablishmentOrderRate(
                 id=i+1,
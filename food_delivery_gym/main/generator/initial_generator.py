@@ -2,12 +2,13 @@ from abc import abstractmethod, ABC
 
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.generator.generator import Generator
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 
 
 class InitialGenerator(Generator, ABC):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, random_streams: RandomStreams | None = None):
+        super().__init__(random_streams)
 
     @abstractmethod
     def run(self, env: FoodDeliverySimpyEnv): pass
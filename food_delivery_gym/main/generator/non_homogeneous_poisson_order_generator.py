@@ -1,5 +1,6 @@
 import numpy as np
 from food_delivery_gym.main.generator.poisson_order_generator import PoissonOrderGenerator
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 
 
 class NonHomogeneousPoissonOrderGenerator(PoissonOrderGenerator):
@@ -16,38 +17,61 @@ class NonHomogeneousPoissonOrderGenerator(PoissonOrderGenerator):
         Função que recebe o tempo e retorna a taxa de chegada naquele momento.
     max_rate : float, optional
         Taxa máxima do processo. Se None, é estimada automaticamente.
+    random_streams : RandomStreams, optional
+        Fluxos aleatórios da simulação (ver PoissonOrderGenerator).
     """
 
     def __init__(self, estimated_num_orders: int, time_window: float,
-                 rate_function: callable, max_rate: float = None):
+                 rate_function: callable, max_rate: float = None, random_streams: RandomStreams | None = None):
         self.rate_function = rate_function
         if max_rate is None:
-            n_samples = max(500, int(time_window * 20))
-            time_samples = np.linspace(0, time_window, n_samples)
-            rates = [rate_function(t) for t in time_samples]
-            self.max_rate = max(rates) * 1.1 # margem de segurança
+            self.max_rate = self.estimate_max_rate(rate_function, time_window)
         else:
             self.max_rate = max_rate
 
-        super().__init__(estimated_num_orders, time_window, lambda_rate=None)
+        super().__init__(estimated_num_orders, time_window, lambda_rate=None, random_streams=random_streams)
+
+    @staticmethod
+    def estimate_max_rate(rate_function: callable, time_window: float) -> float:
+        #   Amostra a função de taxa ao longo da janela de tempo. Não depende do gerador aleatório, então quem cria um
+        # gerador por episódio pode calcular a taxa uma única vez e repassá-la em max_rate
+        n_samples = max(500, int(time_window * 20))
+        time_samples = np.linspace(0, time_window, n_samples)
+        rates = NonHomogeneousPoissonOrderGenerator.evaluate_rate_function(rate_function, time_samples)
+        return float(rates.max()) * 1.1 # margem de segurança
+
+    @staticmethod
+    def evaluate_rate_function(rate_function: callable, times: np.ndarray) -> np.ndarray:
+        #   Avalia a função de taxa em todos os instantes com uma única chamada quando ela aceita arrays (ex.: compilada
+        # com funções do NumPy). Funções escritas para escalares (math.exp, min, condicionais) levantam TypeError ou
+        # ValueError ao receber um array; só nesse caso recorre à avaliação ponto a ponto, que propaga qualquer erro
+        # da própria função
+        try:
+            rates = np.asarray(rate_function(times), dtype=float)
+        except (TypeError, ValueError):
+            rates = None
+        if rates is not None and rates.ndim == 0:
+            rates = np.full(times.shape, float(rates))
+        if rates is None or rates.shape != times.shape:
+            rates = np.fromiter((rate_function(t) for t in times.tolist()), dtype=float, count=len(times))
+
+        invalid = ~np.isfinite(rates) | (rates < 0)
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            raise ValueError(
+                f"A função de taxa deve retornar valores finitos e não negativos, "
+                f"mas retornou {rates[i]} em t={times[i]}."
+            )
+        return rates
 
     def get_rate_function(self):
         return self.rate_function
 
     def generate_arrival_times(self) -> list:
-        arrival_times = []
-        current_time = 0
-
-        while current_time < self.time_window:
-            interarrival = self.rng.exponential(1.0 / self.max_rate)
-            current_time += interarrival
-            if current_time > self.time_window:
-                break
-
-            acceptance_prob = self.rate_function(current_time) / self.max_rate
-            # Clamp garante validade mesmo se a rate_function tiver comportamento inesperado
-            acceptance_prob = min(acceptance_prob, 1.0)
-            if self.rng.random() < acceptance_prob:
-                arrival_times.append(current_time)
-
-        return arrival_times
\ No newline at end of file
+        # Thinning: candidatos do processo homogêneo com taxa max_rate, aceitos com probabilidade rate(t) / max_rate
+        candidates = self.generate_poisson_times(self.max_rate)
+        acceptance_prob = self.evaluate_rate_function(self.rate_function, candidates) / self.max_rate
+        # Clamp garante validade mesmo se a rate_function tiver comportamento inesperado
+        acceptance_prob = np.minimum(acceptance_prob, 1.0)
+        accepted = self.arrival_rng.random(len(candidates)) < acceptance_prob
+        return candidates[accepted].tolist()
\ No newline at end of file
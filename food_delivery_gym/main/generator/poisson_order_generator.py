@@ -1,9 +1,11 @@
 import numpy as np
-from food_delivery_gym.main.base.geometry import point_in_gauss_circle
+from food_delivery_gym.main.base.geometry import points_in_gauss_circle
 from food_delivery_gym.main.customer.customer import Customer
 from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
 from food_delivery_gym.main.generator.generator import Generator
 from food_delivery_gym.main.order.order import Order
+from food_delivery_gym.main.utils.random_stream import RandomStream
+from food_delivery_gym.main.utils.random_streams import RandomStreams
 
 
 class PoissonOrderGenerator(Generator):
@@ -19,10 +21,16 @@ class PoissonOrderGenerator(Generator):
     lambda_rate : float, optional
         Taxa média de chegada (pedidos por unidade de tempo).
         Se None, será calculada como estimated_num_orders / time_window.
+    random_streams : RandomStreams, optional
+        Fluxos aleatórios da simulação. Os instantes de chegada usam ORDER_ARRIVALS e os pedidos (estabelecimento,
+        posição do cliente e itens) usam CUSTOMER_PLACEMENT.
     """
 
-    def __init__(self, estimated_num_orders: int, time_window: float, lambda_rate: float = None):
-        super().__init__()
+    RANDOM_STREAM = RandomStream.CUSTOMER_PLACEMENT
+
+    def __init__(self, estimated_num_orders: int, time_window: float, lambda_rate: float = None, random_streams: RandomStreams | None = None):
+        super().__init__(random_streams)
+        self.arrival_rng = self.random_streams.get(RandomStream.ORDER_ARRIVALS)
 
         if estimated_num_orders <= 0:
             raise ValueError("estimated_num_orders deve ser maior que 0")
@@ -40,36 +48,68 @@ class PoissonOrderGenerator(Generator):
     def get_number_of_orders_generated(self) -> int:
         return len(self.arrival_times)
 
-    # Geração de chegadas (Poisson homogêneo)
-    def generate_arrival_times(self) -> list:
-        arrival_times = []
-        current_time = 0
+    def generate_poisson_times(self, rate: float) -> np.ndarray:
+        #   Instantes de um processo de Poisson homogêneo com a taxa informada até o fim da janela de tempo. Os
+        # intervalos exponenciais são sorteados em blocos dimensionados pela contagem esperada (com folga de alguns
+        # desvios-padrão), então quase sempre basta um único bloco. A soma acumulada parte do último instante do
+        # bloco anterior, o que reproduz exatamente a soma sequencial de um sorteio por vez
+        blocks = []
+        current_time = 0.0
 
         while current_time < self.time_window:
-            interarrival = self.rng.exponential(1.0 / self.lambda_rate)
-            current_time += interarrival
-            if current_time <= self.time_window:
-                arrival_times.append(current_time)
+            expected = rate * (self.time_window - current_time)
+            block_size = int(expected + 4 * np.sqrt(expected)) + 16
+            interarrivals = self.arrival_rng.exponential(1.0 / rate, size=block_size)
+            block = np.cumsum(np.concatenate(([current_time], interarrivals)))[1:]
+            blocks.append(block)
+            current_time = block[-1]
+
+        times = np.concatenate(blocks)
+        return times[:np.searchsorted(times, self.time_window, side="right")]
 
-        return arrival_times
+    # Geração de chegadas (Poisson homogêneo)
+    def generate_arrival_times(self) -> list:
+        return self.generate_poisson_times(self.lambda_rate).tolist()
+
+    def sample_orders(self, env: FoodDeliverySimpyEnv) -> list:
+        #   Sorteia em lote, para todas as chegadas do episódio, o estabelecimento, a posição do cliente e os dois itens
+        # de cada pedido. Depende dos estabelecimentos já criados pelos geradores iniciais, por isso é chamado no
+        # início de generate e não no construtor
+        establishments = env.state.establishments
+        num_orders = len(self.arrival_times)
+
+        establishment_indices = self.rng.integers(len(establishments), size=num_orders)
+        chosen = [establishments[i] for i in establishment_indices.tolist()]
+
+        coordinates = points_in_gauss_circle(
+            [establishment.coordinate for establishment in chosen],
+            [establishment.operating_radius for establishment in chosen],
+            env.map.size,
+            self.rng
+        ).tolist()
+
+        #   Dois itens distintos do catálogo, equivalente a rng.choice(items, size=2, replace=False): o segundo índice é
+        # sorteado entre os itens restantes e deslocado para pular o primeiro
+        catalog_sizes = np.array([len(establishment.catalog.items) for establishment in chosen], dtype=np.int64)
+        first = self.rng.integers(catalog_sizes)
+        second = self.rng.integers(catalog_sizes - 1)
+        second += second >= first
+
+        return [
+            (establishment, tuple(coordinate), [establishment.catalog.items[i], establishment.catalog.items[j]])
+            for establishment, coordinate, i, j in zip(chosen, coordinates, first.tolist(), second.tolist())
+        ]
 
     # Lógica de criação dos pedidos
-    def process_establishment(self, env: FoodDeliverySimpyEnv, establishment):
+    def process_establishment(self, env: FoodDeliverySimpyEnv, establishment, coordinate, items):
         customer = Customer(
             id=self.current_order_id,
             environment=env,
-            coordinate=point_in_gauss_circle(
-                establishment.coordinate,
-                establishment.operating_radius,
-                env.map.size,
-                self.rng
-            ),
+            coordinate=coordinate,
             available=True,
             single_order=True
         )
 
-        items = self.rng.choice(establishment.catalog.items, size=2, replace=False).tolist()
-
         order = Order(
             id=self.current_order_id,
             customer=customer,
@@ -85,11 +125,12 @@ class PoissonOrderGenerator(Generator):
         customer.place_order(order, establishment)
 
     def generate(self, env: FoodDeliverySimpyEnv):
-        for arrival_time in self.arrival_times:
+        orders = self.sample_orders(env)
+
+        for arrival_time, (establishment, coordinate, items) in zip(self.arrival_times, orders):
             wait_time = arrival_time - env.now
             if wait_time > 0:
                 yield env.timeout(wait_time)
 
-            establishment = self.rng.choice(env.state.establishments, size=None)
-            self.process_establishment(env, establishment)
+            self.process_establishment(env, establishment, coordinate, items)
             
\ No newline at end of file
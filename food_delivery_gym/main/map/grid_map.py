@@ -1,14 +1,23 @@
 import math
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from food_delivery_gym.main.base.types import Coordinate, Number
 from food_delivery_gym.main.map.map import Map
 
 
+#   Tabelas de tempo de viagem compartilhadas por todos os mapas do processo (entre resets e entre ambientes), por
+# (tamanho do grid, velocidade). Cada tabela é indexada pela distância de Manhattan, de 0 a max_distance()
+_TRAVEL_TIME_TABLES: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+
+
 class GridMap(Map):
-    def __init__(self, size):
-        super().__init__(size)
+    def __init__(self, size, rng: np.random.Generator | None = None):
+        super().__init__(size, rng)
         self.generated_points = {}
+        # Velocidade -> tabela de _TRAVEL_TIME_TABLES (None para velocidades não inteiras, que usam a fórmula)
+        self._travel_time_tables: Dict[Number, Optional[Tuple[int, ...]]] = {}
 
     def distance(self, coord1: Coordinate, coord2: Coordinate) -> Number:
         if coord1 == coord2:
@@ -33,11 +42,55 @@ class GridMap(Map):
         return distance
 
     def estimated_time(self, coord1: Coordinate, coord2: Coordinate, rate: Number) -> Number:
-        dx = abs(coord2[0] - coord1[0])
-        dy = abs(coord2[1] - coord1[1])
-        if dx == 0 and dy == 0:
+        distance = abs(coord2[0] - coord1[0]) + abs(coord2[1] - coord1[1])
+
+        #   A tabela só existe para velocidades inteiras positivas (ver travel_time_table) e só cobre distâncias inteiras
+        # dentro do grid (a distância nunca é negativa). Fora disso, o tempo é calculado pela fórmula
+        tables = self._travel_time_tables
+        table = tables[rate] if rate in tables else self.travel_time_table(rate)
+        if table is not None and isinstance(distance, (int, np.integer)) and distance < len(table):
+            return table[distance]
+
+        if distance == 0:
             return 0
-        return max(1, math.ceil((dx + dy) / rate))
+        return max(1, math.ceil(distance / rate))
+
+    def travel_time_table(self, rate: Number) -> Optional[Tuple[int, ...]]:
+        # Tempo de viagem por distância de Manhattan para a velocidade, construído uma vez por (tamanho, velocidade)
+        if rate not in self._travel_time_tables:
+            table = None
+            if rate > 0 and float(rate).is_integer():
+                key = (self.size, int(rate))
+                table = _TRAVEL_TIME_TABLES.get(key)
+                if table is None:
+                    table = (0,) + tuple(max(1, math.ceil(distance / rate)) for distance in range(1, self.max_distance() + 1))
+                    _TRAVEL_TIME_TABLES[key] = table
+            self._travel_time_tables[rate] = table
+        return self._travel_time_tables[rate]
+
+    # ── Consultas em lote ────────────────────────────────────────────────
+    #   Mesma semântica de distance e estimated_time (distância zero só para coordenadas iguais, piso de 1 e divisão
+    # arredondada para cima), aplicada par a par sobre arrays (n, 2) com broadcasting.
+
+    @staticmethod
+    def _manhattan_many(origins, destinations) -> np.ndarray:
+        origins = np.asarray(origins)
+        destinations = np.asarray(destinations)
+        # Coordenadas não inteiras são tratadas em float64, a mesma precisão dos floats do Python nas versões escalares
+        dtype = np.result_type(origins, destinations)
+        if not np.issubdtype(dtype, np.integer):
+            dtype = np.float64
+        delta = np.abs(destinations.astype(dtype, copy=False) - origins.astype(dtype, copy=False))
+        return delta[..., 0] + delta[..., 1]
+
+    def distance_many(self, origins, destinations) -> np.ndarray:
+        distance = self._manhattan_many(origins, destinations)
+        return np.where(distance == 0, 0, np.maximum(distance, 1))
+
+    def estimated_time_many(self, origins, destinations, rates) -> np.ndarray:
+        distance = self._manhattan_many(origins, destinations)
+        travel_time = np.maximum(1, np.ceil(distance / np.asarray(rates, dtype=np.float64))).astype(np.int64)
+        return np.where(distance == 0, 0, travel_time)
 
     def random_point(self, not_repeated=False) -> Coordinate:
         point = self.rng.integers(self.size), self.rng.integers(self.size)
@@ -1,14 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+import numpy as np
+
 from food_delivery_gym.main.base.types import Coordinate, Number
 from food_delivery_gym.main.utils.random_manager import RandomManager
 
 class Map(ABC):
 
-    def __init__(self, size):
+    def __init__(self, size, rng: np.random.Generator | None = None):
         self.size = size
-        self.rng = RandomManager().get_random_instance()
+        # Gerador usado para sortear pontos do mapa; sem um gerador próprio, usa o gerador global do RandomManager
+        self.rng = rng if rng is not None else RandomManager().get_random_instance()
 
     @abstractmethod
     def distance(self, coord1: Coordinate, coord2: Coordinate) -> Number:
@@ -22,6 +25,31 @@ class Map(ABC):
     def estimated_time(self, coord1: Coordinate, coord2: Coordinate, rate: Number) -> Number:
         pass
 
+    #   Versões em lote das consultas acima: recebem arrays de coordenadas de forma (n, 2) (ou uma única coordenada,
+    # que é propagada) e devolvem um array com o resultado de cada par. As implementações padrão apenas repetem a
+    # consulta escalar; mapas concretos podem sobrescrevê-las com versões vetorizadas.
+
+    def distance_many(self, origins, destinations) -> np.ndarray:
+        origins, destinations = np.broadcast_arrays(np.asarray(origins), np.asarray(destinations))
+        return np.array([
+            self.distance(tuple(origin), tuple(destination))
+            for origin, destination in zip(origins.reshape(-1, 2).tolist(), destinations.reshape(-1, 2).tolist())
+        ]).reshape(origins.shape[:-1])
+
+    def estimated_time_many(self, origins, destinations, rates) -> np.ndarray:
+        origins, destinations = np.broadcast_arrays(np.asarray(origins), np.asarray(destinations))
+        rates = np.broadcast_to(np.asarray(rates), origins.shape[:-1])
+        return np.array([
+            self.estimated_time(tuple(origin), tuple(destination), rate)
+            for origin, destination, rate in zip(
+                origins.reshape(-1, 2).tolist(), destinations.reshape(-1, 2).tolist(), rates.reshape(-1).tolist()
+            )
+        ]).reshape(origins.shape[:-1])
+
+    def pairwise_distance_matrix(self, coordinates) -> np.ndarray:
+        coordinates = np.asarray(coordinates)
+        return self.distance_many(coordinates[:, np.newaxis, :], coordinates[np.newaxis, :, :])
+
     @abstractmethod
     def random_point(self) -> Coordinate:
         pass
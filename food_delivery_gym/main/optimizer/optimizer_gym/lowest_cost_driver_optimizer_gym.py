@@ -1,5 +1,7 @@
 from typing import List
 
+import numpy as np
+
 from food_delivery_gym.main.cost.cost_function import CostFunction
 from food_delivery_gym.main.cost.route_cost_function import RouteCostFunction
 from food_delivery_gym.main.cost.marginal_route_cost_function import MarginalRouteCostFunction
@@ -15,9 +17,10 @@ class LowestCostDriverOptimizerGym(OptimizerGym):
         super().__init__(environment)
         self.cost_function = cost_function
 
-    def get_cost_for_driver(self, driver: Driver, route: Route):
+    def get_costs_for_drivers(self, drivers: List[Driver], route: Route) -> np.ndarray:
+        # Custo da rota para cada motorista, na ordem de drivers (ver CostFunction.cost_many)
         map = self.gym_env.simpy_env.map
-        return self.cost_function.cost(map, driver, route.route_segments[0])
+        return self.cost_function.cost_many(map, drivers, route.route_segments[0])
     
     def get_title(self):
         if isinstance(self.cost_function, RouteCostFunction):
@@ -29,5 +32,6 @@ class LowestCostDriverOptimizerGym(OptimizerGym):
     def select_driver(self, obs: dict, drivers: List[Driver], route: Route):
         # drivers = list(filter(lambda driver: driver.current_route is None or
         # driver.current_route.size() <= 1, drivers))
-        selected_driver = min(drivers, key=lambda driver: self.get_cost_for_driver(driver, route))
-        return drivers.index(selected_driver)
+        # np.argmin devolve o primeiro motorista de menor custo, o mesmo critério de desempate de min()
+        costs = self.get_costs_for_drivers(drivers, route)
+        return int(np.argmin(costs))
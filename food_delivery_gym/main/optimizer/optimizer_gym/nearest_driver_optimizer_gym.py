@@ -1,5 +1,7 @@
 from typing import List
 
+import numpy as np
+
 from food_delivery_gym.main.driver.driver import Driver
 from food_delivery_gym.main.map.map import Map
 from food_delivery_gym.main.optimizer.optimizer_gym.optmizer_gym import OptimizerGym
@@ -9,7 +11,7 @@ from food_delivery_gym.main.route.route import Route
 class NearestDriverOptimizerGym(OptimizerGym):
 
     def compare_distance(self, map: Map, driver: Driver, route: Route):
-        return map.distance(driver.get_last_valid_coordinate(), route.route_segments[0].coordinate)
+        return map.distance(driver.get_summary().last_valid_coordinate, route.route_segments[0].coordinate)
     
     def get_title(self):
         return "Otimizador do Motorista Mais Próximo"
@@ -17,5 +19,9 @@ class NearestDriverOptimizerGym(OptimizerGym):
     def select_driver(self, obs: dict, drivers: List[Driver], route: Route):
         # drivers = list(filter(lambda driver: driver.current_route is None or
         # driver.current_route.size() <= 1, drivers))
-        nearest_driver = min(drivers, key=lambda driver: self.compare_distance(self.gym_env.simpy_env.map, driver, route))
-        return drivers.index(nearest_driver)
+        # np.argmin devolve o primeiro motorista mais próximo, o mesmo critério de desempate de min()
+        distances = self.gym_env.simpy_env.map.distance_many(
+            [driver.get_summary().last_valid_coordinate for driver in drivers],
+            route.route_segments[0].coordinate
+        )
+        return int(np.argmin(distances))
@@ -29,13 +29,10 @@ class OrToolsOptimizerSimpy(OptimizerSimpy):
         all_locations = pickup_segments + delivery_segments + drivers
         num_locations = len(all_locations)
 
-        # Matriz de distâncias
-        distance_matrix = []
-        for from_node in all_locations:
-            row = []
-            for to_node in all_locations:
-                row.append(env.map.distance(from_node.coordinate, to_node.coordinate))
-            distance_matrix.append(row)
+        # Matriz de distâncias (convertida para listas de int do Python, consultadas pelo callback do OR-Tools)
+        distance_matrix = env.map.pairwise_distance_matrix(
+            [location.coordinate for location in all_locations]
+        ).tolist()
 
         # Índices de estabelecimentos, clientes e motoristas
         pickup_indices = list(range(num_pickups))
@@ -1,4 +1,6 @@
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
+
+from simpy import Environment, Event
 
 from food_delivery_gym.main.base.dimensions import Dimensions
 from food_delivery_gym.main.base.types import Number
@@ -13,6 +15,36 @@ if TYPE_CHECKING:
 
 
 class Order:
+    __slots__ = (
+        "order_id",
+        "customer",
+        "establishment",
+        "pick_up_route_segment_id",
+        "delivery_route_segment_id",
+        "request_date",
+        "delivery_rejections",
+        "items",
+        "status",
+        "isReady",
+        "ready_event",
+        "required_capacity",
+        "time_establishment_accepted_order",
+        "time_it_was_accepted",
+        "estimated_preparation_duration",
+        "actual_preparation_duration",
+        "time_preparation_started",
+        "estimated_ready_time",
+        "time_order_became_ready",
+        "time_that_driver_was_allocated",
+        "time_it_was_picked_up",
+        "time_it_was_delivered",
+        "estimated_time_between_accept_and_start_picking_up",
+        "estimated_pickup_travel_time",
+        "estimated_time_between_picked_up_and_start_delivery",
+        "estimated_delivery_travel_time",
+        "estimated_time_to_costumer_receive_order",
+    )
+
     def __init__(
             self,
             id: Number,
@@ -33,10 +65,12 @@ class Order:
         self.items = items
         self.status: OrderStatus = OrderStatus.CREATED
         self.isReady = False
+        self.ready_event: Optional[Event] = None # Evento disparado quando o pedido fica pronto (criado sob demanda)
         self.required_capacity = self.calculate_required_capacity()
 
         # Atributos de tempo para preparação (atualizados pelo estabelecimento)
         self.time_establishment_accepted_order = None # Momento em que o pedido foi aceito pelo estabelecimento
+        self.time_it_was_accepted = None # Momento em que o estabelecimento aceitou o pedido (atualizado em establishment_accepted)
         self.estimated_preparation_duration = None # Estimativa de tempo para preparo
         self.actual_preparation_duration = None # Tempo real que levou para preparar
         self.time_preparation_started = None # Momento em que a preparação começou
@@ -55,10 +89,7 @@ class Order:
         self.estimated_time_to_costumer_receive_order = None # Estimativa de tempo para o cliente receber o pedido
 
     def calculate_required_capacity(self):
-        dimensions = Dimensions(0, 0, 0, 0)
-        for item in self.items:
-            dimensions += item.dimensions
-        return dimensions
+        return Dimensions.sum(item.dimensions for item in self.items)
 
     def update_status(self, status: OrderStatus):
         self.status = status
@@ -118,6 +149,16 @@ class Order:
         self.status = OrderStatus.READY
         self.isReady = True
         self.time_order_became_ready = now
+        if self.ready_event is not None and not self.ready_event.triggered:
+            self.ready_event.succeed()
+
+    def get_ready_event(self, environment: Environment) -> Event:
+        # O evento só é criado quando alguém precisa aguardar o pedido, evitando agendar eventos para pedidos já prontos
+        if self.ready_event is None:
+            self.ready_event = environment.event()
+            if self.isReady:
+                self.ready_event.succeed()
+        return self.ready_event
 
     def driver_picking_up(self):
         if self.status == OrderStatus.PREPARING:
@@ -171,6 +212,10 @@ class Order:
     def get_estimated_ready_time(self) -> int:
         return self.estimated_ready_time
 
+    def as_dict(self) -> dict:
+        # Substitui o __dict__ (inexistente com __slots__) em impressões de depuração
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
     def __str__(self):
         return (
             f"ID do Pedido: {self.order_id}\n"
@@ -4,6 +4,8 @@ from food_delivery_gym.main.route.route_segment_type import RouteSegmentType
 
 
 class DeliveryRouteSegment(RouteSegment):
+    __slots__ = ()
+
     def __init__(self, order: Order):
         super().__init__(RouteSegmentType.DELIVERY, order)
         order.set_delivery_segment(self.route_segment_id)
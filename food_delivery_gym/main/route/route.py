@@ -1,5 +1,5 @@
-import uuid
-from typing import List
+from collections import deque
+from typing import Deque, List, Optional
 
 from food_delivery_gym.main.base.dimensions import Dimensions
 from food_delivery_gym.main.base.types import Coordinate, Number
@@ -8,34 +8,67 @@ from food_delivery_gym.main.route.route_segment import RouteSegment
 
 
 class Route:
+    __slots__ = (
+        "route_id",
+        "environment",
+        "route_segments",
+        "required_capacity",
+        "_inner_time",
+        "_inner_time_rate",
+        "_inner_distance",
+    )
+
     def __init__(self, environment: FoodDeliverySimpyEnv, route_segments: List[RouteSegment]):
-        self.route_id = str(uuid.uuid4())  # ID único global, seguro para uso em processos paralelos
+        self.route_id = environment.next_route_id()  # ID inteiro sequencial, único dentro do ambiente
         self.environment = environment
-        self.route_segments = route_segments
+        self.route_segments: Deque[RouteSegment] = deque(route_segments)
         self.required_capacity = self.calculate_required_capacity()
 
+        #   Estimativas em cache do trecho interno da rota (do primeiro ao último segmento): tempo de serviço de cada
+        # segmento somado ao tempo de viagem entre segmentos consecutivos, e a distância entre eles. Só o trecho até o
+        # primeiro segmento depende da coordenada atual do motorista, então as consultas custam O(1) com o cache válido.
+        #   São calculadas sob demanda (as estimativas do pedido só são preenchidas em Order.driver_allocated, depois
+        # da criação da rota) e só mudam em extend_route, move_segment_to_front_by_id e next().
+        self._inner_time: Optional[Number] = None
+        self._inner_time_rate: Optional[Number] = None
+        self._inner_distance: Optional[Number] = None
+
     def calculate_required_capacity(self):
-        dimensions = Dimensions(0, 0, 0, 0)
-        for route_segment in self.route_segments:
-            dimensions += route_segment.required_capacity
-        return dimensions
+        return Dimensions.sum(route_segment.required_capacity for route_segment in self.route_segments)
 
     def has_next(self):
         return len(self.route_segments) > 0
 
     def next(self):
-        self.required_capacity = self.calculate_required_capacity()
-        return self.route_segments.pop(0)
-    
+        route_segment = self.route_segments.popleft()
+        self.required_capacity = self.required_capacity - route_segment.required_capacity
+
+        # Remove do cache o tempo de serviço do segmento retirado e o trecho entre ele e o novo primeiro segmento
+        if self.route_segments:
+            next_coordinate = self.route_segments[0].coordinate
+            if self._inner_time is not None:
+                self._inner_time -= (
+                    self._segment_service_time(route_segment)
+                    + self.environment.map.estimated_time(route_segment.coordinate, next_coordinate, self._inner_time_rate)
+                )
+            if self._inner_distance is not None:
+                self._inner_distance -= self.environment.map.distance(route_segment.coordinate, next_coordinate)
+        else:
+            self._inner_time = None
+            self._inner_distance = None
+
+        return route_segment
+
     def get_current_order(self):
         if self.has_next():
             return self.route_segments[0].order
         return None
-    
+
     def move_segment_to_front_by_id(self, route_segment_id: int):
         segment = self.find_route_segment_by_id(route_segment_id)
         self.route_segments.remove(segment)
-        self.route_segments.insert(0, segment)
+        self.route_segments.appendleft(segment)
+        self._invalidate_estimates()
 
     def find_route_segment_by_id(self, route_segment_id: int) -> int:
         for idx, segment in enumerate(self.route_segments):
@@ -44,34 +77,83 @@ class Route:
         raise ValueError("Segmento de rota não encontrado.")
 
     def extend_route(self, other_route):
-        self.route_segments += other_route.route_segments
-        self.required_capacity = self.calculate_required_capacity()
+        if not other_route.route_segments:
+            return
+
+        if not self.route_segments:
+            self._invalidate_estimates()
+        else:
+            # Junta o trecho interno da outra rota ao desta, ligados pelo trecho entre o último segmento e o primeiro da outra
+            last_coordinate = self.route_segments[-1].coordinate
+            first_coordinate = other_route.route_segments[0].coordinate
+            if self._inner_time is not None:
+                self._inner_time += (
+                    self.environment.map.estimated_time(last_coordinate, first_coordinate, self._inner_time_rate)
+                    + other_route._get_inner_time(self._inner_time_rate)
+                )
+            if self._inner_distance is not None:
+                self._inner_distance += (
+                    self.environment.map.distance(last_coordinate, first_coordinate)
+                    + other_route._get_inner_distance()
+                )
+
+        self.route_segments.extend(other_route.route_segments)
+        self.required_capacity = Dimensions.sum((self.required_capacity, other_route.required_capacity))
 
     def size(self):
         return len(self.route_segments)
-    
+
+    def _invalidate_estimates(self) -> None:
+        self._inner_time = None
+        self._inner_time_rate = None
+        self._inner_distance = None
+
+    @staticmethod
+    def _segment_service_time(segment: RouteSegment) -> Number:
+        # Os tempos de viagem entre segmentos são somados à parte, a partir do mapa
+        if segment.is_pickup():
+            return segment.order.estimated_time_between_accept_and_start_picking_up
+
+        if segment.is_delivery():
+            return (
+                segment.order.estimated_time_between_picked_up_and_start_delivery
+                + segment.order.estimated_time_to_costumer_receive_order
+            )
+
+        return 0
+
+    def _get_inner_time(self, movement_rate: Number) -> Number:
+        if self._inner_time is None or self._inner_time_rate != movement_rate:
+            total_time = 0
+            previous_coordinate = None
+            for segment in self.route_segments:
+                if previous_coordinate is not None:
+                    total_time += self.environment.map.estimated_time(previous_coordinate, segment.coordinate, movement_rate)
+                total_time += self._segment_service_time(segment)
+                previous_coordinate = segment.coordinate
+            self._inner_time = total_time
+            self._inner_time_rate = movement_rate
+        return self._inner_time
+
+    def _get_inner_distance(self) -> Number:
+        if self._inner_distance is None:
+            self._inner_distance = self.environment.map.acc_distance([segment.coordinate for segment in self.route_segments])
+        return self._inner_distance
+
     def get_time_to_complete_route(self, current_coordinate: Coordinate, movement_rate: Number) -> Number:
         if not self.route_segments:
             return 0
-        
-        total_time = 0
-        for segment in self.route_segments:
-            total_time += self.environment.map.estimated_time(current_coordinate, segment.coordinate, movement_rate)
-
-            if segment.is_pickup():
-                total_time += segment.order.estimated_time_between_accept_and_start_picking_up
-                # Tempo de viagem para coleta já considerado
-
-            elif segment.is_delivery():
-                total_time += segment.order.estimated_time_between_picked_up_and_start_delivery
-                # Tempo de viagem para entrega já considerado
-                total_time += segment.order.estimated_time_to_costumer_receive_order
-
-            current_coordinate = segment.coordinate
-                
-        return total_time
-    
+
+        return (
+            self.environment.map.estimated_time(current_coordinate, self.route_segments[0].coordinate, movement_rate)
+            + self._get_inner_time(movement_rate)
+        )
+
     def get_distance_to_complete_route(self, current_coordinate: Coordinate) -> Number:
-        coordinates = [segment.coordinate for segment in self.route_segments]
-        coordinates.insert(0, current_coordinate)
-        return self.environment.map.acc_distance(coordinates)
+        if not self.route_segments:
+            return 0
+
+        return (
+            self.environment.map.distance(current_coordinate, self.route_segments[0].coordinate)
+            + self._get_inner_distance()
+        )
@@ -1,12 +1,13 @@
-import uuid
-
 from food_delivery_gym.main.order.order import Order
 from food_delivery_gym.main.route.route_segment_type import RouteSegmentType
 
 
 class RouteSegment:
+    __slots__ = ("route_segment_id", "route_segment_type", "order", "coordinate", "required_capacity")
+
     def __init__(self, route_segment_type: RouteSegmentType, order: Order):
-        self.route_segment_id = str(uuid.uuid4())  # ID único global, seguro para uso em processos paralelos
+        # ID inteiro sequencial, único dentro do ambiente do estabelecimento do pedido
+        self.route_segment_id = order.establishment.environment.next_route_segment_id()
         self.route_segment_type = route_segment_type
         self.order = order
         self.coordinate = self.init_coordinates()
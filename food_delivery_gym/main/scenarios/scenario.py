@@ -0,0 +1,204 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from food_delivery_gym.main.base.types import Number
+from food_delivery_gym.main.utils.rate_function_utils import validate_rate_function
+
+# Cenários já lidos por Scenario.load, por (caminho absoluto, data de modificação do arquivo)
+_LOADED_SCENARIOS: dict[tuple[str, int], "Scenario"] = {}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Cenário de simulação imutável e já validado.
+
+    É lido e validado uma única vez e pode ser compartilhado entre quantas instâncias de FoodDeliveryGymEnv forem
+    necessárias, inclusive de cenários diferentes no mesmo processo. Todos os campos são imutáveis (faixas [min, max]
+    são tuplas), então o cenário pode ser usado como chave de dicionário e enviado a processos workers. O digest é um
+    SHA-256 do conteúdo, estável entre processos.
+    """
+
+    # order_generator
+    order_generator_type: str
+    estimated_num_orders: int
+    time_window: Number
+
+    # simpy_env
+    max_time_step: Number
+
+    # grid_map
+    grid_map_size: int
+
+    # drivers
+    num_drivers: int
+    vel_drivers: tuple[Number, Number]
+    tolerance_percentage: Number
+    max_capacity: int
+
+    # establishments
+    num_establishments: int
+    prepare_time: tuple[Number, Number]
+    operating_radius: tuple[Number, Number]
+    production_capacity: tuple[Number, Number]
+    percentage_allocation_driver: Number
+
+    # Campos opcionais do order_generator
+    lambda_rate: Optional[Number] = None
+    rate_function: Optional[str] = None
+    max_rate: Optional[Number] = None
+
+    name: Optional[str] = field(default=None, compare=False) # Nome do arquivo de origem, sem extensão
+    digest: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        object.__setattr__(self, "digest", hashlib.sha256(canonical.encode("utf-8")).hexdigest())
+
+    @classmethod
+    def load(cls, scenario_json_file_path: str) -> "Scenario":
+        """Lê o cenário do arquivo JSON, reaproveitando o já lido enquanto o arquivo não for modificado."""
+        path = Path(scenario_json_file_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"Arquivo de cenário não encontrado: {path}")
+        key = (str(path.resolve()), path.stat().st_mtime_ns)
+        scenario = _LOADED_SCENARIOS.get(key)
+        if scenario is None:
+            scenario = cls.from_json_file(path)
+            _LOADED_SCENARIOS[key] = scenario
+        return scenario
+
+    @classmethod
+    def from_json_file(cls, scenario_json_file_path: str | Path) -> "Scenario":
+        path = Path(scenario_json_file_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"Arquivo de cenário não encontrado: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f), name=path.stem)
+
+    @classmethod
+    def from_dict(cls, scenario: dict, name: Optional[str] = None) -> "Scenario":
+        # Estrutura esperada
+        required_sections = ["order_generator", "simpy_env", "grid_map", "drivers", "establishments"]
+        for section in required_sections:
+            if section not in scenario:
+                raise ValueError(f"Seção obrigatória ausente: '{section}'")
+
+        og = scenario["order_generator"]
+        env = scenario["simpy_env"]
+        grid = scenario["grid_map"]
+        drv = scenario["drivers"]
+        est = scenario["establishments"]
+
+        # 1. Order Generator
+        required_og = ["type", "estimated_num_orders", "time_window"]
+        for k in required_og:
+            if k not in og:
+                raise ValueError(f"Campo obrigatório ausente em 'order_generator': '{k}'")
+        if og["type"] not in ["poisson", "non_homogeneous_poisson"]:
+            raise ValueError("order_generator.type deve ser 'poisson' ou 'non_homogeneous_poisson'")
+        if not isinstance(og["estimated_num_orders"], int) or og["estimated_num_orders"] <= 0:
+            raise ValueError("order_generator.estimated_num_orders deve ser um inteiro positivo")
+        if not isinstance(og["time_window"], (int, float)) or og["time_window"] <= 0:
+            raise ValueError("order_generator.time_window deve ser positivo")
+        if og["type"] == "non_homogeneous_poisson":
+            if "rate_function" not in og:
+                raise ValueError("rate_function é obrigatório para 'non_homogeneous_poisson'")
+            validate_rate_function(og["rate_function"])
+
+        # 2. simpy_env
+        if "max_time_step" not in env:
+            raise ValueError("Campo obrigatório ausente em 'simpy_env': 'max_time_step'")
+        if not isinstance(env["max_time_step"], (int, float)) or env["max_time_step"] <= 0:
+            raise ValueError("simpy_env.max_time_step deve ser um número positivo")
+
+        # 3. grid_map
+        if "size" not in grid:
+            raise ValueError("Campo obrigatório ausente em 'grid_map': 'size'")
+        if not isinstance(grid["size"], int) or grid["size"] <= 0:
+            raise ValueError("grid_map.size deve ser um inteiro positivo")
+
+        # 4. drivers
+        required_drv = ["num", "vel", "tolerance_percentage", "max_capacity"]
+        for k in required_drv:
+            if k not in drv:
+                raise ValueError(f"Campo obrigatório ausente em 'drivers': '{k}'")
+        if not isinstance(drv["num"], int) or drv["num"] <= 0:
+            raise ValueError("drivers.num deve ser um inteiro positivo")
+        if not (isinstance(drv["vel"], list) and len(drv["vel"]) == 2 and all(isinstance(v, (int, float)) for v in drv["vel"])):
+            raise ValueError("drivers.vel deve ser uma lista com dois números [min, max]")
+        if not isinstance(drv["tolerance_percentage"], (int, float)) or drv["tolerance_percentage"] < 0:
+            raise ValueError("drivers.tolerance_percentage deve ser um número não negativo")
+        if not isinstance(drv["max_capacity"], int) or drv["max_capacity"] <= 0:
+            raise ValueError("drivers.max_capacity deve ser um inteiro positivo")
+
+        # 5. establishments
+        required_est = ["num", "prepare_time", "operating_radius", "production_capacity", "percentage_allocation_driver"]
+        for k in required_est:
+            if k not in est:
+                raise ValueError(f"Campo obrigatório ausente em 'establishments': '{k}'")
+        if not isinstance(est["num"], int) or est["num"] <= 0:
+            raise ValueError("establishments.num deve ser um inteiro positivo")
+        for key in ["prepare_time", "operating_radius", "production_capacity"]:
+            value = est[key]
+            if not (isinstance(value, list) and len(value) == 2 and all(isinstance(v, (int, float)) for v in value)):
+                raise ValueError(f"'{key}' deve ser uma lista com dois valores numéricos [min, max]")
+            if value[0] > value[1]:
+                raise ValueError(f"'{key}' deve estar em ordem crescente (min <= max)")
+        pad = est["percentage_allocation_driver"]
+        if not (isinstance(pad, (int, float)) and 0 <= pad <= 1):
+            raise ValueError("establishments.percentage_allocation_driver deve ser um número entre 0 e 1")
+
+        return cls(
+            order_generator_type=og["type"],
+            estimated_num_orders=og["estimated_num_orders"],
+            time_window=og["time_window"],
+            lambda_rate=og.get("lambda_rate", None),
+            rate_function=og.get("rate_function", None),
+            max_rate=og.get("max_rate", None),
+            max_time_step=env["max_time_step"],
+            grid_map_size=grid["size"],
+            num_drivers=drv["num"],
+            vel_drivers=tuple(drv["vel"]),
+            tolerance_percentage=drv["tolerance_percentage"],
+            max_capacity=drv["max_capacity"],
+            num_establishments=est["num"],
+            prepare_time=tuple(est["prepare_time"]),
+            operating_radius=tuple(est["operating_radius"]),
+            production_capacity=tuple(est["production_capacity"]),
+            percentage_allocation_driver=pad,
+            name=name,
+        )
+
+    def to_dict(self) -> dict:
+        """Retorna o cenário na estrutura do arquivo JSON."""
+        order_generator = {
+            "type": self.order_generator_type,
+            "estimated_num_orders": self.estimated_num_orders,
+            "time_window": self.time_window,
+        }
+        for key in ("lambda_rate", "rate_function", "max_rate"):
+            if getattr(self, key) is not None:
+                order_generator[key] = getattr(self, key)
+
+        return {
+            "order_generator": order_generator,
+            "simpy_env": {"max_time_step": self.max_time_step},
+            "grid_map": {"size": self.grid_map_size},
+            "drivers": {
+                "num": self.num_drivers,
+                "vel": list(self.vel_drivers),
+                "tolerance_percentage": self.tolerance_percentage,
+                "max_capacity": self.max_capacity,
+            },
+            "establishments": {
+                "num": self.num_establishments,
+                "prepare_time": list(self.prepare_time),
+                "operating_radius": list(self.operating_radius),
+                "production_capacity": list(self.production_capacity),
+                "percentage_allocation_driver": self.percentage_allocation_driver,
+            },
+        }
@@ -70,10 +70,12 @@ import math
 import os
 import statistics as stt
 import traceback
+from collections.abc import Sequence
 from typing import IO, Literal
 
 import numpy as np
 
+from food_delivery_gym.main.events.event_type import EventType
 from food_delivery_gym.main.statistic.statistics_view.batch_stats_board import BatchStatsBoard
 from food_delivery_gym.main.statistic.statistics_view.episode_stats_board import EpisodeStatsBoard
 
@@ -90,6 +92,38 @@ EVENT_TYPE_CODES: dict[str, int] = {
 }
 EVENT_CODE_TO_TYPE: dict[int, str] = {v: k for k, v in EVENT_TYPE_CODES.items()}
 
+# EventType.value (código do log de eventos do ambiente) → código NPZ (0 = não serializado)
+_NPZ_CODE_BY_EVENT_TYPE_VALUE = np.zeros(max(t.value for t in EventType) + 1, dtype=np.int64)
+for _name, _code in EVENT_TYPE_CODES.items():
+    _NPZ_CODE_BY_EVENT_TYPE_VALUE[EventType[_name].value] = _code
+
+
+class EpisodeEvents(Sequence):
+    """
+    Eventos de um episódio em colunas (tempos e códigos de EventType), copiados do log do ambiente.
+
+    Comporta-se como a lista de dicts {"type": ..., "time": ...} usada por métricas e boards,
+    mas cada dict só é criado quando o evento é acessado.
+    """
+
+    __slots__ = ("times", "type_codes")
+
+    def __init__(self, times: np.ndarray, type_codes: np.ndarray) -> None:
+        self.times      = times
+        self.type_codes = type_codes
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return EpisodeEvents(self.times[idx], self.type_codes[idx])
+        return {"type": EventType(int(self.type_codes[idx])).name, "time": float(self.times[idx])}
+
+    def __iter__(self):
+        for tm, code in zip(self.times.tolist(), self.type_codes.tolist()):
+            yield {"type": EventType(code).name, "time": tm}
+
 
 # ════════════════════════════════════════════════════════════════════════
 #  Funções utilitárias de conversão (módulo-nível)
@@ -132,6 +166,8 @@ def _json_default(obj):
         return obj.tolist()
     if isinstance(obj, np.bool_):
         return bool(obj)
+    if isinstance(obj, EpisodeEvents):
+        return list(obj)
     raise TypeError(f"Tipo não serializável: {type(obj)}")
 
 
@@ -151,9 +187,13 @@ def _events_to_flat_arrays(events_per_ep: list[list[dict]]) -> dict[str, np.ndar
 
     for ep_events in events_per_ep:
         ep_starts.append(offset)
-        for ev in ep_events:
-            all_times.append(float(ev["time"]))
-            all_types.append(int(EVENT_TYPE_CODES.get(ev["type"], 0)))
+        if isinstance(ep_events, EpisodeEvents):
+            all_times.extend(ep_events.times.tolist())
+            all_types.extend(_NPZ_CODE_BY_EVENT_TYPE_VALUE[ep_events.type_codes].tolist())
+        else:
+            for ev in ep_events:
+                all_times.append(float(ev["time"]))
+                all_types.append(int(EVENT_TYPE_CODES.get(ev["type"], 0)))
         offset += len(ep_events)
         ep_ends.append(offset)
 
@@ -322,10 +362,10 @@ class SimulationStats:
                 str(e.establishment_id): e.get_episode_stats()
                 for e in simpy_env.state.establishments
             },
-            "events": [
-                {"type": event.event_type.name, "time": float(event.time)}
-                for event in simpy_env.events
-            ],
+            "events": EpisodeEvents(
+                times=simpy_env.events.times,
+                type_codes=simpy_env.events.type_codes,
+            ),
         }
         self._raw_episodes.append(ep)
         self._sim = None  # invalida cache lazy
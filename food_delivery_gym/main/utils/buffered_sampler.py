@@ -0,0 +1,47 @@
+import numpy as np
+
+
+class BufferedSampler:
+    """
+    Sorteios escalares servidos a partir de blocos pré-sorteados de um np.random.Generator.
+
+    Cada chamada escalar ao NumPy custa alguns microssegundos de overhead, independentemente da distribuição. Aqui
+    cada distribuição (com seus parâmetros) tem o seu bloco de valores, sorteado de uma vez e entregue um a um; quando
+    o bloco acaba, um novo é sorteado, com o dobro do tamanho do anterior (até MAX_BLOCK_SIZE), para que
+    distribuições pouco usadas não desperdicem sorteios. A sequência de valores depende apenas do gerador e da ordem
+    das chamadas, então a mesma semente sempre produz a mesma simulação.
+    """
+
+    INITIAL_BLOCK_SIZE = 16
+    MAX_BLOCK_SIZE = 1024
+
+    __slots__ = ("rng", "_integer_buffers", "_beta_buffers", "_block_sizes")
+
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        # Blocos em ordem inversa, consumidos com pop() a partir do fim
+        self._integer_buffers: dict[tuple[int, int], list[int]] = {}
+        self._beta_buffers: dict[tuple[float, float], list[float]] = {}
+        self._block_sizes: dict[tuple, int] = {}
+
+    def _next_block_size(self, key: tuple) -> int:
+        block_size = self._block_sizes.get(key, self.INITIAL_BLOCK_SIZE)
+        self._block_sizes[key] = min(block_size * 2, self.MAX_BLOCK_SIZE)
+        return block_size
+
+    def integers(self, low: int, high: int) -> int:
+        # Equivalente a rng.integers(low, high): inteiro uniforme em [low, high)
+        key = (low, high)
+        buffer = self._integer_buffers.get(key)
+        if not buffer:
+            block = self.rng.integers(low, high, size=self._next_block_size(("integers",) + key))
+            buffer = self._integer_buffers[key] = block[::-1].tolist()
+        return buffer.pop()
+
+    def beta(self, a: float, b: float) -> float:
+        key = (a, b)
+        buffer = self._beta_buffers.get(key)
+        if not buffer:
+            block = self.rng.beta(a, b, size=self._next_block_size(("beta",) + key))
+            buffer = self._beta_buffers[key] = block[::-1].tolist()
+        return buffer.pop()
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class RandomStream(Enum):
+    """
+    Fluxos independentes de números aleatórios de uma simulação, um para cada fonte de aleatoriedade.
+
+    Com fluxos separados, mudar o número de sorteios de uma parte do modelo (ex.: como os tempos de cozinha são
+    sorteados) não desloca os sorteios das demais (chegadas de pedidos, posição dos clientes etc.).
+    """
+    SETUP = "setup"                             # Posição e atributos iniciais de estabelecimentos e motoristas
+    ORDER_ARRIVALS = "order_arrivals"           # Instantes de chegada dos pedidos
+    CUSTOMER_PLACEMENT = "customer_placement"   # Estabelecimento, posição do cliente e itens de cada pedido
+    KITCHEN_TIMES = "kitchen_times"             # Tempos de preparo e de atendimento dos estabelecimentos
+    DRIVER_DELAYS = "driver_delays"             # Esperas dos motoristas entre as etapas da entrega
+    CUSTOMER_DELAYS = "customer_delays"         # Tempo do cliente para receber o pedido
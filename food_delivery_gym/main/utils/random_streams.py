@@ -0,0 +1,41 @@
+import numpy as np
+
+from food_delivery_gym.main.utils.buffered_sampler import BufferedSampler
+from food_delivery_gym.main.utils.random_stream import RandomStream
+
+
+class RandomStreams:
+    """
+    Geradores de números aleatórios de uma simulação, um por RandomStream.
+
+    Cada fluxo é um filho independente de uma SeedSequence própria da simulação, então ambientes no mesmo processo
+    não compartilham nem perturbam os sorteios uns dos outros, e o resultado de um episódio depende apenas da sua
+    semente, não da ordem em que os ambientes são executados.
+    """
+
+    def __init__(self, seed: int | np.random.SeedSequence | None = None):
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        children = self.seed_sequence.spawn(len(RandomStream))
+        self._generators: dict[RandomStream, np.random.Generator] = {
+            stream: np.random.default_rng(child) for stream, child in zip(RandomStream, children)
+        }
+        self._samplers: dict[RandomStream, BufferedSampler] = {}
+
+    @classmethod
+    def from_generator(cls, generator: np.random.Generator) -> "RandomStreams":
+        # Todos os fluxos usam o mesmo gerador: mantém o comportamento de quem ainda usa o RandomManager
+        random_streams = cls.__new__(cls)
+        random_streams.seed_sequence = None
+        random_streams._generators = {stream: generator for stream in RandomStream}
+        random_streams._samplers = {}
+        return random_streams
+
+    def get(self, stream: RandomStream) -> np.random.Generator:
+        return self._generators[stream]
+
+    def sampler(self, stream: RandomStream) -> BufferedSampler:
+        # Um único BufferedSampler por fluxo, compartilhado por todos os atores que o usam
+        sampler = self._samplers.get(stream)
+        if sampler is None:
+            sampler = self._samplers[stream] = BufferedSampler(self._generators[stream])
+        return sampler
@@ -0,0 +1,3 @@
+def expected_integers(low: int, high: int) -> float:
+    # Valor esperado de rng.integers(low, high), uniforme sobre os inteiros em [low, high)
+    return (low + high - 1) / 2
@@ -1,7 +1,11 @@
 import ast
+from functools import reduce
 import math
+from types import SimpleNamespace
 from typing import Callable
 
+import numpy as np
+
 SAFE_RATE_FUNCTION_NAMESPACE: dict = {
     "__builtins__": {},
     "math": math,
@@ -18,6 +22,54 @@ SAFE_RATE_FUNCTION_NAMESPACE: dict = {
     "e": math.e,
 }
 
+def _array_log(x, base=None):
+    # math.log aceita a base como segundo argumento; em np.log o segundo argumento seria o array de saída
+    return np.log(x) if base is None else np.log(x) / np.log(base)
+
+
+def _array_min(*args):
+    # Como o min embutido: vários argumentos ou um único iterável, mas comparando elemento a elemento
+    return reduce(np.minimum, args[0] if len(args) == 1 else args)
+
+
+def _array_max(*args):
+    return reduce(np.maximum, args[0] if len(args) == 1 else args)
+
+
+#   Mesmos nomes do namespace escalar ligados a ufuncs do NumPy, para que a função de taxa possa ser avaliada sobre um
+# array de instantes em uma única chamada. Funções de math sem equivalente aqui continuam disponíveis na versão
+# escalar, e a função resultante só poderá ser avaliada ponto a ponto
+_ARRAY_MATH = SimpleNamespace(**{name: value for name, value in vars(math).items() if not name.startswith("_")})
+_ARRAY_MATH.__dict__.update(
+    exp=np.exp, expm1=np.expm1, log=_array_log, log2=np.log2, log10=np.log10, log1p=np.log1p,
+    sqrt=np.sqrt, pow=np.power, fabs=np.fabs, floor=np.floor, ceil=np.ceil, trunc=np.trunc, hypot=np.hypot,
+    sin=np.sin, cos=np.cos, tan=np.tan, asin=np.arcsin, acos=np.arccos, atan=np.arctan, atan2=np.arctan2,
+    sinh=np.sinh, cosh=np.cosh, tanh=np.tanh,
+)
+
+ARRAY_RATE_FUNCTION_NAMESPACE: dict = {
+    "__builtins__": {},
+    "math": _ARRAY_MATH,
+    "abs": np.abs,
+    "min": _array_min,
+    "max": _array_max,
+    "round": np.round,
+    "pow": np.power,
+    "exp": np.exp,
+    "log": _array_log,
+    "sin": np.sin,
+    "cos": np.cos,
+    "pi": np.pi,
+    "e": np.e,
+}
+
+# A validação usa os nomes do namespace escalar; os dois modos precisam expor exatamente os mesmos nomes
+if ARRAY_RATE_FUNCTION_NAMESPACE.keys() != SAFE_RATE_FUNCTION_NAMESPACE.keys():
+    raise RuntimeError(
+        "ARRAY_RATE_FUNCTION_NAMESPACE e SAFE_RATE_FUNCTION_NAMESPACE devem expor os mesmos nomes, "
+        f"mas diferem em: {sorted(ARRAY_RATE_FUNCTION_NAMESPACE.keys() ^ SAFE_RATE_FUNCTION_NAMESPACE.keys())}"
+    )
+
 _ALLOWED_CALLS: frozenset[str] = frozenset(
     SAFE_RATE_FUNCTION_NAMESPACE.keys() - {"__builtins__", "math"}
 )
@@ -71,10 +123,14 @@ def validate_rate_function(rate_function_code: str) -> None:
                 )
 
 
-def build_rate_function(rate_function_code: str) -> Callable:
+def build_rate_function(rate_function_code: str, vectorized: bool = False) -> Callable:
+    #   Com vectorized=True os nomes permitidos são ligados às ufuncs do NumPy e a função aceita tanto um instante
+    # quanto um array de instantes. Expressões que só fazem sentido para escalares (ex.: condicionais com "if") devem
+    # ser compiladas no modo padrão
+    namespace = ARRAY_RATE_FUNCTION_NAMESPACE if vectorized else SAFE_RATE_FUNCTION_NAMESPACE
     compiled = compile(
         ast.parse(rate_function_code, mode="eval"),
         filename="<rate_function>",
         mode="eval",
     )
-    return eval(compiled, SAFE_RATE_FUNCTION_NAMESPACE.copy())  # noqa: S307
+    return eval(compiled, namespace.copy())  # noqa: S307
@@ -0,0 +1,105 @@
+"""
+Microbenchmark de criação e memória dos objetos centrais do domínio (Order, RouteSegment, Route e Event).
+
+Para cada pedido cria o Order, os segmentos de coleta e entrega, a rota e os eventos publicados ao longo
+da vida de um pedido, medindo o tempo de criação e a memória alocada (tracemalloc) por lote de pedidos.
+
+Uso:
+    python -m scripts.benchmark_domain_objects --scenario complex.json --orders 10000
+"""
+from importlib.resources import files
+import argparse
+import gc
+import time
+import tracemalloc
+
+from food_delivery_gym.main.customer.customer import Customer
+from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
+from food_delivery_gym.main.events.customer_placed_order import CustomerPlacedOrder
+from food_delivery_gym.main.events.driver_delivered_order import DriverDeliveredOrder
+from food_delivery_gym.main.events.driver_picked_up_order import DriverPickedUpOrder
+from food_delivery_gym.main.events.establishment_finished_order import EstablishmentFinishedOrder
+from food_delivery_gym.main.order.order import Order
+from food_delivery_gym.main.route.delivery_route_segment import DeliveryRouteSegment
+from food_delivery_gym.main.route.pickup_route_segment import PickupRouteSegment
+from food_delivery_gym.main.route.route import Route
+
+DEFAULT_SEED = 101010
+DEFAULT_ORDERS = 10_000
+DEFAULT_REPEATS = 3
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mede tempo de criação e memória dos objetos de domínio por lote de pedidos.")
+    parser.add_argument("--scenario", type=str, default="complex.json", help="Arquivo de cenário JSON.")
+    parser.add_argument("--orders", type=int, default=DEFAULT_ORDERS)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    return parser.parse_args()
+
+
+def create_customers(simpy_env) -> list:
+    # Um cliente por estabelecimento, reaproveitado entre os pedidos, para medir apenas os objetos de domínio
+    return [
+        Customer(id=i, environment=simpy_env, coordinate=establishment.coordinate, available=True)
+        for i, establishment in enumerate(simpy_env.state.establishments)
+    ]
+
+
+def create_orders(simpy_env, customers: list, num_orders: int) -> list:
+    establishments = simpy_env.state.establishments
+    objects = []
+    for i in range(num_orders):
+        establishment = establishments[i % len(establishments)]
+        customer = customers[i % len(customers)]
+        order = Order(
+            id=i,
+            customer=customer,
+            establishment=establishment,
+            request_date=simpy_env.now,
+            items=establishment.catalog.items[:2],
+        )
+        route = Route(simpy_env, [PickupRouteSegment(order), DeliveryRouteSegment(order)])
+        events = [
+            CustomerPlacedOrder(order, i, establishment.establishment_id, simpy_env.now),
+            EstablishmentFinishedOrder(order, i, establishment.establishment_id, simpy_env.now),
+            DriverPickedUpOrder(order, i, establishment.establishment_id, 1, simpy_env.now),
+            DriverDeliveredOrder(order, i, establishment.establishment_id, 1, simpy_env.now),
+        ]
+        objects.append((order, route, events))
+    return objects
+
+
+def main():
+    args = parse_args()
+    scenario_path = str(files("food_delivery_gym.main.scenarios").joinpath(args.scenario))
+    env = FoodDeliveryGymEnv(scenario_json_file_path=scenario_path)
+    env.reset(seed=args.seed)
+    simpy_env = env.get_simpy_env()
+    customers = create_customers(simpy_env)
+
+    best_time = float("inf")
+    for _ in range(args.repeats):
+        gc.collect()
+        start = time.perf_counter()
+        objects = create_orders(simpy_env, customers, args.orders)
+        best_time = min(best_time, time.perf_counter() - start)
+        del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = create_orders(simpy_env, customers, args.orders)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    per_10k = 10_000 / args.orders
+    print(f"Cenário:                         {args.scenario}")
+    print(f"Pedidos por lote:                {args.orders}")
+    print(f"Tempo de criação (10k pedidos):  {best_time * per_10k * 1000:.1f} ms")
+    print(f"Memória alocada (10k pedidos):   {allocated * per_10k / 2**20:.2f} MiB")
+    print(f"Memória por pedido:              {allocated / args.orders:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
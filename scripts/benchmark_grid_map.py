@@ -0,0 +1,88 @@
+"""
+Benchmark das consultas em lote do GridMap contra as consultas escalares.
+
+Para cada tamanho de lote, mede o tempo de calcular distâncias, tempos estimados de viagem e a matriz de
+distâncias par a par com um laço Python sobre distance/estimated_time e com distance_many,
+estimated_time_many e pairwise_distance_matrix, conferindo que os resultados são idênticos.
+
+Uso:
+    python -m scripts.benchmark_grid_map --grid-size 100 --sizes 10 100 1000 10000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from food_delivery_gym.main.map.grid_map import GridMap
+
+DEFAULT_SEED = 101010
+DEFAULT_GRID_SIZE = 100
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_REPEATS = 5
+MAX_PAIRWISE_SIZE = 1000 # O laço escalar da matriz par a par é quadrático
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compara as consultas escalares e em lote do GridMap.")
+    parser.add_argument("--grid-size", type=int, default=DEFAULT_GRID_SIZE)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Tamanhos de lote (pares de coordenadas).")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    return parser.parse_args()
+
+
+def best_time(function, repeats):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(name, size, scalar_time, batch_time):
+    print(f"{name:<26} n={size:<7} escalar: {scalar_time * 1e3:9.3f} ms   lote: {batch_time * 1e3:9.3f} ms   "
+          f"ganho: {scalar_time / max(batch_time, 1e-12):7.1f}x")
+
+
+def main():
+    args = parse_args()
+    grid_map = GridMap(args.grid_size)
+    rng = np.random.default_rng(args.seed)
+
+    for size in args.sizes:
+        origins = rng.integers(0, args.grid_size, (size, 2))
+        destinations = rng.integers(0, args.grid_size, (size, 2))
+        rates = rng.integers(1, 10, size)
+
+        origin_tuples = [tuple(coordinate) for coordinate in origins.tolist()]
+        destination_tuples = [tuple(coordinate) for coordinate in destinations.tolist()]
+        rate_list = rates.tolist()
+
+        scalar_time, scalar = best_time(
+            lambda: [grid_map.distance(a, b) for a, b in zip(origin_tuples, destination_tuples)], args.repeats
+        )
+        batch_time, batch = best_time(lambda: grid_map.distance_many(origins, destinations), args.repeats)
+        assert np.array_equal(scalar, batch)
+        report("distance", size, scalar_time, batch_time)
+
+        scalar_time, scalar = best_time(
+            lambda: [grid_map.estimated_time(a, b, r) for a, b, r in zip(origin_tuples, destination_tuples, rate_list)],
+            args.repeats
+        )
+        batch_time, batch = best_time(lambda: grid_map.estimated_time_many(origins, destinations, rates), args.repeats)
+        assert np.array_equal(scalar, batch)
+        report("estimated_time", size, scalar_time, batch_time)
+
+        if size <= MAX_PAIRWISE_SIZE:
+            scalar_time, scalar = best_time(
+                lambda: [[grid_map.distance(a, b) for b in origin_tuples] for a in origin_tuples], args.repeats
+            )
+            batch_time, batch = best_time(lambda: grid_map.pairwise_distance_matrix(origins), args.repeats)
+            assert np.array_equal(scalar, batch)
+            report("pairwise_distance_matrix", size, scalar_time, batch_time)
+
+
+if __name__ == "__main__":
+    main()
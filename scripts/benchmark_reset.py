@@ -0,0 +1,90 @@
+"""
+Benchmark da latência de FoodDeliveryGymEnv.reset.
+
+Para cada cenário, mede o tempo de resets consecutivos com sementes diferentes (média, mediana e p95) e a fração
+do tempo de episódios completos, com ações aleatórias, gasta no reset. Episódios curtos (ex.: simple.json) são os
+mais sensíveis ao custo do reset.
+
+Uso:
+    python -m scripts.benchmark_reset --scenarios simple complex_non_homogeneous --resets 200 --episodes 20
+"""
+from importlib.resources import files
+import argparse
+import time
+
+import numpy as np
+
+from food_delivery_gym.main.environment.env_mode import EnvMode
+from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
+from food_delivery_gym.main.scenarios.scenario import Scenario
+
+DEFAULT_SEED = 101010
+DEFAULT_SCENARIOS = ["simple", "medium", "complex", "complex_non_homogeneous"]
+DEFAULT_RESETS = 200
+DEFAULT_EPISODES = 20
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mede a latência do reset do ambiente.")
+    parser.add_argument("--scenarios", type=str, nargs="+", default=DEFAULT_SCENARIOS, help="Cenários (sem .json).")
+    parser.add_argument("--objective", type=int, default=1, choices=FoodDeliveryGymEnv.REWARD_OBJECTIVES)
+    parser.add_argument("--mode", choices=[m.name for m in EnvMode], default=EnvMode.TRAINING.name)
+    parser.add_argument("--resets", type=int, default=DEFAULT_RESETS, help="Resets consecutivos medidos.")
+    parser.add_argument("--episodes", type=int, default=DEFAULT_EPISODES, help="Episódios completos medidos.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    return parser.parse_args()
+
+
+def measure_resets(env, resets, seed):
+    latencies = np.empty(resets)
+    for i in range(resets):
+        start = time.perf_counter()
+        env.reset(seed=seed + i)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def measure_episodes(env, episodes, seed):
+    action_rng = np.random.default_rng(seed)
+    reset_time = 0.0
+    total_time = 0.0
+    total_steps = 0
+
+    for episode in range(episodes):
+        start = time.perf_counter()
+        env.reset(seed=seed + episode)
+        reset_time += time.perf_counter() - start
+
+        terminated = truncated = False
+        while not (terminated or truncated):
+            _, _, terminated, truncated, _ = env.step(int(action_rng.integers(env.num_drivers)))
+            total_steps += 1
+        total_time += time.perf_counter() - start
+
+    return reset_time, total_time, total_steps
+
+
+def main():
+    args = parse_args()
+
+    for scenario_name in args.scenarios:
+        scenario_path = str(files("food_delivery_gym.main.scenarios").joinpath(scenario_name + ".json"))
+
+        start = time.perf_counter()
+        env = FoodDeliveryGymEnv(scenario=Scenario.load(scenario_path), reward_objective=args.objective, mode=EnvMode[args.mode])
+        construction_time = time.perf_counter() - start
+
+        latencies = measure_resets(env, args.resets, args.seed)
+        reset_time, total_time, total_steps = measure_episodes(env, args.episodes, args.seed)
+
+        print(f"=== {scenario_name} ===")
+        print(f"Construção do ambiente:        {construction_time * 1e3:9.3f} ms")
+        print(f"Reset (média):                 {latencies.mean() * 1e3:9.3f} ms")
+        print(f"Reset (mediana):               {np.median(latencies) * 1e3:9.3f} ms")
+        print(f"Reset (p95):                   {np.percentile(latencies, 95) * 1e3:9.3f} ms")
+        print(f"Passos por episódio (média):   {total_steps / max(args.episodes, 1):9.1f}")
+        print(f"Fração do episódio no reset:   {reset_time / max(total_time, 1e-9) * 100:9.2f} %")
+
+
+if __name__ == "__main__":
+    main()
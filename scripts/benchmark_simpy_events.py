@@ -0,0 +1,87 @@
+"""
+Benchmark do número de eventos SimPy processados por passo do ambiente gymnasium.
+
+Conta quantos eventos o SimPy agenda (e, portanto, processa) entre duas decisões do agente,
+permitindo comparar o custo interno da simulação antes e depois de mudanças no modelo de
+processos (ex.: remoção de laços de polling).
+
+Uso:
+    python -m scripts.benchmark_simpy_events --scenario complex.json --episodes 3
+"""
+from importlib.resources import files
+import argparse
+import time
+
+import numpy as np
+
+from food_delivery_gym.main.environment.env_mode import EnvMode
+from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
+from food_delivery_gym.main.environment.food_delivery_simpy_env import FoodDeliverySimpyEnv
+
+DEFAULT_SEED = 101010
+DEFAULT_EPISODES = 3
+
+
+class _EventCounter:
+    """Conta os eventos agendados em qualquer FoodDeliverySimpyEnv do processo."""
+
+    def __init__(self):
+        self.count = 0
+        self._original_schedule = FoodDeliverySimpyEnv.schedule
+
+    def __enter__(self):
+        counter = self
+        original = self._original_schedule
+
+        def schedule(env, event, priority=1, delay=0):
+            counter.count += 1
+            return original(env, event, priority, delay)
+
+        FoodDeliverySimpyEnv.schedule = schedule
+        return self
+
+    def __exit__(self, *exc):
+        FoodDeliverySimpyEnv.schedule = self._original_schedule
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mede eventos SimPy processados por passo do ambiente.")
+    parser.add_argument("--scenario", type=str, default="complex.json", help="Arquivo de cenário JSON.")
+    parser.add_argument("--objective", type=int, default=1, choices=FoodDeliveryGymEnv.REWARD_OBJECTIVES)
+    parser.add_argument("--mode", choices=[m.name for m in EnvMode], default=EnvMode.TRAINING.name)
+    parser.add_argument("--episodes", type=int, default=DEFAULT_EPISODES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scenario_path = str(files("food_delivery_gym.main.scenarios").joinpath(args.scenario))
+    env = FoodDeliveryGymEnv(scenario_json_file_path=scenario_path, reward_objective=args.objective, mode=EnvMode[args.mode])
+    action_rng = np.random.default_rng(args.seed)
+
+    total_steps = 0
+    total_time = 0.0
+
+    with _EventCounter() as counter:
+        for episode in range(args.episodes):
+            env.reset(seed=args.seed + episode)
+            terminated = truncated = False
+
+            start = time.perf_counter()
+            while not (terminated or truncated):
+                action = int(action_rng.integers(env.num_drivers))
+                _, _, terminated, truncated, _ = env.step(action)
+                total_steps += 1
+            total_time += time.perf_counter() - start
+
+    print(f"Cenário:                    {args.scenario}")
+    print(f"Episódios:                  {args.episodes}")
+    print(f"Passos do gymnasium:        {total_steps}")
+    print(f"Eventos SimPy agendados:    {counter.count}")
+    print(f"Eventos SimPy por passo:    {counter.count / max(total_steps, 1):.2f}")
+    print(f"Passos por segundo:         {total_steps / max(total_time, 1e-9):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark do FoodDeliveryVecEnv e do FoodDeliverySubprocVecEnv contra o DummyVecEnv do Stable-Baselines3.
+
+Executa o mesmo número de passos com ações aleatórias nos ambientes vetorizados, com N simulações cada,
+e compara os passos por segundo (somados entre as N simulações). O FoodDeliverySubprocVecEnv usa até
+--num-workers processos (padrão: número de CPUs).
+
+Uso:
+    python -m scripts.benchmark_vec_env --scenario complex.json --num-envs 1 4 8 --steps 2000 --num-workers 8
+"""
+from importlib.resources import files
+import argparse
+import time
+
+import numpy as np
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from food_delivery_gym.main.environment.env_mode import EnvMode
+from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
+from food_delivery_gym.main.environment.food_delivery_subproc_vec_env import FoodDeliverySubprocVecEnv
+from food_delivery_gym.main.environment.food_delivery_vec_env import FoodDeliveryVecEnv
+
+DEFAULT_SEED = 101010
+DEFAULT_NUM_ENVS = [1, 4, 8]
+DEFAULT_STEPS = 2000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compara os passos por segundo do FoodDeliveryVecEnv e do DummyVecEnv.")
+    parser.add_argument("--scenario", type=str, default="complex.json", help="Arquivo de cenário JSON.")
+    parser.add_argument("--objective", type=int, default=1, choices=FoodDeliveryGymEnv.REWARD_OBJECTIVES)
+    parser.add_argument("--mode", choices=[m.name for m in EnvMode], default=EnvMode.TRAINING.name)
+    parser.add_argument("--num-envs", type=int, nargs="+", default=DEFAULT_NUM_ENVS)
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help="Passos do ambiente vetorizado por medição.")
+    parser.add_argument("--num-workers", type=int, default=None, help="Processos do FoodDeliverySubprocVecEnv.")
+    parser.add_argument("--flat-observation", action="store_true")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    return parser.parse_args()
+
+
+def steps_per_second(vec_env, steps, seed):
+    action_rng = np.random.default_rng(seed)
+    num_drivers = vec_env.get_attr("num_drivers", indices=0)[0]
+    vec_env.reset()
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        vec_env.step(action_rng.integers(num_drivers, size=vec_env.num_envs))
+    elapsed = time.perf_counter() - start
+
+    vec_env.close()
+    return steps * vec_env.num_envs / max(elapsed, 1e-9)
+
+
+def main():
+    args = parse_args()
+    scenario_path = str(files("food_delivery_gym.main.scenarios").joinpath(args.scenario))
+    env_kwargs = dict(
+        scenario_json_file_path=scenario_path,
+        reward_objective=args.objective,
+        mode=EnvMode[args.mode],
+        flat_observation=args.flat_observation,
+    )
+
+    print(f"Cenário: {args.scenario}   passos por medição: {args.steps}")
+    for num_envs in args.num_envs:
+        dummy_vec_env = DummyVecEnv([lambda: FoodDeliveryGymEnv(**env_kwargs) for _ in range(num_envs)])
+        dummy_vec_env.seed(args.seed)
+        dummy_rate = steps_per_second(dummy_vec_env, args.steps, args.seed)
+
+        native_rate = steps_per_second(FoodDeliveryVecEnv(num_envs, seed=args.seed, **env_kwargs), args.steps, args.seed)
+
+        subproc_vec_env = FoodDeliverySubprocVecEnv(num_envs, seed=args.seed, num_workers=args.num_workers, **env_kwargs)
+        num_workers = len(subproc_vec_env.processes)
+        subproc_rate = steps_per_second(subproc_vec_env, args.steps, args.seed)
+
+        print(f"N={num_envs:<3} DummyVecEnv: {dummy_rate:10.1f} passos/s   "
+              f"FoodDeliveryVecEnv: {native_rate:10.1f} passos/s ({native_rate / max(dummy_rate, 1e-9):5.2f}x)   "
+              f"FoodDeliverySubprocVecEnv[{num_workers} workers]: {subproc_rate:10.1f} passos/s "
+              f"({subproc_rate / max(dummy_rate, 1e-9):5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Verificação das funções de taxa compiladas para arrays.
+
+Para cada cenário com order_generator do tipo non_homogeneous_poisson, compila a rate_function nos dois modos de
+build_rate_function (escalar e vectorized=True) e compara os valores sobre a janela de tempo do cenário: a versão
+escalar é avaliada ponto a ponto e a vetorizada em uma única chamada sobre o array de instantes. Termina com código
+de saída 1 se algum cenário divergir além da tolerância.
+
+Uso:
+    python -m scripts.check_rate_functions --scenarios complex_non_homogeneous --points 20001
+"""
+from importlib.resources import files
+import argparse
+import sys
+
+import numpy as np
+
+from food_delivery_gym.main.scenarios.scenario import Scenario
+from food_delivery_gym.main.utils.rate_function_utils import build_rate_function
+
+DEFAULT_SCENARIOS = ["complex_non_homogeneous"]
+DEFAULT_POINTS = 20001
+DEFAULT_RTOL = 1e-12
+DEFAULT_ATOL = 1e-12
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compara as funções de taxa escalar e vetorizada dos cenários.")
+    parser.add_argument("--scenarios", type=str, nargs="+", default=DEFAULT_SCENARIOS, help="Cenários (sem .json).")
+    parser.add_argument("--points", type=int, default=DEFAULT_POINTS, help="Instantes avaliados na janela de tempo.")
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    parser.add_argument("--atol", type=float, default=DEFAULT_ATOL)
+    return parser.parse_args()
+
+
+def compare_rate_function(rate_function_code, time_window, points):
+    times = np.linspace(0, time_window, points)
+    scalar_function = build_rate_function(rate_function_code)
+    array_function = build_rate_function(rate_function_code, vectorized=True)
+
+    scalar_rates = np.fromiter((scalar_function(t) for t in times.tolist()), dtype=float, count=len(times))
+    array_rates = np.broadcast_to(np.asarray(array_function(times), dtype=float), times.shape)
+    return times, scalar_rates, array_rates
+
+
+def main():
+    args = parse_args()
+    failures = []
+
+    for scenario_name in args.scenarios:
+        scenario_path = str(files("food_delivery_gym.main.scenarios").joinpath(scenario_name + ".json"))
+        scenario = Scenario.load(scenario_path)
+
+        print(f"=== {scenario_name} ===")
+        if scenario.rate_function is None:
+            print("Sem rate_function, nada a comparar.")
+            continue
+
+        times, scalar_rates, array_rates = compare_rate_function(scenario.rate_function, scenario.time_window, args.points)
+        abs_diff = np.abs(array_rates - scalar_rates)
+        rel_diff = abs_diff / np.maximum(np.abs(scalar_rates), np.finfo(float).tiny)
+        worst = int(np.argmax(abs_diff))
+        matches = np.allclose(array_rates, scalar_rates, rtol=args.rtol, atol=args.atol)
+
+        print(f"rate_function:                 {scenario.rate_function}")
+        print(f"Instantes avaliados:           {len(times)} em [0, {scenario.time_window}]")
+        print(f"Maior diferença absoluta:      {abs_diff[worst]:.3e} (t={times[worst]:.4f})")
+        print(f"Maior diferença relativa:      {rel_diff.max():.3e}")
+        print(f"Resultado:                     {'OK' if matches else 'DIVERGENTE'}")
+        if not matches:
+            failures.append(scenario_name)
+
+    if failures:
+        print(f"Funções de taxa divergentes em: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
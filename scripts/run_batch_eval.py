@@ -16,6 +16,7 @@ from food_delivery_gym.main.optimizer.optimizer_gym.nearest_driver_optimizer_gym
 from food_delivery_gym.main.optimizer.optimizer_gym.random_driver_optimizer_gym import RandomDriverOptimizerGym
 from food_delivery_gym.main.optimizer.optimizer_gym.rl_model_optimizer_gym import RLModelOptimizerGym
 from food_delivery_gym.main.scenarios import get_all_scenarios, get_defaults_scenarios
+from food_delivery_gym.main.scenarios.scenario import Scenario
 
 ALL_SCENARIOS = get_all_scenarios()
 DEFAULT_SCENARIOS = get_defaults_scenarios()
@@ -224,10 +225,10 @@ def create_environment(reward_objective: int, scenario_name: str):
     scenario_file = scenario_name + ".json"
     scenario_path = str(files("food_delivery_gym.main.scenarios").joinpath(scenario_file))
 
-    # Atualiza o cache ANTES de instanciar — workers herdarão o dict via fork.
-    FoodDeliveryGymEnv.set_scenario(scenario_path)
- 
-    gym_env = FoodDeliveryGymEnv(reward_objective=reward_objective, mode=EnvMode.EVALUATING)
+    # O Scenario é lido uma única vez por arquivo e pertence à instância, sem alterar o cenário padrão da classe
+    scenario = Scenario.load(scenario_path)
+
+    gym_env = FoodDeliveryGymEnv(reward_objective=reward_objective, mode=EnvMode.EVALUATING, scenario=scenario)
     return gym_env
 
 
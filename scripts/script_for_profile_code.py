@@ -1,4 +1,5 @@
 from importlib.resources import files
+import time
 
 from food_delivery_gym.main.environment.food_delivery_gym_env import FoodDeliveryGymEnv
 from food_delivery_gym.main.environment.env_mode import EnvMode
@@ -13,11 +14,16 @@ def main():
     gym_env = FoodDeliveryGymEnv(scenario_json_file_path=scenario_path, reward_objective=1, mode=EnvMode.TRAINING)
  
     optimizer = RandomDriverOptimizerGym(gym_env)
-    optimizer.initialize(seed=SEED)
+    optimizer.reset_env(seed=SEED)
 
+    total_steps = 0
+    start = time.perf_counter()
     for i in range(200):
-        optimizer.run()
+        total_steps += optimizer.run()["steps"]
         optimizer.reset_env()
+    elapsed = time.perf_counter() - start
+
+    print(f"{total_steps} passos em {elapsed:.2f} s ({total_steps / elapsed:.1f} passos/s)")
 
 
 if __name__ == '__main__':